@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Compare the single-pass HTML pipeline with the previous regex-based extraction.
+
+Usage:
+    python benchmarks/bench_html_pipeline.py [--sizes 1 4 8] [--repeat 3]
+
+Sizes are page sizes in megabytes of generated article-style HTML.
+"""
+
+import re
+import sys
+import time
+import argparse
+from html import unescape
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from epollo.html_pipeline import process_page
+
+
+# --- Previous implementation, kept here for comparison -----------------------
+
+def legacy_extract_text_content(html):
+    html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.IGNORECASE | re.DOTALL)
+    html = re.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.IGNORECASE | re.DOTALL)
+    text = re.sub(r'<[^>]+>', ' ', html)
+    text = unescape(text)
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'\n\s*\n', '\n\n', text)
+    return text.strip()
+
+
+def legacy_extract_sections(html):
+    sections = []
+    headings = []
+    for match in re.finditer(r'<h([1-6])[^>]*>(.*?)</h[1-6]>', html, re.IGNORECASE | re.DOTALL):
+        title = unescape(re.sub(r'<[^>]+>', '', match.group(2)).strip())
+        headings.append({'title': title, 'start': match.start(), 'end': match.end()})
+    for i, heading in enumerate(headings):
+        end_pos = headings[i + 1]['start'] if i + 1 < len(headings) else len(html)
+        content_text = legacy_extract_text_content(html[heading['end']:end_pos])
+        paragraphs = [p.strip() for p in content_text.split('\n\n') if p.strip()]
+        content_preview = '\n\n'.join(paragraphs[:6])
+        if heading['title'] and content_preview:
+            sections.append({'title': heading['title'], 'content': content_preview})
+    return sections[:10]
+
+
+def legacy_remove_media(html):
+    flags = re.IGNORECASE | re.DOTALL
+    html = re.sub(r'<img[^>]*/?>', '', html, flags=re.IGNORECASE)
+    html = re.sub(r'<picture[^>]*>.*?</picture>', '', html, flags=flags)
+    html = re.sub(r'<video[^>]*>.*?</video>', '', html, flags=flags)
+    html = re.sub(r'<video[^>]*/?>', '', html, flags=re.IGNORECASE)
+    html = re.sub(r'<source[^>]*type=["\'](image|video)/[^"\']*["\'][^>]*>', '', html, flags=re.IGNORECASE)
+    html = re.sub(r'<source[^>]*/?>', '', html, flags=re.IGNORECASE)
+    html = re.sub(r'<iframe[^>]*>.*?</iframe>', '', html, flags=flags)
+    html = re.sub(r'<embed[^>]*/?>', '', html, flags=re.IGNORECASE)
+    html = re.sub(r'<object[^>]*>.*?</object>', '', html, flags=flags)
+    html = re.sub(r'<canvas[^>]*>.*?</canvas>', '', html, flags=flags)
+    html = re.sub(r'<canvas[^>]*/?>', '', html, flags=re.IGNORECASE)
+    html = re.sub(r'background-image\s*:\s*[^;]*url\([^)]*\)[^;]*;?', '', html, flags=re.IGNORECASE)
+    html = re.sub(r'background\s*:\s*[^;]*url\([^)]*\)[^;]*;?', '', html, flags=re.IGNORECASE)
+
+    def remove_bg_from_style(match):
+        style = match.group(1)
+        style = re.sub(r'background-image\s*:\s*[^;]*url\([^)]*\)[^;]*;?', '', style, flags=re.IGNORECASE)
+        style = re.sub(r'background\s*:\s*[^;]*url\([^)]*\)[^;]*;?', '', style, flags=re.IGNORECASE)
+        style = re.sub(r';+', ';', style).strip('; ')
+        return f'style="{style}"' if style else ''
+
+    return re.sub(r'style="([^"]*)"', remove_bg_from_style, html, flags=re.IGNORECASE)
+
+
+# --- Benchmark -----------------------------------------------------------------
+
+SECTION = """
+<section class="story" style="padding: 8px; background-image: url('/img/bg.png');">
+  <h2 class="title">Story number {n} &amp; its headline</h2>
+  <p>Lorem ipsum dolor sit amet, <a href="/story/{n}">consectetur</a> adipiscing elit. Sed do eiusmod
+  tempor incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam, quis nostrud.</p>
+  <picture><source srcset="/img/{n}.webp" type="image/webp"><img src="/img/{n}.jpg" alt="photo"></picture>
+  <p>Duis aute irure dolor in reprehenderit in voluptate velit esse cillum dolore eu fugiat nulla.</p>
+  <iframe src="https://www.youtube.com/embed/{n}"></iframe>
+  <script>window.dataLayer = window.dataLayer || []; dataLayer.push({{story: {n}}});</script>
+</section>
+"""
+
+
+def generate_page(size_mb):
+    target = int(size_mb * 1024 * 1024)
+    parts = ["<!DOCTYPE html><html><head><title>Benchmark</title>",
+             "<style>.hero { background: #000 url(/hero.png) no-repeat; }</style></head><body><main>"]
+    size = sum(len(part) for part in parts)
+    n = 0
+    while size < target:
+        section = SECTION.format(n=n)
+        parts.append(section)
+        size += len(section)
+        n += 1
+    parts.append("</main></body></html>")
+    return ''.join(parts)
+
+
+def legacy_all(html):
+    legacy_remove_media(html)
+    legacy_extract_sections(html)
+    legacy_extract_text_content(html)
+
+
+def pipeline_all(html):
+    process_page(html, strip_media=True)
+
+
+def best_of(fn, html, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(html)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=float, nargs='+', default=[1, 4, 8], help="Page sizes in MB")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    print(f"{'size':>8} {'legacy regex':>14} {'single pass':>14} {'speedup':>9}")
+    for size_mb in args.sizes:
+        html = generate_page(size_mb)
+        legacy = best_of(legacy_all, html, args.repeat)
+        pipeline = best_of(pipeline_all, html, args.repeat)
+        print(f"{size_mb:>6.1f}MB {legacy:>13.3f}s {pipeline:>13.3f}s {legacy / pipeline:>8.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""Background asyncio event loop for driving async code from synchronous callers."""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundLoop:
+    """Event loop running forever on a daemon thread.
+
+    Long-lived async resources (browsers, HTTP clients) are bound to the loop
+    that created them, so they live here and synchronous callers on any
+    thread submit coroutines to it instead of calling asyncio.run().
+    """
+
+    def __init__(self, name: str = "epollo-loop"):
+        """Start the loop thread.
+
+        Args:
+            name: Thread name, shown in logs and debuggers
+        """
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        """Thread body: run the loop until stop() is called."""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro: Coroutine) -> Future:
+        """Schedule a coroutine on the loop.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            concurrent.futures.Future resolving to the coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the loop and block until it finishes.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Optional timeout in seconds
+
+        Returns:
+            The coroutine's result
+        """
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("BackgroundLoop.run() called from its own loop thread")
+        return self.submit(coro).result(timeout)
+
+    def stop(self):
+        """Stop the loop and wait for its thread to exit."""
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=5)
@@ -1,21 +1,65 @@
 """Main browser window implementation."""
 
 import webview
+import asyncio
 import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urlparse, urljoin
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict, Tuple, Iterable, AsyncIterator
 import logging
-import re
-from html.parser import HTMLParser
-from html import unescape
-import ollama
+import json
+import secrets
 from .config import Config
-from .content_filter import ContentFilter
+from .content_filter import ContentFilter, FilterDecisionCache
+from .html_blocks import extract_blocks, annotate_blocks, remove_blocks
+from .html_pipeline import extract_text, extract_sections, strip_media
+from .page_server import PageServer
+from .navigation import NavigationController, NavigationHistory, CancelToken, NavigationCancelled
+from .page_cache import PageCache
+from .prefetch import Prefetcher, STAGE_RAW, STAGE_PARTIAL, STAGE_PROCESSED
+from . import llm
+from .llm_scheduler import get_scheduler
+from .model_manager import get_model_manager
+from .ollama_client import get_ollama_client
+from .fetcher import get_fetcher, fetch_many, BatchFetchResult
 from .screenshot import render_html_to_screenshot_sync, render_url_to_screenshot_sync
 
 logger = logging.getLogger(__name__)
 
+# Answer budget reserved per section when sizing a batched summary prompt
+_BATCHED_SUMMARY_TOKENS_PER_SECTION = 120
+
+# Target origin for messages from a displayed page to the browser UI. The UI's
+# origin arrives in the frame URL; it is opaque ('null') when the UI was loaded
+# from a string, and '*' is the only target postMessage accepts then.
+_PARENT_ORIGIN_JS = """
+window.epolloParentOrigin = window.epolloParentOrigin || (function() {
+    var origin = new URLSearchParams(location.search).get('parent');
+    return origin && origin !== 'null' ? origin : '*';
+})();
+"""
+
+# Added to every displayed page: plain left clicks on links are handed to the
+# browser UI instead of navigating the frame directly
+_LINK_INTERCEPTOR = """
+<script>""" + _PARENT_ORIGIN_JS + """
+document.addEventListener('click', function(event) {
+    var link = event.target.closest ? event.target.closest('a[href]') : null;
+    if (!link || event.defaultPrevented || event.button !== 0 ||
+            event.metaKey || event.ctrlKey || event.shiftKey || event.altKey) {
+        return;
+    }
+    if ((link.target && link.target !== '_self') || link.getAttribute('href').charAt(0) === '#' ||
+            !/^https?:/.test(link.href)) {
+        return;
+    }
+    event.preventDefault();
+    parent.postMessage({type: 'epollo-navigate', url: link.href}, window.epolloParentOrigin);
+});
+</script>
+"""
+
 
 class BrowserAPI:
     """API class for JavaScript to call Python methods."""
@@ -37,6 +81,14 @@ class BrowserAPI:
         """
         self._browser.navigate(url, use_filter)
     
+    def go_back(self) -> bool:
+        """Go to the previous page - called from JavaScript."""
+        return self._browser.go_back()
+    
+    def go_forward(self) -> bool:
+        """Go to the next page - called from JavaScript."""
+        return self._browser.go_forward()
+    
     def take_screenshot(self, filename: str = "screenshot.png", width: int = 1200, height: int = 800):
         """Take a screenshot of the current page - called from JavaScript.
         
@@ -72,12 +124,53 @@ class Browser:
         self.window = None
         self.current_url = ""
         self._html_content = None
+        self.fetcher = get_fetcher(self.config)
+        self.page_server = PageServer()
+        self.navigation = NavigationController()
+        self.history = NavigationHistory()
+        self.page_cache = PageCache(max_bytes=self.config.page_cache_max_bytes)
+        self.prefetcher = None
+        if self.config.prefetch_enabled:
+            self.prefetcher = Prefetcher(
+                fetch=self._fetch_page,
+                process=self._prefetch_process,
+                max_links=self.config.prefetch_max_links,
+                max_age=self.config.prefetch_max_age,
+                max_bytes=self.config.prefetch_cache_max_bytes
+            )
+        self._summary_client = get_ollama_client(self.config.ollama_api_url)
+        # Every Ollama request in the process shares one scheduler
+        get_scheduler().configure(
+            max_concurrent=self.config.llm_max_concurrent,
+            reserved_interactive=self.config.llm_reserved_interactive,
+            max_wait=self.config.llm_max_wait
+        )
+        # Load the page model while the window opens so the first page does
+        # not wait for the weights
+        model_manager = get_model_manager()
+        model_manager.configure(
+            default_keep_alive=self.config.models_keep_alive,
+            keep_alive=self.config.models_keep_alive_per_model
+        )
+        if self.config.models_preload:
+            model_manager.preload([self.config.ollama_model])
         
         # Initialize content filter only if filtering is enabled and topics are configured
         if self.filtering_enabled and self.config.topics:
+            decision_cache = None
+            if self.config.filter_cache_enabled:
+                decision_cache = FilterDecisionCache(
+                    self.config.filter_cache_path,
+                    max_entries=self.config.filter_cache_max_entries,
+                    ttl=self.config.filter_cache_ttl
+                )
             self.content_filter = ContentFilter(
                 model=self.config.ollama_model,
-                api_url=self.config.ollama_api_url
+                api_url=self.config.ollama_api_url,
+                mode=self.config.filtering_mode,
+                block_batch_size=self.config.filtering_block_batch_size,
+                max_block_chars=self.config.filtering_max_block_chars,
+                decision_cache=decision_cache
             )
             # Check Ollama availability
             if not self.content_filter.check_ollama_available():
@@ -154,6 +247,19 @@ class Browser:
             background: #333;
             color: #fff;
         }
+        .nav-btn {
+            padding: 12px 14px;
+            border: 2px solid #333;
+            background: #fff;
+            cursor: pointer;
+            font-family: 'Courier New', Courier, monospace;
+            font-size: 14px;
+            font-weight: bold;
+            transition: all 0.2s ease;
+        }
+        .nav-btn:hover {
+            background: #f0f0f0;
+        }
         #screenshot-btn {
             padding: 12px 20px;
             border: 2px solid #333;
@@ -211,6 +317,8 @@ class Browser:
 </head>
 <body>
     <div class="toolbar">
+        <button id="back-btn" class="nav-btn" title="BACK">&lt;</button>
+        <button id="forward-btn" class="nav-btn" title="FORWARD">&gt;</button>
         <input type="text" id="url-input" placeholder="ENTER URL..." />
         <button id="filter-toggle">FILTER: OFF</button>
         <button id="screenshot-btn">SCREENSHOT</button>
@@ -236,6 +344,14 @@ class Browser:
             }
         });
         
+        // Back/forward handling; processed pages come from the page cache
+        document.getElementById('back-btn').addEventListener('click', function() {
+            window.pywebview.api.go_back();
+        });
+        document.getElementById('forward-btn').addEventListener('click', function() {
+            window.pywebview.api.go_forward();
+        });
+        
         // Filter toggle handling
         filterToggle.addEventListener('click', function() {
             const isActive = filterToggle.classList.contains('active');
@@ -264,6 +380,47 @@ class Browser:
             urlInput.value = url;
         };
         
+        // Block patches from progressive filtering: the full list of hidden
+        // blocks is resent whenever it grows and when the page reports ready,
+        // so patches sent before the frame loaded are not lost
+        let patchedPage = null;
+        let hiddenBlocks = [];
+        function postHiddenBlocks() {
+            if (patchedPage && contentFrame.contentWindow) {
+                contentFrame.contentWindow.postMessage({type: 'epollo-hide', page: patchedPage, blocks: hiddenBlocks}, '*');
+            }
+        }
+        window.resetHiddenBlocks = function(pageId) {
+            patchedPage = pageId;
+            hiddenBlocks = [];
+        };
+        window.hideBlocks = function(pageId, ids) {
+            if (pageId !== patchedPage) {
+                return;
+            }
+            hiddenBlocks = hiddenBlocks.concat(ids);
+            postHiddenBlocks();
+        };
+        // Only the content frame's own document may talk to the UI; frames
+        // nested in it and other windows are ignored
+        function fromContentFrame(e) {
+            return e.source === contentFrame.contentWindow && e.data;
+        }
+        window.addEventListener('message', function(e) {
+            if (fromContentFrame(e) && e.data.type === 'epollo-ready' && e.data.page === patchedPage) {
+                postHiddenBlocks();
+            }
+        });
+        
+        // Links clicked inside the page are loaded through the browser
+        window.addEventListener('message', function(e) {
+            if (fromContentFrame(e) && e.data.type === 'epollo-navigate') {
+                urlInput.value = e.data.url;
+                status.textContent = 'LOADING...';
+                window.pywebview.api.navigate(e.data.url, filterToggle.classList.contains('active'));
+            }
+        });
+        
         // Screenshot button handling
         screenshotBtn.addEventListener('click', function() {
             const timestamp = new Date().toISOString().replace(/[:.]/g, '-').slice(0, -5);
@@ -287,60 +444,69 @@ class Browser:
 </html>
 """
     
-    def _fetch_url(self, url: str) -> tuple[str, str]:
-        """Fetch content from URL.
+    def _fetch_page(self, url: str) -> Tuple[str, str]:
+        """Fetch content from URL, raising on failure.
         
         Args:
             url: URL to fetch
             
         Returns:
             Tuple of (html_content, final_url after redirects)
+            
+        Raises:
+            ValueError: If the URL is invalid or the page is too large
+            requests.exceptions.RequestException: If the request fails
         """
+        # Validate and normalize URL
+        if not url or not url.strip():
+            raise ValueError("URL cannot be empty")
+        
+        # Ensure URL has a scheme
+        original_url = url
+        if not url.startswith(('http://', 'https://')):
+            url = 'https://' + url
+        
+        # Basic URL validation
         try:
-            # Validate and normalize URL
-            if not url or not url.strip():
-                raise ValueError("URL cannot be empty")
-            
-            # Ensure URL has a scheme
-            original_url = url
-            if not url.startswith(('http://', 'https://')):
-                url = 'https://' + url
-            
-            # Basic URL validation
-            try:
-                parsed = urlparse(url)
-                if not parsed.netloc:
-                    raise ValueError(f"Invalid URL: {original_url}")
-            except Exception as e:
-                raise ValueError(f"Invalid URL format: {original_url}")
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-            }
-            
-            response = requests.get(url, headers=headers, timeout=30, allow_redirects=True, stream=False)
-            response.raise_for_status()
-            
-            # Get final URL after redirects
-            final_url = response.url
-            
-            # Check content size to avoid loading huge files
-            content_length = response.headers.get('Content-Length')
-            if content_length and int(content_length) > 10 * 1024 * 1024:  # 10MB limit
-                raise ValueError(f"Content too large ({int(content_length) / 1024 / 1024:.1f}MB). Maximum 10MB supported.")
+            parsed = urlparse(url)
+            if not parsed.netloc:
+                raise ValueError(f"Invalid URL: {original_url}")
+        except Exception as e:
+            raise ValueError(f"Invalid URL format: {original_url}")
+        
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+        }
+        
+        # Body is streamed and size-limited by the fetcher (raises ValueError when too large)
+        response = self.fetcher.fetch(url, headers=headers, timeout=30)
+        
+        # Get final URL after redirects
+        final_url = response.url
+        
+        # Try to get HTML content
+        content_type = response.headers.get('Content-Type', '').lower()
+        if 'html' in content_type or not content_type:
+            return response.text, final_url
+        else:
+            # If not HTML, wrap it in HTML
+            return f'<html><body><pre>{response.text}</pre></body></html>', final_url
+    
+    def _fetch_url(self, url: str) -> tuple[str, str]:
+        """Fetch content from URL, rendering failures as error pages.
+        
+        Args:
+            url: URL to fetch
             
-            # Try to get HTML content
-            content_type = response.headers.get('Content-Type', '').lower()
-            if 'html' in content_type or not content_type:
-                return response.text, final_url
-            else:
-                # If not HTML, wrap it in HTML
-                return f'<html><body><pre>{response.text}</pre></body></html>', final_url
-                
+        Returns:
+            Tuple of (html_content, final_url after redirects)
+        """
+        try:
+            return self._fetch_page(url)
         except requests.exceptions.Timeout:
             error_msg = f"Request timed out while loading {url}"
             logger.error(error_msg)
@@ -581,6 +747,43 @@ class Browser:
             """
             return error_html, url
     
+    async def fetch_urls(self, urls: Iterable[str]) -> AsyncIterator[BatchFetchResult]:
+        """Fetch a list of URLs concurrently.
+        
+        Each URL goes through _fetch_page, so results share its connection
+        pools and HTTP cache, and a failed page is a result with an error
+        rather than an error page. Results are yielded as soon as each page
+        arrives, so total time follows the slowest site.
+        
+        Args:
+            urls: URLs to fetch
+            
+        Yields:
+            BatchFetchResult whose value is (html_content, final_url)
+        """
+        async for result in fetch_many(
+            urls,
+            self._fetch_page,
+            max_concurrency=self.config.http_max_concurrency,
+            per_host_limit=self.config.http_per_host_concurrency,
+            timeout=self.config.http_batch_timeout
+        ):
+            yield result
+    
+    def fetch_urls_sync(self, urls: Iterable[str]) -> List[BatchFetchResult]:
+        """Synchronous wrapper for fetch_urls.
+        
+        Args:
+            urls: URLs to fetch
+            
+        Returns:
+            List of BatchFetchResult in completion order
+        """
+        async def _collect():
+            return [result async for result in self.fetch_urls(urls)]
+        
+        return asyncio.run(_collect())
+    
     def _extract_text_content(self, html: str) -> str:
         """Extract plain text content from HTML.
         
@@ -590,21 +793,7 @@ class Browser:
         Returns:
             Plain text content
         """
-        # Remove scripts and styles
-        html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.IGNORECASE | re.DOTALL)
-        html = re.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.IGNORECASE | re.DOTALL)
-        
-        # Remove HTML tags
-        text = re.sub(r'<[^>]+>', ' ', html)
-        
-        # Decode HTML entities
-        text = unescape(text)
-        
-        # Clean up whitespace
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'\n\s*\n', '\n\n', text)
-        
-        return text.strip()
+        return extract_text(html)
     
     def _extract_sections(self, html: str) -> List[Dict[str, str]]:
         """Extract sections from HTML (heading + content).
@@ -615,90 +804,15 @@ class Browser:
         Returns:
             List of dictionaries with 'title' and 'content' keys
         """
-        sections = []
-        
-        # Find all headings (h1-h6) and their following content
-        # Pattern: heading tag followed by content until next heading
-        pattern = r'<h([1-6])[^>]*>(.*?)</h[1-6]>'
-        
-        # Extract headings with their positions
-        headings = []
-        for match in re.finditer(pattern, html, re.IGNORECASE | re.DOTALL):
-            level = int(match.group(1))
-            title = re.sub(r'<[^>]+>', '', match.group(2)).strip()
-            title = unescape(title)
-            headings.append({
-                'level': level,
-                'title': title,
-                'start': match.start(),
-                'end': match.end()
-            })
-        
-        # Extract content between headings
-        for i, heading in enumerate(headings):
-            # Determine end position (start of next heading or end of document)
-            if i + 1 < len(headings):
-                end_pos = headings[i + 1]['start']
-            else:
-                end_pos = len(html)
-            
-            # Extract content between heading end and next heading
-            content_html = html[heading['end']:end_pos]
-            
-            # Extract text content
-            content_text = self._extract_text_content(content_html)
-            
-            # Limit content length (we'll take first few paragraphs)
-            paragraphs = [p.strip() for p in content_text.split('\n\n') if p.strip()]
-            # Take up to 6 lines/paragraphs
-            content_preview = '\n\n'.join(paragraphs[:6])
-            
-            if heading['title'] and content_preview:
-                sections.append({
-                    'title': heading['title'],
-                    'content': content_preview
-                })
-        
-        # If no headings found, try to extract from article/main content
-        if not sections:
-            # Try to find article or main tag
-            article_match = re.search(r'<article[^>]*>(.*?)</article>', html, re.IGNORECASE | re.DOTALL)
-            main_match = re.search(r'<main[^>]*>(.*?)</main>', html, re.IGNORECASE | re.DOTALL)
-            
-            content_html = ''
-            if article_match:
-                content_html = article_match.group(1)
-            elif main_match:
-                content_html = main_match.group(1)
-            else:
-                # Fallback to body
-                body_match = re.search(r'<body[^>]*>(.*?)</body>', html, re.IGNORECASE | re.DOTALL)
-                if body_match:
-                    content_html = body_match.group(1)
-            
-            if content_html:
-                content_text = self._extract_text_content(content_html)
-                paragraphs = [p.strip() for p in content_text.split('\n\n') if p.strip() and len(p.strip()) > 50]
-                
-                # Create sections from paragraphs (group them)
-                for i in range(0, min(len(paragraphs), 5), 2):
-                    title = paragraphs[i][:100] + "..." if len(paragraphs[i]) > 100 else paragraphs[i]
-                    content = '\n\n'.join(paragraphs[i:i+6])
-                    if content:
-                        sections.append({
-                            'title': title,
-                            'content': content
-                        })
-        
-        # Limit to reasonable number of sections
-        return sections[:10]
+        return extract_sections(html)
     
-    def _generate_summary_bullets(self, title: str, content: str) -> str:
+    def _generate_summary_bullets(self, title: str, content: str, cancel_token: Optional[CancelToken] = None) -> str:
         """Generate summary bullets using Ollama.
         
         Args:
             title: Section title
             content: Section content
+            cancel_token: Token whose cancellation abandons the request
             
         Returns:
             Bullet points summary
@@ -713,27 +827,45 @@ Content:
 Provide only the bullet points, one per line, starting with "- ". Do not include the title or any other text."""
 
         try:
-            response = ollama.generate(
+            response = llm.generate(
                 model=self.config.ollama_model,
-                prompt=prompt
+                prompt=prompt,
+                client=self._summary_client,
+                cancel_token=cancel_token,
+                source="summary",
+                # Bounds each section summary, so one slow section is
+                # skipped instead of stalling the whole summary view
+                timeout=self.config.summary_section_timeout
             )
             
             if response and 'response' in response:
-                bullets = response['response'].strip()
-                # Clean up - ensure each line starts with -
-                lines = [line.strip() for line in bullets.split('\n') if line.strip()]
-                cleaned_bullets = []
-                for line in lines:
-                    if line.startswith('-') or line.startswith('•') or line.startswith('*'):
-                        cleaned_bullets.append(line)
-                    else:
-                        cleaned_bullets.append(f"- {line}")
-                return '\n'.join(cleaned_bullets[:5])  # Limit to 5 bullets
+                return self._clean_bullets(response['response'].strip().split('\n'))
             return ""
+        except NavigationCancelled:
+            raise
         except Exception as e:
             logger.error(f"Error generating summary: {e}")
             return ""
     
+    def _clean_bullets(self, lines: Iterable[str]) -> str:
+        """Normalize LLM output lines into at most 5 "- " bullet points.
+        
+        Args:
+            lines: Raw bullet lines
+            
+        Returns:
+            Bullet points, one per line
+        """
+        # Clean up - ensure each line starts with -
+        lines = [line.strip() for line in lines if line.strip()]
+        cleaned_bullets = []
+        for line in lines:
+            if line.startswith('-') or line.startswith('•') or line.startswith('*'):
+                cleaned_bullets.append(line)
+            else:
+                cleaned_bullets.append(f"- {line}")
+        return '\n'.join(cleaned_bullets[:5])  # Limit to 5 bullets
+    
     def _create_summary_html(self, sections: List[Dict[str, str]], url: str) -> str:
         """Create minimalistic HTML page with summaries.
         
@@ -877,12 +1009,144 @@ Provide only the bullet points, one per line, starting with "- ". Do not include
                    .replace('"', '&quot;')
                    .replace("'", '&#x27;'))
     
-    def _create_summary_view(self, html: str, url: str) -> str:
+    def _summarize_sections_parallel(
+        self,
+        sections: List[Dict[str, str]],
+        done: int = 0,
+        total: Optional[int] = None,
+        cancel_token: Optional[CancelToken] = None,
+        show_progress: bool = True
+    ):
+        """Summarize sections with one concurrent LLM call each.
+        
+        Args:
+            sections: Sections to summarize; a 'summary' key is set on each
+            done: Sections already summarized, for progress reporting
+            total: Total sections on the page, for progress reporting
+            cancel_token: Token whose cancellation abandons all section requests
+            show_progress: Whether to report progress in the status bar
+        """
+        total = total or len(sections)
+        # Summaries are independent, so run as many at once as Ollama serves in
+        # parallel; each request is bounded by the client timeout
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.config.summary_max_parallel, len(sections)),
+            thread_name_prefix="epollo-summary"
+        )
+        try:
+            futures = {
+                executor.submit(
+                    self._generate_summary_bullets, section['title'], section['content'], cancel_token
+                ): section
+                for section in sections
+            }
+            for completed, future in enumerate(as_completed(futures), start=done + 1):
+                section = futures[future]
+                try:
+                    section['summary'] = future.result()
+                except NavigationCancelled:
+                    raise
+                except Exception as e:
+                    logger.error(f"Error generating summary for section '{section['title']}': {e}")
+                    section['summary'] = ""
+                # Update progress
+                progress = int(completed / total * 100)
+                if self.window and show_progress:
+                    self.window.evaluate_js(f"window.updateStatus('Generating summaries... {progress}%')")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _summarize_sections_batched(
+        self,
+        sections: List[Dict[str, str]],
+        cancel_token: Optional[CancelToken] = None,
+        show_progress: bool = True
+    ) -> List[Dict[str, str]]:
+        """Summarize all sections with a single JSON-in, JSON-out LLM call.
+        
+        Args:
+            sections: Sections to summarize; a 'summary' key is set on each one answered
+            cancel_token: Token whose cancellation abandons the request
+            show_progress: Whether to report progress in the status bar
+            
+        Returns:
+            Sections still needing a summary: all of them if the combined prompt
+            would not fit the model's context window or the call failed, otherwise
+            those the model left out of its answer
+        """
+        payload = [
+            {'id': i, 'title': section['title'], 'content': section['content'][:2000]}
+            for i, section in enumerate(sections)
+        ]
+        prompt = f"""Summarize each content section below in 3-5 concise bullet points.
+
+Sections (JSON):
+{json.dumps(payload, ensure_ascii=False)}
+
+Answer with a JSON object mapping each section id to a list of bullet strings, for example:
+{{"0": ["first point", "second point"], "1": ["first point"]}}
+Include every section id. Do not include titles or any other text."""
+
+        # Rough token estimate: ~4 characters per token, plus room for the answer
+        estimated_tokens = len(prompt) // 4 + len(sections) * _BATCHED_SUMMARY_TOKENS_PER_SECTION
+        context_tokens = self.config.summary_context_tokens
+        if estimated_tokens > context_tokens:
+            logger.info(
+                f"Batched summary prompt (~{estimated_tokens} tokens) exceeds context window "
+                f"({context_tokens}), summarizing sections individually"
+            )
+            return sections
+        
+        try:
+            response = llm.generate(
+                model=self.config.ollama_model,
+                prompt=prompt,
+                client=self._summary_client,
+                cancel_token=cancel_token,
+                source="summary",
+                # One answer covers every section, so it gets each section's time
+                timeout=self.config.summary_section_timeout * len(sections),
+                format='json',
+                options={'num_ctx': context_tokens}
+            )
+            answer = json.loads(response['response'])
+        except NavigationCancelled:
+            raise
+        except Exception as e:
+            logger.error(f"Batched summary failed, summarizing sections individually: {e}")
+            return sections
+        
+        pending = []
+        for i, section in enumerate(sections):
+            bullets = answer.get(str(i)) if isinstance(answer, dict) else None
+            if isinstance(bullets, str):
+                bullets = bullets.split('\n')
+            if not isinstance(bullets, list) or not bullets:
+                pending.append(section)
+                continue
+            section['summary'] = self._clean_bullets(str(bullet) for bullet in bullets)
+        
+        if pending:
+            logger.info(f"Batched summary missed {len(pending)} of {len(sections)} sections")
+        if self.window and show_progress:
+            progress = int((len(sections) - len(pending)) / len(sections) * 100)
+            self.window.evaluate_js(f"window.updateStatus('Generating summaries... {progress}%')")
+        return pending
+    
+    def _create_summary_view(
+        self,
+        html: str,
+        url: str,
+        cancel_token: Optional[CancelToken] = None,
+        show_progress: bool = True
+    ) -> str:
         """Create summary view from HTML content.
         
         Args:
             html: Original HTML content
             url: Source URL
+            cancel_token: Token whose cancellation abandons summarization
+            show_progress: Whether to report progress in the status bar
             
         Returns:
             Summary HTML page
@@ -940,20 +1204,17 @@ Provide only the bullet points, one per line, starting with "- ". Do not include
 </html>"""
         
         # Generate summaries for each section
-        if self.window:
+        if self.window and show_progress:
             self.window.evaluate_js("window.updateStatus('Generating summaries...')")
         
-        for i, section in enumerate(sections):
-            try:
-                summary = self._generate_summary_bullets(section['title'], section['content'])
-                section['summary'] = summary
-                # Update progress
-                progress = int((i + 1) / len(sections) * 100)
-                if self.window:
-                    self.window.evaluate_js(f"window.updateStatus('Generating summaries... {progress}%')")
-            except Exception as e:
-                logger.error(f"Error generating summary for section {i}: {e}")
-                section['summary'] = ""
+        pending = sections
+        if self.config.summary_mode == "batched":
+            pending = self._summarize_sections_batched(sections, cancel_token, show_progress)
+        if pending:
+            self._summarize_sections_parallel(
+                pending, done=len(sections) - len(pending), total=len(sections),
+                cancel_token=cancel_token, show_progress=show_progress
+            )
         
         # Create summary HTML
         return self._create_summary_html(sections, url)
@@ -967,53 +1228,12 @@ Provide only the bullet points, one per line, starting with "- ". Do not include
         Returns:
             HTML with images and videos removed, plus CSS/JS to prevent dynamic loading
         """
-        # Remove <img> tags (including self-closing and with attributes)
-        html = re.sub(r'<img[^>]*/?>', '', html, flags=re.IGNORECASE)
-        
-        # Remove <picture> elements and their contents
-        html = re.sub(r'<picture[^>]*>.*?</picture>', '', html, flags=re.IGNORECASE | re.DOTALL)
-        
-        # Remove <video> elements (both with content and self-closing)
-        html = re.sub(r'<video[^>]*>.*?</video>', '', html, flags=re.IGNORECASE | re.DOTALL)
-        html = re.sub(r'<video[^>]*/?>', '', html, flags=re.IGNORECASE)
-        
-        # Remove <source> tags that are used for images or videos
-        html = re.sub(r'<source[^>]*type=["\'](image|video)/[^"\']*["\'][^>]*>', '', html, flags=re.IGNORECASE)
-        # Also remove source tags without explicit type if they're inside video/picture context
-        # (we'll handle this more carefully - remove all source tags to be safe)
-        html = re.sub(r'<source[^>]*/?>', '', html, flags=re.IGNORECASE)
-        
-        # Remove <iframe> tags (often used for embedded videos like YouTube, Vimeo)
-        html = re.sub(r'<iframe[^>]*>.*?</iframe>', '', html, flags=re.IGNORECASE | re.DOTALL)
-        
-        # Remove <embed> tags (often used for videos)
-        html = re.sub(r'<embed[^>]*/?>', '', html, flags=re.IGNORECASE)
-        
-        # Remove <object> tags (can contain videos)
-        html = re.sub(r'<object[^>]*>.*?</object>', '', html, flags=re.IGNORECASE | re.DOTALL)
-        
-        # Remove <canvas> elements that might contain video frames
-        html = re.sub(r'<canvas[^>]*>.*?</canvas>', '', html, flags=re.IGNORECASE | re.DOTALL)
-        html = re.sub(r'<canvas[^>]*/?>', '', html, flags=re.IGNORECASE)
-        
-        # Remove background images from inline styles
-        html = re.sub(r'background-image\s*:\s*[^;]*url\([^)]*\)[^;]*;?', '', html, flags=re.IGNORECASE)
-        html = re.sub(r'background\s*:\s*[^;]*url\([^)]*\)[^;]*;?', '', html, flags=re.IGNORECASE)
-        
-        # Remove background-image from style attributes
-        def remove_bg_from_style(match):
-            style = match.group(1)
-            # Remove background-image and background properties
-            style = re.sub(r'background-image\s*:\s*[^;]*url\([^)]*\)[^;]*;?', '', style, flags=re.IGNORECASE)
-            style = re.sub(r'background\s*:\s*[^;]*url\([^)]*\)[^;]*;?', '', style, flags=re.IGNORECASE)
-            # Clean up multiple semicolons and trailing semicolons
-            style = re.sub(r';+', ';', style).strip('; ')
-            return f'style="{style}"' if style else ''
-        
-        html = re.sub(r'style="([^"]*)"', remove_bg_from_style, html, flags=re.IGNORECASE)
+        # Strip media elements and background images in one pass; the parser
+        # also reports where the blocker CSS and JS belong
+        page = strip_media(html)
+        html = page.html
         
         # Inject CSS and JavaScript to prevent videos from playing and hide them
-        # Find the head tag or create one, and inject CSS
         css_block = """
         <style id="epollo-media-blocker">
             video, img, picture, iframe[src*="youtube"], iframe[src*="vimeo"], 
@@ -1027,17 +1247,6 @@ Provide only the bullet points, one per line, starting with "- ". Do not include
         </style>
         """
         
-        # Inject CSS into head or before </body>
-        if '<head>' in html.lower():
-            html = re.sub(r'(<head[^>]*>)', r'\1' + css_block, html, flags=re.IGNORECASE)
-        elif '</head>' in html.lower():
-            html = re.sub(r'(</head>)', css_block + r'\1', html, flags=re.IGNORECASE)
-        else:
-            # No head tag, add before body or at start
-            if '<body' in html.lower():
-                html = re.sub(r'(<body[^>]*>)', css_block + r'\1', html, flags=re.IGNORECASE)
-            else:
-                html = css_block + html
         
         # Inject JavaScript to remove dynamically added videos
         js_block = """
@@ -1085,65 +1294,304 @@ Provide only the bullet points, one per line, starting with "- ". Do not include
         </script>
         """
         
-        # Inject JavaScript before </body> or at end
-        if '</body>' in html.lower():
-            html = re.sub(r'(</body>)', js_block + r'\1', html, flags=re.IGNORECASE)
+        # Inject CSS into head (or before body) and JavaScript before </body> or at end
+        body_end = page.body_end_offset if page.body_end_offset is not None else len(html)
+        return ''.join([
+            html[:page.head_offset],
+            css_block,
+            html[page.head_offset:body_end],
+            js_block,
+            html[body_end:]
+        ])
+    
+    def _show_page(self, html: str, final_url: str):
+        """Show a document in the content frame and its URL in the URL bar.
+        
+        Args:
+            html: Document to show
+            final_url: URL of the page the document came from
+        """
+        # Escape quotes for JavaScript
+        def js_escape(text):
+            return text.replace('\\', '\\\\').replace("'", "\\'").replace('\n', '\\n').replace('\r', '')
+        
+        self.window.evaluate_js(f"window.updateUrl('{js_escape(final_url)}')")
+        
+        # Serve content to the iframe from the loopback server; only the
+        # short page URL crosses the JS bridge. Link clicks are routed back
+        # through navigate() so they use history, caches and prefetching.
+        page_url = self.page_server.publish(self._inject_before_body_end(html, _LINK_INTERCEPTOR), base_href=final_url)
+        self.window.evaluate_js(f"""
+            const frame = document.getElementById('content-frame');
+            frame.src = '{js_escape(page_url)}?parent=' + encodeURIComponent(window.location.origin);
+        """)
+    
+    def _filter_progressively(
+        self,
+        html: str,
+        final_url: str,
+        cancel_token: Optional[CancelToken] = None
+    ) -> Tuple[str, bool]:
+        """Show a page immediately, then hide dropped blocks as they are labelled.
+        
+        Blocks are tagged with their index and the page gets a small listener
+        script; verdicts are applied in place through postMessage patches
+        rather than by reloading the frame.
+        
+        Args:
+            html: Page HTML (media already removed if configured)
+            final_url: URL of the page
+            cancel_token: Token whose cancellation abandons filtering
+            
+        Returns:
+            Tuple of (HTML with all dropped blocks removed, whether every block was labelled)
+        """
+        def check_current():
+            # A newer navigation owns the frame and status bar from here on
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+        
+        def run_js(script: str):
+            check_current()
+            self.window.evaluate_js(script)
+        
+        blocks = extract_blocks(html, max_chars=self.content_filter.max_block_chars)
+        if not blocks:
+            check_current()
+            self._show_page(html, final_url)
+            run_js("window.updateStatus('Loaded')")
+            return html, True
+        
+        page_id = secrets.token_hex(8)
+        annotated = self._add_block_patch_listener(annotate_blocks(html, blocks), page_id)
+        run_js(f"window.resetHiddenBlocks('{page_id}')")
+        check_current()
+        self._show_page(annotated, final_url)
+        run_js("window.updateStatus('Filtering content...')")
+        
+        dropped = []
+        labelled = 0
+        complete = False
+        try:
+            for verdicts in self.content_filter.iter_block_verdicts(blocks, self.config.topics, cancel_token):
+                check_current()
+                labelled += len(verdicts)
+                ids = [i for i, keep in verdicts if not keep]
+                if ids:
+                    dropped.extend(ids)
+                    run_js(f"window.hideBlocks('{page_id}', {json.dumps(ids)})")
+                progress = int(labelled / len(blocks) * 100)
+                run_js(f"window.updateStatus('Filtering content... {progress}%')")
+        except RuntimeError as e:
+            # Filtering failed; blocks hidden so far stay hidden
+            error_msg = str(e).replace('\\', '\\\\').replace("'", "\\'")
+            run_js(f"window.updateStatus('Filtering failed: {error_msg}')")
         else:
-            html = html + js_block
+            complete = True
+            logger.info(f"Block filter dropped {len(dropped)} of {len(blocks)} blocks")
+            run_js("window.updateStatus('Content filtered')")
         
-        return html
+        return remove_blocks(html, [blocks[i] for i in dropped]), complete
     
-    def _load_url(self, url: str, use_filter: bool = False):
+    def _add_block_patch_listener(self, html: str, page_id: str) -> str:
+        """Add the script that applies block patches to a page.
+        
+        Args:
+            html: HTML with tagged blocks
+            page_id: Identifier that patches for this page carry
+            
+        Returns:
+            HTML with the listener script before </body> or at the end
+        """
+        script = f"""
+        <script>{_PARENT_ORIGIN_JS}
+        (function() {{
+            var pageId = '{page_id}';
+            window.addEventListener('message', function(event) {{
+                var data = event.data || {{}};
+                if (event.source !== parent || data.type !== 'epollo-hide' || data.page !== pageId) {{
+                    return;
+                }}
+                data.blocks.forEach(function(id) {{
+                    var el = document.querySelector('[data-epollo-block="' + id + '"]');
+                    if (el) {{
+                        el.style.setProperty('display', 'none', 'important');
+                    }}
+                }});
+            }});
+            parent.postMessage({{type: 'epollo-ready', page: pageId}}, window.epolloParentOrigin);
+        }})();
+        </script>
+        """
+        return self._inject_before_body_end(html, script)
+    
+    def _inject_before_body_end(self, html: str, snippet: str) -> str:
+        """Insert markup before </body>, or append it if there is none.
+        
+        Args:
+            html: HTML document
+            snippet: Markup to insert
+            
+        Returns:
+            HTML with the snippet inserted
+        """
+        body_end = html.lower().rfind('</body>')
+        if body_end == -1:
+            return html + snippet
+        return html[:body_end] + snippet + html[body_end:]
+    
+    def _prefetch_process(
+        self,
+        html: str,
+        final_url: str,
+        mode: str,
+        cancel_token: CancelToken
+    ) -> Optional[Tuple[str, bool]]:
+        """Build the final document for a prefetched page in the background.
+        
+        LLM filtering and summaries are only precomputed when
+        prefetch.process_with_llm is on; otherwise a filtered page is
+        prepared up to the filter, so the click only has to run it.
+        
+        Args:
+            html: Fetched HTML
+            final_url: URL after redirects
+            mode: Processing mode of the current navigation
+            cancel_token: Token cancelled when a foreground navigation starts
+            
+        Returns:
+            Tuple of (document, whether it is final), or None if nothing
+            beyond the fetched HTML can be prepared
+        """
+        with_llm = self.config.prefetch_process_with_llm
+        if mode.startswith("summary"):
+            if not with_llm:
+                return None
+            return self._create_summary_view(html, final_url, cancel_token, show_progress=False), True
+        
+        if self.config.remove_images:
+            html = self._remove_media(html)
+        if mode.startswith("filtered"):
+            partial = (html, False) if self.config.remove_images else None
+            if not with_llm:
+                return partial
+            try:
+                return self.content_filter.filter_content(html, self.config.topics, cancel_token), True
+            except RuntimeError:
+                return partial
+        return html, True
+    
+    def _page_mode(self, use_filter: bool) -> str:
+        """Describe how a page is processed, for keying the page cache.
+        
+        Args:
+            use_filter: Whether content filtering is requested
+            
+        Returns:
+            Mode string such as 'filtered' or 'summary+no-media'
+        """
+        if self.config.summary_view:
+            mode = "summary"
+        elif use_filter and self.config.topics and self.content_filter:
+            mode = "filtered"
+        else:
+            mode = "original"
+        return mode + "+no-media" if self.config.remove_images else mode
+    
+    def _load_url(self, url: str, use_filter: bool = False, from_history: bool = False):
         """Load URL and optionally filter content.
         
         Args:
             url: URL to load
             use_filter: Whether to apply content filtering
+            from_history: Whether this is a back/forward step, which may be
+                served from the page cache without fetching or calling Ollama
         """
+        # Starting a navigation cancels the previous one; its LLM requests are
+        # abandoned and its results dropped
+        nav = self.navigation.begin(url)
+        mode = self._page_mode(use_filter)
+        if self.prefetcher:
+            self.prefetcher.cancel()
+        
+        if from_history:
+            cached = self.page_cache.get(url, mode)
+            if cached is not None:
+                html, final_url = cached
+                self.current_url = final_url
+                self._html_content = html
+                if self.window:
+                    self._show_page(html, final_url)
+                    self.window.evaluate_js("window.updateStatus('Loaded from page cache')")
+                # Only the processed page is cached; its links are the ones the user sees
+                if self.prefetcher:
+                    self.prefetcher.schedule(html, final_url, mode)
+                return
+        
+        warm = self.prefetcher.take(url, mode) if self.prefetcher else None
+        
         def load_thread():
             try:
-                # Escape quotes for JavaScript
-                def js_escape(text):
-                    return text.replace('\\', '\\\\').replace("'", "\\'").replace('\n', '\\n').replace('\r', '')
-                
                 if self.window:
                     self.window.evaluate_js(f"window.updateStatus('Loading {url}...')")
                 
-                html, final_url = self._fetch_url(url)
-                self.current_url = final_url
+                if warm is not None:
+                    html, final_url, stage = warm
+                else:
+                    html, final_url = self._fetch_url(url)
+                    stage = STAGE_RAW
+                preprocessed = stage == STAGE_PROCESSED
+                # Partially prefetched pages already had their media removed
+                remove_media = self.config.remove_images and stage != STAGE_PARTIAL
+                nav.token.raise_if_cancelled()
+                raw_html = html
+                displayed = False
+                complete = True
                 
+                if preprocessed:
+                    if self.window:
+                        self.window.evaluate_js("window.updateStatus('Loaded from prefetch')")
                 # Check if summary view is enabled
-                if self.config.summary_view:
+                elif self.config.summary_view:
                     # Create summary view instead of showing original page
                     if self.window:
                         self.window.evaluate_js("window.updateStatus('Creating summary view...')")
                     try:
-                        html = self._create_summary_view(html, final_url)
+                        html = self._create_summary_view(html, final_url, nav.token)
                         if self.window:
                             self.window.evaluate_js("window.updateStatus('Summary view ready')")
+                    except NavigationCancelled:
+                        raise
                     except Exception as e:
                         logger.error(f"Error creating summary view: {e}", exc_info=True)
+                        complete = False
                         error_msg = str(e).replace('\\', '\\\\').replace("'", "\\'")
                         if self.window:
                             self.window.evaluate_js(f"window.updateStatus('Summary failed: {error_msg}')")
                         # Fall back to original page processing
-                        if self.config.remove_images:
+                        if remove_media:
                             html = self._remove_media(html)
                 else:
                     # Normal page processing
                     # Remove images and videos if configured
-                    if self.config.remove_images:
+                    if remove_media:
                         html = self._remove_media(html)
                     
-                    if use_filter and self.config.topics and self.content_filter:
+                    if (use_filter and self.config.topics and self.content_filter
+                            and self.window and self.config.filtering_progressive
+                            and self.content_filter.mode == "blocks"):
+                        html, complete = self._filter_progressively(html, final_url, nav.token)
+                        displayed = True
+                    elif use_filter and self.config.topics and self.content_filter:
                         if self.window:
                             self.window.evaluate_js("window.updateStatus('Filtering content...')")
                         try:
-                            html = self.content_filter.filter_content(html, self.config.topics)
+                            html = self.content_filter.filter_content(html, self.config.topics, nav.token)
                             if self.window:
                                 self.window.evaluate_js("window.updateStatus('Content filtered')")
                         except RuntimeError as e:
                             # Filtering failed, but continue with original content
+                            complete = False
                             error_msg = str(e).replace('\\', '\\\\').replace("'", "\\'")
                             if self.window:
                                 self.window.evaluate_js(f"window.updateStatus('Filtering failed: {error_msg}')")
@@ -1152,23 +1600,27 @@ Provide only the bullet points, one per line, starting with "- ". Do not include
                         if self.window:
                             self.window.evaluate_js("window.updateStatus('Loaded')")
                 
-                # Store HTML and update frame
+                # A newer navigation owns the frame now; drop this result
+                if not self.navigation.is_current(nav):
+                    raise NavigationCancelled()
+                
+                # Store HTML and update frame; partially processed pages are
+                # not cached so going back retries them
+                self.current_url = final_url
                 self._html_content = html
+                if complete:
+                    self.page_cache.put(url, mode, html, final_url)
                 
                 # Update URL bar and load content only if window exists
-                if self.window:
-                    escaped_url = js_escape(final_url)
-                    self.window.evaluate_js(f"window.updateUrl('{escaped_url}')")
-                    
-                    # Load content into iframe using base64 data URI (safer for special characters)
-                    import base64
-                    encoded_html = base64.b64encode(html.encode('utf-8')).decode('utf-8')
-                    data_uri = f"data:text/html;charset=utf-8;base64,{encoded_html}"
-                    self.window.evaluate_js(f"""
-                        const frame = document.getElementById('content-frame');
-                        frame.src = '{data_uri}';
-                    """)
+                if self.window and not displayed:
+                    self._show_page(html, final_url)
+                
+                # Warm up the links of this page while the user reads it
+                if self.prefetcher and self.navigation.is_current(nav):
+                    self.prefetcher.schedule(raw_html, final_url, mode)
                 
+            except NavigationCancelled:
+                logger.info(f"Dropped superseded navigation {nav.generation} to {url}")
             except Exception as e:
                 logger.error(f"Error loading URL: {e}", exc_info=True)
                 # Show error in status, but the error HTML was already returned by _fetch_url
@@ -1185,8 +1637,35 @@ Provide only the bullet points, one per line, starting with "- ". Do not include
             url: URL to navigate to
             use_filter: Whether to apply content filtering
         """
+        self.history.push(url, use_filter)
         self._load_url(url, use_filter)
     
+    def go_back(self) -> bool:
+        """Go to the previous page in history.
+        
+        Returns:
+            True if there was a previous page
+        """
+        entry = self.history.back()
+        if entry is None:
+            return False
+        url, use_filter = entry
+        self._load_url(url, use_filter, from_history=True)
+        return True
+    
+    def go_forward(self) -> bool:
+        """Go to the next page in history.
+        
+        Returns:
+            True if there was a next page
+        """
+        entry = self.history.forward()
+        if entry is None:
+            return False
+        url, use_filter = entry
+        self._load_url(url, use_filter, from_history=True)
+        return True
+    
     def take_screenshot(
         self,
         output_path: Optional[str] = None,
@@ -1363,7 +1842,7 @@ def take_url_screenshot(
                 logger.warning(f"Direct rendering failed, trying fetch-and-render approach: {direct_error}")
                 
                 # Fallback: fetch HTML and render it (bypasses some paywalls)
-                import requests
+                fetcher = get_fetcher(config)
                 headers = {
                     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
                     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
@@ -1374,8 +1853,7 @@ def take_url_screenshot(
                     'Upgrade-Insecure-Requests': '1'
                 }
                 
-                response = requests.get(url, headers=headers, timeout=30, allow_redirects=True)
-                response.raise_for_status()
+                response = fetcher.fetch(url, headers=headers, timeout=30)
                 
                 # Check if we got an access denied page
                 if 'access denied' in response.text.lower() or '403' in response.text:
@@ -1384,7 +1862,7 @@ def take_url_screenshot(
                         # Try cached version
                         try:
                             cache_url = f"https://webcache.googleusercontent.com/search?q={url}"
-                            cache_response = requests.get(cache_url, headers=headers, timeout=30, allow_redirects=True)
+                            cache_response = fetcher.get(cache_url, headers=headers, timeout=30, allow_redirects=True)
                             if cache_response.status_code == 200:
                                 return render_html_to_screenshot_sync(
                                     html=cache_response.text,
@@ -1401,7 +1879,7 @@ def take_url_screenshot(
                     # Try with different user agent or add referer
                     headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
                     headers['Referer'] = 'https://www.google.com/'
-                    response = requests.get(url, headers=headers, timeout=30, allow_redirects=True)
+                    response = fetcher.get(url, headers=headers, timeout=30, allow_redirects=True)
                 
                 return render_html_to_screenshot_sync(
                     html=response.text,
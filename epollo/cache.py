@@ -0,0 +1,189 @@
+"""Persistent size-bounded key/value cache backed by SQLite."""
+
+import json
+import sqlite3
+import time
+import zlib
+import logging
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteCache:
+    """Compressed LRU key/value store persisted in a single SQLite file."""
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 100 * 1024 * 1024,
+        ttl: Optional[float] = None,
+        compress: bool = True,
+        max_entries: Optional[int] = None
+    ):
+        """Initialize cache.
+
+        Args:
+            path: Path to the SQLite database file
+            max_bytes: Maximum total size of stored values before LRU eviction
+            ttl: Optional time-to-live in seconds for every entry
+            compress: Whether to zlib-compress stored values
+            max_entries: Optional maximum number of entries before LRU eviction
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.compress = compress
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                meta TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries(accessed)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+        """Look up a value and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (value, metadata), or None on miss or expiry
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, meta, created FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            value, meta, created = row
+            if self.ttl is not None and now - created > self.ttl:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+
+        if self.compress:
+            value = zlib.decompress(value)
+        return value, json.loads(meta)
+
+    def put(self, key: str, value: bytes, meta: Optional[Dict[str, Any]] = None):
+        """Store a value, evicting least recently used entries if over budget.
+
+        Args:
+            key: Cache key
+            value: Value bytes
+            meta: JSON-serializable metadata stored alongside the value
+        """
+        stored = zlib.compress(value) if self.compress else value
+        if len(stored) > self.max_bytes:
+            return
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, meta, size, created, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, stored, json.dumps(meta or {}), len(stored), now, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def update_meta(self, key: str, meta: Dict[str, Any]):
+        """Replace the metadata of an entry and reset its age.
+
+        Args:
+            key: Cache key
+            meta: New metadata
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE entries SET meta = ?, created = ?, accessed = ? WHERE key = ?",
+                (json.dumps(meta), now, now, key)
+            )
+            self._conn.commit()
+
+    def delete(self, key: str):
+        """Remove an entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def _evict(self):
+        """Drop expired entries, then LRU entries until under the size and count budgets.
+
+        Must be called with the lock held.
+        """
+        if self.ttl is not None:
+            cursor = self._conn.execute("DELETE FROM entries WHERE created < ?", (time.time() - self.ttl,))
+            self.evictions += cursor.rowcount
+
+        count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        max_entries = self.max_entries if self.max_entries is not None else count
+        if total <= self.max_bytes and count <= max_entries:
+            return
+
+        victims = []
+        for key, size in self._conn.execute("SELECT key, size FROM entries ORDER BY accessed ASC"):
+            if total <= self.max_bytes and count <= max_entries:
+                break
+            victims.append((key,))
+            total -= size
+            count -= 1
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+        self.evictions += len(victims)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counters, entry count and stored bytes
+        """
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': entries,
+            'bytes': size
+        }
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
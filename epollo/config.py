@@ -2,7 +2,7 @@
 
 import os
 import yaml
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from pathlib import Path
 
 
@@ -76,11 +76,68 @@ class Config:
         """Get Ollama API URL."""
         return self._config.get("ollama", {}).get("api_url", "http://localhost:11434")
     
+    @property
+    def ollama_timeout(self) -> float:
+        """Get default Ollama read timeout in seconds."""
+        return self._config.get("ollama", {}).get("timeout", 120)
+    
+    @property
+    def ollama_max_connections(self) -> int:
+        """Get number of pooled keep-alive connections to the Ollama server."""
+        return self._config.get("ollama", {}).get("max_connections", 8)
+    
+    @property
+    def ollama_retries(self) -> int:
+        """Get number of retries after a connection failure or busy Ollama server."""
+        return self._config.get("ollama", {}).get("retries", 2)
+    
     @property
     def filtering_enabled(self) -> bool:
         """Check if filtering is enabled by default."""
         return self._config.get("filtering", {}).get("enabled", True)
     
+    @property
+    def filtering_mode(self) -> str:
+        """Get filtering mode ('rewrite' or 'blocks')."""
+        return self._config.get("filtering", {}).get("mode", "rewrite")
+    
+    @property
+    def filtering_block_batch_size(self) -> int:
+        """Get number of content blocks labelled per LLM call in 'blocks' mode."""
+        return self._config.get("filtering", {}).get("block_batch_size", 20)
+    
+    @property
+    def filtering_max_block_chars(self) -> int:
+        """Get maximum text length of a content block in 'blocks' mode."""
+        return self._config.get("filtering", {}).get("max_block_chars", 1500)
+    
+    @property
+    def filtering_progressive(self) -> bool:
+        """Check if pages are shown before filtering and patched as blocks are labelled."""
+        return self._config.get("filtering", {}).get("progressive", True)
+    
+    @property
+    def filter_cache_enabled(self) -> bool:
+        """Check if block filter verdicts are cached across page loads."""
+        return self._config.get("filtering", {}).get("decision_cache", {}).get("enabled", True)
+    
+    @property
+    def filter_cache_path(self) -> str:
+        """Get path of the filter decision cache database."""
+        return self._config.get("filtering", {}).get("decision_cache", {}).get(
+            "path", "~/.cache/epollo/filter_decisions.sqlite3")
+    
+    @property
+    def filter_cache_max_entries(self) -> int:
+        """Get maximum number of cached filter verdicts."""
+        return self._config.get("filtering", {}).get("decision_cache", {}).get("max_entries", 200000)
+    
+    @property
+    def filter_cache_ttl(self) -> Optional[float]:
+        """Get lifetime of cached filter verdicts in seconds (None for no expiry)."""
+        ttl_hours = self._config.get("filtering", {}).get("decision_cache", {}).get("ttl_hours", 168)
+        return ttl_hours * 3600 if ttl_hours else None
+    
     @property
     def remove_images(self) -> bool:
         """Check if images should be removed from rendered pages."""
@@ -91,6 +148,117 @@ class Config:
         """Check if summary view should be used instead of full page."""
         return self._config.get("display", {}).get("summary_view", False)
     
+    @property
+    def page_cache_max_bytes(self) -> int:
+        """Get memory budget for processed pages kept for back/forward navigation."""
+        return int(self._config.get("display", {}).get("page_cache_mb", 64) * 1024 * 1024)
+    
+    @property
+    def prefetch_enabled(self) -> bool:
+        """Check if links of the current page are prefetched in the background."""
+        return self._config.get("prefetch", {}).get("enabled", False)
+    
+    @property
+    def prefetch_max_links(self) -> int:
+        """Get number of same-origin links prefetched per page."""
+        return self._config.get("prefetch", {}).get("max_links", 5)
+    
+    @property
+    def prefetch_process_with_llm(self) -> bool:
+        """Check if prefetched pages are also filtered or summarized ahead of time."""
+        return self._config.get("prefetch", {}).get("process_with_llm", False)
+    
+    @property
+    def prefetch_max_age(self) -> float:
+        """Get seconds a prefetched page stays usable."""
+        return self._config.get("prefetch", {}).get("max_age", 300)
+    
+    @property
+    def prefetch_cache_max_bytes(self) -> int:
+        """Get memory budget for prefetched pages."""
+        return int(self._config.get("prefetch", {}).get("cache_mb", 32) * 1024 * 1024)
+    
+    @property
+    def summary_max_parallel(self) -> int:
+        """Get number of section summaries generated at once.
+        
+        Defaults to OLLAMA_NUM_PARALLEL so requests are not queued behind
+        each other inside the Ollama server.
+        """
+        default = int(os.environ.get("OLLAMA_NUM_PARALLEL", 4))
+        return max(1, self._config.get("summary", {}).get("max_parallel", default))
+    
+    @property
+    def summary_mode(self) -> str:
+        """Get summarization mode ("parallel": one call per section, "batched": one call per page)."""
+        return self._config.get("summary", {}).get("mode", "parallel")
+    
+    @property
+    def summary_context_tokens(self) -> int:
+        """Get model context window size used to size batched summary prompts."""
+        return self._config.get("summary", {}).get("context_tokens", 8192)
+    
+    @property
+    def summary_section_timeout(self) -> float:
+        """Get per-section summary timeout in seconds."""
+        return self._config.get("summary", {}).get("section_timeout", 60)
+    
+    @property
+    def models_preload(self) -> bool:
+        """Check if models are loaded into Ollama in the background at startup."""
+        return self._config.get("models", {}).get("preload", True)
+    
+    @property
+    def models_keep_alive(self) -> Any:
+        """Get default time a model stays loaded after its last request ("5m", seconds, -1: forever)."""
+        return self._config.get("models", {}).get("keep_alive", "5m")
+    
+    @property
+    def models_keep_alive_per_model(self) -> Dict[str, Any]:
+        """Get keep-alive overrides by model name."""
+        return self._config.get("models", {}).get("keep_alive_per_model", {}) or {}
+    
+    @property
+    def vision_cache_enabled(self) -> bool:
+        """Check if VLM/OCR answers are cached by image content."""
+        return self._config.get("vision_cache", {}).get("enabled", True)
+    
+    @property
+    def vision_cache_path(self) -> str:
+        """Get path of the VLM/OCR result cache database."""
+        return self._config.get("vision_cache", {}).get("path", "~/.cache/epollo/vision_results.sqlite3")
+    
+    @property
+    def vision_cache_max_bytes(self) -> int:
+        """Get maximum size of the VLM/OCR result cache."""
+        return int(self._config.get("vision_cache", {}).get("max_mb", 64) * 1024 * 1024)
+    
+    @property
+    def vision_cache_ttl(self) -> Optional[float]:
+        """Get lifetime of cached VLM/OCR answers in seconds (None for no expiry)."""
+        ttl_hours = self._config.get("vision_cache", {}).get("ttl_hours", 72)
+        return ttl_hours * 3600 if ttl_hours else None
+    
+    @property
+    def llm_max_concurrent(self) -> int:
+        """Get number of Ollama requests allowed in flight across the app.
+        
+        Defaults to OLLAMA_NUM_PARALLEL, the number the server runs at once.
+        """
+        default = int(os.environ.get("OLLAMA_NUM_PARALLEL", 4))
+        return max(1, self._config.get("llm_scheduler", {}).get("max_concurrent", default))
+    
+    @property
+    def llm_reserved_interactive(self) -> int:
+        """Get number of Ollama slots kept free for interactive requests."""
+        return self._config.get("llm_scheduler", {}).get("reserved_interactive", 1)
+    
+    @property
+    def llm_max_wait(self) -> Dict[str, Optional[float]]:
+        """Get seconds a request of each priority class may wait for a slot (None: no limit)."""
+        defaults = {"interactive": None, "background": 30, "batch": None}
+        return {**defaults, **self._config.get("llm_scheduler", {}).get("max_wait", {})}
+    
     @property
     def ocr_enabled(self) -> bool:
         """Check if OCR is enabled."""
@@ -111,6 +279,117 @@ class Config:
         """Get OCR timeout in seconds."""
         return self._config.get("ocr", {}).get("timeout", 60)
     
+    @property
+    def ocr_max_parallel(self) -> int:
+        """Get number of image crops sent to the OCR model at once."""
+        default = int(os.environ.get("OLLAMA_NUM_PARALLEL", 4))
+        return max(1, self._config.get("ocr", {}).get("max_parallel", default))
+
+    @property
+    def http_pool_connections(self) -> int:
+        """Get number of per-host HTTP connection pools to keep."""
+        return self._config.get("http", {}).get("pool_connections", 10)
+
+    @property
+    def http_pool_maxsize(self) -> int:
+        """Get maximum keep-alive connections per host."""
+        return self._config.get("http", {}).get("pool_maxsize", 10)
+
+    @property
+    def http_idle_timeout(self) -> float:
+        """Get seconds after which an idle host connection pool is closed."""
+        return self._config.get("http", {}).get("idle_timeout", 90)
+
+    @property
+    def http_max_retries(self) -> int:
+        """Get number of connection-level retries per HTTP request."""
+        return self._config.get("http", {}).get("max_retries", 0)
+
+    @property
+    def http_max_concurrency(self) -> int:
+        """Get maximum number of concurrent requests in batch fetches."""
+        return self._config.get("http", {}).get("max_concurrency", 8)
+
+    @property
+    def http_per_host_concurrency(self) -> int:
+        """Get maximum number of concurrent requests per host in batch fetches."""
+        return self._config.get("http", {}).get("per_host_concurrency", 2)
+
+    @property
+    def http_batch_timeout(self) -> float:
+        """Get per-request deadline in seconds for batch fetches."""
+        return self._config.get("http", {}).get("batch_timeout", 30)
+
+    @property
+    def http_max_body_bytes(self) -> int:
+        """Get maximum page body size in bytes."""
+        return int(self._config.get("http", {}).get("max_body_mb", 10) * 1024 * 1024)
+
+    @property
+    def http_cache_enabled(self) -> bool:
+        """Check if the persistent HTTP response cache is enabled."""
+        return self._config.get("http_cache", {}).get("enabled", True)
+
+    @property
+    def http_cache_path(self) -> str:
+        """Get path of the HTTP response cache database."""
+        return self._config.get("http_cache", {}).get("path", "~/.cache/epollo/http_cache.sqlite3")
+
+    @property
+    def http_cache_max_bytes(self) -> int:
+        """Get maximum size of the HTTP response cache in bytes."""
+        return int(self._config.get("http_cache", {}).get("max_size_mb", 200) * 1024 * 1024)
+
+    @property
+    def screenshot_persistent_pool(self) -> bool:
+        """Check if screenshots reuse a long-lived Chromium pool."""
+        return self._config.get("screenshot", {}).get("persistent_pool", True)
+
+    @property
+    def screenshot_pool_contexts(self) -> int:
+        """Get number of warmed browser contexts in the renderer pool."""
+        return self._config.get("screenshot", {}).get("pool_contexts", 2)
+
+    @property
+    def screenshot_max_pages_per_context(self) -> int:
+        """Get number of pages a pooled context serves before it is recycled."""
+        return self._config.get("screenshot", {}).get("max_pages_per_context", 50)
+
+    @property
+    def screenshot_max_concurrent_pages(self) -> int:
+        """Get maximum number of pages rendered at once by the pool."""
+        return self._config.get("screenshot", {}).get("max_concurrent_pages", 4)
+
+    @property
+    def screenshot_batch_concurrency(self) -> int:
+        """Get number of pages rendered in parallel by batch captures."""
+        return self._config.get("screenshot", {}).get("batch_concurrency", 4)
+
+    @property
+    def screenshot_block_trackers(self) -> bool:
+        """Check if ad and tracker requests are blocked while rendering screenshots."""
+        return self._config.get("screenshot", {}).get("block_trackers", True)
+
+    @property
+    def screenshot_blocked_resource_types(self) -> List[str]:
+        """Get Playwright resource types dropped while rendering screenshots."""
+        return self._config.get("screenshot", {}).get("blocked_resource_types", ["media"])
+
+    @property
+    def screenshot_blocked_domains(self) -> List[str]:
+        """Get extra hostnames blocked while rendering screenshots."""
+        return self._config.get("screenshot", {}).get("blocked_domains", [])
+
+    @property
+    def screenshot_cache_static_assets(self) -> bool:
+        """Check if repeated static assets are served from an in-memory cache."""
+        return self._config.get("screenshot", {}).get("cache_static_assets", False)
+
+    @property
+    def screenshot_readiness(self) -> Dict[str, Any]:
+        """Get page readiness settings ('default' profile and per-host 'sites')."""
+        return self._config.get("screenshot", {}).get("readiness", {})
+
     def reload(self):
         """Reload configuration from file."""
         self._config = self._load_config()
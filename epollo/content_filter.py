@@ -1,42 +1,113 @@
 """Content filtering using Ollama LLM."""
 
-import ollama
-from typing import List
+import re
+import hashlib
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 import logging
+from . import llm
+from .cache import SQLiteCache
+from .ollama_client import get_ollama_client
+from .navigation import CancelToken, NavigationCancelled
+from .html_blocks import ContentBlock, extract_blocks, remove_blocks
 
 logger = logging.getLogger(__name__)
 
 
+class FilterDecisionCache:
+    """Persistent cache of keep/drop verdicts keyed by block content.
+    
+    Keys hash the normalized block text together with the topic list and
+    model name, so a verdict is only reused for the same question asked of
+    the same model.
+    """
+    
+    def __init__(self, path: str, max_entries: int = 200000, ttl: Optional[float] = None):
+        """Initialize decision cache.
+        
+        Args:
+            path: Path to the SQLite database file
+            max_entries: Maximum number of verdicts kept before LRU eviction
+            ttl: Optional time-to-live in seconds for each verdict
+        """
+        self._store = SQLiteCache(path, ttl=ttl, compress=False, max_entries=max_entries)
+    
+    def _key(self, text: str, topics: List[str], model: str) -> str:
+        """Build the content-addressed key for a block verdict."""
+        normalized = ' '.join(text.lower().split())
+        material = "\x00".join([normalized, "\x1f".join(sorted(topics)), model])
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+    
+    def get(self, text: str, topics: List[str], model: str) -> Optional[bool]:
+        """Look up a cached verdict.
+        
+        Returns:
+            True to keep, False to drop, None if unknown
+        """
+        entry = self._store.get(self._key(text, topics, model))
+        if entry is None:
+            return None
+        return entry[0] == b'1'
+    
+    def put(self, text: str, topics: List[str], model: str, keep: bool):
+        """Store a verdict."""
+        self._store.put(self._key(text, topics, model), b'1' if keep else b'0')
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics (hits, misses, hit rate, entries)."""
+        return self._store.stats()
+
+
 class ContentFilter:
     """Filters HTML content using local LLM via Ollama."""
     
-    def __init__(self, model: str = "llama3.2", api_url: str = "http://localhost:11434"):
+    def __init__(
+        self,
+        model: str = "llama3.2",
+        api_url: str = "http://localhost:11434",
+        mode: str = "rewrite",
+        block_batch_size: int = 20,
+        max_block_chars: int = 1500,
+        decision_cache: Optional[FilterDecisionCache] = None
+    ):
         """Initialize content filter.
         
         Args:
             model: Ollama model name to use
             api_url: Ollama API base URL
+            mode: 'rewrite' to have the LLM return the whole filtered document,
+                'blocks' to only ask for keep/drop labels per content block
+            block_batch_size: Number of blocks labelled per LLM call in 'blocks' mode
+            max_block_chars: Maximum text length of a single block in 'blocks' mode
+            decision_cache: Optional cache of block verdicts reused across page loads
         """
         self.model = model
         self.api_url = api_url
-        # Set Ollama host if needed
-        if api_url != "http://localhost:11434":
-            import os
-            os.environ["OLLAMA_HOST"] = api_url
+        self.mode = mode
+        self.block_batch_size = block_batch_size
+        self.max_block_chars = max_block_chars
+        self.decision_cache = decision_cache
+        self.client = get_ollama_client(api_url)
     
-    def filter_content(self, html: str, topics: List[str]) -> str:
+    def filter_content(self, html: str, topics: List[str], cancel_token: Optional[CancelToken] = None) -> str:
         """Filter HTML content by removing sections related to specified topics.
         
         Args:
             html: Original HTML content
             topics: List of topics to filter out
+            cancel_token: Token whose cancellation abandons the LLM calls
             
         Returns:
             Filtered HTML with content related to topics removed and fluidly adapted
+            
+        Raises:
+            NavigationCancelled: If cancelled while filtering
         """
         if not topics:
             return html
         
+        if self.mode == "blocks":
+            return self._filter_blocks(html, topics, cancel_token)
+        
         topics_str = ", ".join(f'"{topic}"' for topic in topics)
         
         prompt = f"""You are a web content filter. Your task is to remove any content from the HTML that is related to these topics: {topics_str}.
@@ -55,9 +126,12 @@ HTML to filter:
 {html}"""
         
         try:
-            response = ollama.generate(
+            response = llm.generate(
                 model=self.model,
-                prompt=prompt
+                prompt=prompt,
+                client=self.client,
+                cancel_token=cancel_token,
+                source="filter"
             )
             
             if not response or 'response' not in response:
@@ -83,6 +157,8 @@ HTML to filter:
                 filtered_html = "\n".join(lines)
             
             return filtered_html
+        except NavigationCancelled:
+            raise
         except ConnectionError as e:
             logger.error(f"Could not connect to Ollama at {self.api_url}: {e}")
             raise RuntimeError(f"Ollama connection failed. Make sure Ollama is running at {self.api_url}")
@@ -91,6 +167,163 @@ HTML to filter:
             # Return original HTML on error to allow browsing to continue
             raise RuntimeError(f"Content filtering failed: {str(e)}")
     
+    def _filter_blocks(self, html: str, topics: List[str], cancel_token: Optional[CancelToken] = None) -> str:
+        """Filter HTML by labelling content blocks and removing dropped ones.
+        
+        The LLM only sees block text and answers with one label per block, so
+        output size no longer grows with the page and the document structure
+        is never regenerated by the model.
+        
+        Args:
+            html: Original HTML content
+            topics: List of topics to filter out
+            cancel_token: Token whose cancellation abandons the LLM calls
+            
+        Returns:
+            HTML with blocks related to the topics removed
+        """
+        blocks = extract_blocks(html, max_chars=self.max_block_chars)
+        if not blocks:
+            return html
+        
+        keep = self.classify_blocks(blocks, topics, cancel_token)
+        dropped = [block for block, keep_block in zip(blocks, keep) if not keep_block]
+        logger.info(f"Block filter dropped {len(dropped)} of {len(blocks)} blocks")
+        return remove_blocks(html, dropped)
+    
+    def classify_blocks(
+        self,
+        blocks: List[ContentBlock],
+        topics: List[str],
+        cancel_token: Optional[CancelToken] = None
+    ) -> List[bool]:
+        """Label content blocks as keep (True) or drop (False).
+        
+        Args:
+            blocks: Content blocks to label
+            topics: List of topics to filter out
+            cancel_token: Token whose cancellation abandons the LLM calls
+            
+        Returns:
+            List of keep flags, one per block
+        """
+        keep = [True] * len(blocks)
+        for verdicts in self.iter_block_verdicts(blocks, topics, cancel_token):
+            for i, verdict in verdicts:
+                keep[i] = verdict
+        return keep
+    
+    def iter_block_verdicts(
+        self,
+        blocks: List[ContentBlock],
+        topics: List[str],
+        cancel_token: Optional[CancelToken] = None
+    ) -> Iterator[List[Tuple[int, bool]]]:
+        """Label content blocks incrementally, one batch at a time.
+        
+        Verdicts found in the decision cache are reused and yielded first;
+        only unseen blocks are sent to the LLM.
+        
+        Args:
+            blocks: Content blocks to label
+            topics: List of topics to filter out
+            cancel_token: Token whose cancellation abandons the LLM calls
+            
+        Yields:
+            Lists of (position in blocks, keep flag) pairs
+        """
+        pending = list(range(len(blocks)))
+        if self.decision_cache:
+            cached = []
+            pending = []
+            for i, block in enumerate(blocks):
+                verdict = self.decision_cache.get(block.text, topics, self.model)
+                if verdict is None:
+                    pending.append(i)
+                else:
+                    cached.append((i, verdict))
+            logger.info(f"Filter decision cache: {len(cached)}/{len(blocks)} blocks reused, "
+                        f"hit rate {self.decision_cache.stats()['hit_rate']:.0%}")
+            if cached:
+                yield cached
+        
+        for start in range(0, len(pending), self.block_batch_size):
+            positions = pending[start:start + self.block_batch_size]
+            labels = self._classify_batch([blocks[i] for i in positions], topics, cancel_token)
+            
+            # Ask once more for blocks the model skipped, on their own
+            unlabelled = [n for n, label in enumerate(labels) if label is None]
+            if unlabelled:
+                logger.info(f"Model left {len(unlabelled)}/{len(positions)} blocks unlabelled, asking again")
+                retry = self._classify_batch([blocks[positions[n]] for n in unlabelled], topics, cancel_token)
+                for n, label in zip(unlabelled, retry):
+                    labels[n] = label
+            
+            verdicts = []
+            for i, label in zip(positions, labels):
+                if label is None:
+                    # Still no answer: keep the block, but do not remember a guess
+                    verdicts.append((i, True))
+                    continue
+                if self.decision_cache:
+                    self.decision_cache.put(blocks[i].text, topics, self.model, label)
+                verdicts.append((i, label))
+            yield verdicts
+    
+    def _classify_batch(
+        self,
+        blocks: List[ContentBlock],
+        topics: List[str],
+        cancel_token: Optional[CancelToken] = None
+    ) -> List[Optional[bool]]:
+        """Ask the LLM for keep/drop labels for one batch of blocks.
+        
+        Args:
+            blocks: Content blocks to label
+            topics: List of topics to filter out
+            cancel_token: Token whose cancellation abandons the request
+            
+        Returns:
+            List of keep flags, one per block (None where the model gave no label)
+        """
+        topics_str = ", ".join(f'"{topic}"' for topic in topics)
+        numbered = "\n".join(f"[{n}] {block.text[:300]}" for n, block in enumerate(blocks, 1))
+        
+        prompt = f"""You are a web content filter. Each numbered block below is a piece of text from a web page.
+Decide for each block whether it is related to any of these topics: {topics_str}.
+
+Answer with exactly one line per block in the form "<number>: KEEP" or "<number>: DROP".
+DROP blocks related to the topics and KEEP everything else. Do not add explanations.
+
+Blocks:
+{numbered}"""
+        
+        try:
+            response = llm.generate(
+                model=self.model,
+                prompt=prompt,
+                client=self.client,
+                cancel_token=cancel_token,
+                source="filter",
+                options={"temperature": 0, "num_predict": 8 * len(blocks) + 16}
+            )
+        except NavigationCancelled:
+            raise
+        except ConnectionError as e:
+            logger.error(f"Could not connect to Ollama at {self.api_url}: {e}")
+            raise RuntimeError(f"Ollama connection failed. Make sure Ollama is running at {self.api_url}")
+        except Exception as e:
+            logger.error(f"Error classifying blocks with Ollama: {e}", exc_info=True)
+            raise RuntimeError(f"Content filtering failed: {str(e)}")
+        
+        keep: List[Optional[bool]] = [None] * len(blocks)
+        answer = response.get('response', '') if response else ''
+        for match in re.finditer(r'(\d+)\s*[:.)\]-]?\s*(KEEP|DROP)', answer, re.IGNORECASE):
+            n = int(match.group(1))
+            if 1 <= n <= len(blocks):
+                keep[n - 1] = match.group(2).upper() == "KEEP"
+        return keep
+    
     def check_ollama_available(self) -> bool:
         """Check if Ollama is available and the model exists.
         
@@ -99,7 +332,7 @@ HTML to filter:
         """
         try:
             # Try to list models to check if Ollama is running
-            ollama.list()
+            self.client.list_models()
             return True
         except Exception as e:
             logger.warning(f"Ollama not available: {e}")
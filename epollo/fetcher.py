@@ -0,0 +1,482 @@
+"""Pooled HTTP fetching shared by the browser and screenshot helpers."""
+
+import re
+import time
+import codecs
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from typing import Optional, Dict, Any, Callable, Iterable, AsyncIterator
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from .cache import SQLiteCache
+
+logger = logging.getLogger(__name__)
+
+# Response headers persisted with cached bodies
+_CACHED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Cache-Control', 'Expires', 'Date')
+
+# Bytes read from the socket per iteration while streaming a body
+_CHUNK_SIZE = 64 * 1024
+
+
+class ContentTooLargeError(ValueError):
+    """Raised when a response body exceeds the configured size limit."""
+
+
+class FetchResult:
+    """Response-like result of a (possibly cached) fetch."""
+
+    def __init__(
+        self,
+        url: str,
+        status_code: int,
+        headers: Dict[str, str],
+        text: str,
+        encoding: Optional[str],
+        from_cache: bool = False
+    ):
+        """Initialize fetch result.
+
+        Args:
+            url: Final URL after redirects
+            status_code: HTTP status code of the original response
+            headers: Response headers
+            text: Decoded response body
+            encoding: Character encoding the body was decoded from
+            from_cache: Whether the body was served from the HTTP cache
+        """
+        self.url = url
+        self.status_code = status_code
+        self.headers = requests.structures.CaseInsensitiveDict(headers)
+        self.text = text
+        self.encoding = encoding
+        self.from_cache = from_cache
+
+
+def _charset_from_headers(headers) -> Optional[str]:
+    """Get the charset declared in the Content-Type header, if any."""
+    match = re.search(r'charset=["\']?([\w.:-]+)', headers.get('Content-Type', ''), re.IGNORECASE)
+    return match.group(1) if match else None
+
+
+def _sniff_charset(chunk: bytes) -> Optional[str]:
+    """Get the charset declared by a <meta> tag near the start of a document."""
+    match = re.search(rb'<meta[^>]+charset=["\']?([\w.:-]+)', chunk[:4096], re.IGNORECASE)
+    return match.group(1).decode('ascii') if match else None
+
+
+def _freshness_lifetime(headers) -> Optional[float]:
+    """Compute how long a response may be served without revalidation.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        Lifetime in seconds, or None if the response must not be stored
+    """
+    cache_control = headers.get('Cache-Control', '').lower()
+    if 'no-store' in cache_control:
+        return None
+    if 'no-cache' in cache_control:
+        return 0.0
+
+    match = re.search(r'max-age\s*=\s*(\d+)', cache_control)
+    if match:
+        return float(match.group(1))
+
+    expires = headers.get('Expires')
+    if expires:
+        try:
+            lifetime = parsedate_to_datetime(expires).timestamp() - time.time()
+            return max(lifetime, 0.0)
+        except (TypeError, ValueError):
+            return 0.0
+
+    # Without explicit freshness information, always revalidate
+    return 0.0
+
+
+class HTTPFetcher:
+    """Thread-safe HTTP client that keeps per-host keep-alive connection pools."""
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        idle_timeout: float = 90.0,
+        max_retries: int = 0,
+        cache: Optional[SQLiteCache] = None,
+        max_body_bytes: int = 10 * 1024 * 1024
+    ):
+        """Initialize HTTP fetcher.
+
+        Args:
+            pool_connections: Number of per-host connection pools to keep
+            pool_maxsize: Maximum keep-alive connections per host
+            idle_timeout: Seconds a host pool may sit unused before it is closed
+            max_retries: Number of connection-level retries per request
+            cache: Optional persistent response cache used by fetch()
+            max_body_bytes: Maximum decompressed body size accepted by fetch()
+        """
+        self.idle_timeout = idle_timeout
+        self.cache = cache
+        self.max_body_bytes = max_body_bytes
+        self.session = requests.Session()
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries
+        )
+        self.session.mount('http://', self._adapter)
+        self.session.mount('https://', self._adapter)
+        self._lock = threading.Lock()
+        self._last_used: Dict[str, float] = {}
+
+    def _close_idle_pools(self, now: float):
+        """Close connection pools for hosts that have been idle too long.
+
+        Servers drop idle keep-alive sockets on their own schedule, so reusing
+        a pool that sat unused for minutes mostly yields dead connections.
+
+        Args:
+            now: Current monotonic time
+        """
+        with self._lock:
+            expired = [host for host, last in self._last_used.items() if now - last > self.idle_timeout]
+            for host in expired:
+                del self._last_used[host]
+
+        if not expired:
+            return
+
+        pools = self._adapter.poolmanager.pools
+        for key in pools.keys():
+            if key.key_host in expired:
+                logger.debug(f"Closing idle connection pool for {key.key_host}")
+                try:
+                    del pools[key]
+                except KeyError:
+                    pass
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 30, **kwargs) -> requests.Response:
+        """Perform a GET request over the shared connection pool.
+
+        Args:
+            url: URL to fetch
+            headers: Request headers
+            timeout: Request timeout in seconds
+            **kwargs: Extra arguments passed to requests.Session.get
+
+        Returns:
+            The requests Response object
+        """
+        now = time.monotonic()
+        self._close_idle_pools(now)
+
+        host = (urlparse(url).hostname or '').lower()
+        with self._lock:
+            self._last_used[host] = now
+
+        return self.session.get(url, headers=headers, timeout=timeout, **kwargs)
+
+    def fetch(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 30) -> FetchResult:
+        """Fetch a page, serving and revalidating it through the HTTP cache.
+
+        Fresh cached responses are returned without touching the network.
+        Stale ones are revalidated with If-None-Match/If-Modified-Since and
+        reused when the server answers 304 Not Modified. Network bodies are
+        streamed and decoded incrementally, and the download is aborted as
+        soon as it exceeds max_body_bytes.
+
+        Args:
+            url: URL to fetch
+            headers: Request headers
+            timeout: Request timeout in seconds
+
+        Returns:
+            FetchResult with the page body
+
+        Raises:
+            requests.exceptions.RequestException: On network or HTTP errors
+            ContentTooLargeError: If the body exceeds max_body_bytes
+        """
+        if self.cache is None:
+            return self._fetch_network(url, headers, timeout)
+
+        cached = self.cache.get(url)
+        if cached is not None:
+            body, meta = cached
+            if time.time() < meta.get('expires', 0):
+                logger.debug(f"HTTP cache hit (fresh) for {url}")
+                return self._result_from_cache(body, meta)
+
+            conditional_headers = dict(headers or {})
+            if meta['headers'].get('ETag'):
+                conditional_headers['If-None-Match'] = meta['headers']['ETag']
+            if meta['headers'].get('Last-Modified'):
+                conditional_headers['If-Modified-Since'] = meta['headers']['Last-Modified']
+
+            response = self.get(url, headers=conditional_headers, timeout=timeout, allow_redirects=True, stream=True)
+            if response.status_code == 304:
+                response.close()
+                logger.debug(f"HTTP cache revalidated (304) for {url}")
+                meta['headers'].update(self._cacheable_headers(response.headers))
+                lifetime = _freshness_lifetime(response.headers)
+                meta['expires'] = time.time() + (lifetime or 0.0)
+                if lifetime is None:
+                    self.cache.delete(url)
+                else:
+                    self.cache.update_meta(url, meta)
+                return self._result_from_cache(body, meta)
+
+            return self._store(url, response)
+
+        response = self.get(url, headers=headers, timeout=timeout, allow_redirects=True, stream=True)
+        return self._store(url, response)
+
+    def _fetch_network(self, url: str, headers: Optional[Dict[str, str]], timeout: float) -> FetchResult:
+        """Fetch a page without consulting the cache."""
+        response = self.get(url, headers=headers, timeout=timeout, allow_redirects=True, stream=True)
+        return self._to_result(response)
+
+    def _read_body(self, response: requests.Response):
+        """Stream and incrementally decode a response body.
+
+        Bytes are counted as they arrive, so chunked responses without a
+        Content-Length are held to the same limit. Decoded chunks are joined
+        once at the end instead of keeping both a bytes and a str copy.
+
+        Args:
+            response: Response opened with stream=True
+
+        Returns:
+            Tuple of (decoded text, encoding used)
+
+        Raises:
+            ContentTooLargeError: If the body exceeds max_body_bytes
+        """
+        limit_mb = self.max_body_bytes / 1024 / 1024
+        content_length = response.headers.get('Content-Length', '')
+        if content_length.isdigit() and int(content_length) > self.max_body_bytes:
+            raise ContentTooLargeError(
+                f"Content too large ({int(content_length) / 1024 / 1024:.1f}MB). Maximum {limit_mb:.0f}MB supported."
+            )
+
+        encoding = _charset_from_headers(response.headers)
+        decoder = None
+        parts = []
+        received = 0
+
+        for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+            received += len(chunk)
+            if received > self.max_body_bytes:
+                raise ContentTooLargeError(f"Content too large (over {limit_mb:.0f}MB). Maximum {limit_mb:.0f}MB supported.")
+
+            if decoder is None:
+                encoding = encoding or _sniff_charset(chunk) or 'utf-8'
+                try:
+                    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+                except LookupError:
+                    encoding = 'utf-8'
+                    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+            parts.append(decoder.decode(chunk))
+
+        if decoder is not None:
+            parts.append(decoder.decode(b'', final=True))
+        return ''.join(parts), encoding
+
+    def _to_result(self, response: requests.Response) -> FetchResult:
+        """Read a streamed response into a FetchResult and release its connection."""
+        try:
+            response.raise_for_status()
+            text, encoding = self._read_body(response)
+        finally:
+            response.close()
+
+        return FetchResult(
+            url=response.url,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            text=text,
+            encoding=encoding
+        )
+
+    def _store(self, url: str, response: requests.Response) -> FetchResult:
+        """Convert a response and store it in the cache if allowed.
+
+        A response that may not be stored also removes any older entry, so
+        the server's latest Cache-Control answer decides what stays on disk.
+        """
+        result = self._to_result(response)
+        lifetime = _freshness_lifetime(response.headers)
+        if lifetime is not None and response.status_code == 200:
+            meta = {
+                'url': result.url,
+                'status_code': result.status_code,
+                'encoding': result.encoding,
+                'headers': self._cacheable_headers(response.headers),
+                'expires': time.time() + lifetime
+            }
+            self.cache.put(url, result.text.encode('utf-8'), meta)
+        else:
+            self.cache.delete(url)
+        return result
+
+    def _cacheable_headers(self, headers) -> Dict[str, str]:
+        """Select the response headers worth persisting."""
+        return {name: headers[name] for name in _CACHED_HEADERS if name in headers}
+
+    def _result_from_cache(self, body: bytes, meta: Dict[str, Any]) -> FetchResult:
+        """Build a FetchResult from a cache entry."""
+        return FetchResult(
+            url=meta['url'],
+            status_code=meta['status_code'],
+            headers=meta['headers'],
+            text=body.decode('utf-8'),
+            encoding=meta.get('encoding'),
+            from_cache=True
+        )
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Get HTTP cache statistics.
+
+        Returns:
+            Dictionary of cache counters, empty if caching is disabled
+        """
+        return self.cache.stats() if self.cache else {}
+
+    def close(self):
+        """Close all pooled connections."""
+        with self._lock:
+            self._last_used.clear()
+        self.session.close()
+
+
+class BatchFetchResult:
+    """Outcome of one URL in a batch fetch."""
+
+    def __init__(self, url: str, value: Any = None, error: Optional[Exception] = None, elapsed: float = 0.0):
+        """Initialize batch fetch result.
+
+        Args:
+            url: Requested URL
+            value: Return value of the fetch function, None on failure
+            error: Exception raised by the fetch, or a TimeoutError past the deadline
+            elapsed: Seconds from the start of the fetch to completion
+        """
+        self.url = url
+        self.value = value
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        """Whether the fetch completed without error."""
+        return self.error is None
+
+
+async def fetch_many(
+    urls: Iterable[str],
+    fetch_fn: Callable[[str], Any],
+    max_concurrency: int = 8,
+    per_host_limit: int = 2,
+    timeout: float = 30
+) -> AsyncIterator[BatchFetchResult]:
+    """Fetch many URLs concurrently and yield results as they complete.
+
+    The blocking fetch function runs on a worker thread pool, so it keeps
+    using the shared connection pools and HTTP cache. Total concurrency is
+    capped by max_concurrency and each host gets at most per_host_limit
+    requests in flight. A request's deadline starts when a worker thread
+    picks it up, so time spent waiting behind abandoned fetches does not
+    count against it.
+
+    Args:
+        urls: URLs to fetch
+        fetch_fn: Blocking function fetching a single URL
+        max_concurrency: Maximum requests in flight overall
+        per_host_limit: Maximum requests in flight per host
+        timeout: Per-request deadline in seconds, from the start of the fetch
+
+    Yields:
+        BatchFetchResult for each URL, in completion order
+    """
+    loop = asyncio.get_running_loop()
+    global_limit = asyncio.Semaphore(max_concurrency)
+    host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    async def fetch_one(url: str) -> BatchFetchResult:
+        parsed = urlparse(url if url.startswith(('http://', 'https://')) else 'https://' + url)
+        host = (parsed.hostname or '').lower()
+        host_limit = host_limits.setdefault(host, asyncio.Semaphore(per_host_limit))
+
+        async with host_limit, global_limit:
+            started = asyncio.Event()
+
+            def run():
+                loop.call_soon_threadsafe(started.set)
+                return fetch_fn(url)
+
+            future = loop.run_in_executor(executor, run)
+            # Threads still busy with fetches past their deadline delay the start
+            await started.wait()
+            start = time.monotonic()
+            try:
+                value = await asyncio.wait_for(future, timeout)
+                return BatchFetchResult(url, value=value, elapsed=time.monotonic() - start)
+            except asyncio.TimeoutError:
+                logger.warning(f"Batch fetch of {url} exceeded {timeout}s deadline")
+                error = TimeoutError(f"Deadline of {timeout}s exceeded")
+                return BatchFetchResult(url, error=error, elapsed=time.monotonic() - start)
+            except Exception as e:
+                logger.warning(f"Batch fetch of {url} failed: {e}")
+                return BatchFetchResult(url, error=e, elapsed=time.monotonic() - start)
+
+    executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="epollo-fetch")
+    tasks = [asyncio.ensure_future(fetch_one(url)) for url in urls]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Fetches abandoned past their deadline finish on their own socket timeout
+        executor.shutdown(wait=False)
+
+
+# Global instance shared by every fetching code path
+_fetcher_instance: Optional[HTTPFetcher] = None
+_fetcher_lock = threading.Lock()
+
+
+def get_fetcher(config=None) -> HTTPFetcher:
+    """Get or create the shared HTTP fetcher.
+
+    Args:
+        config: Optional Config instance providing pool settings
+
+    Returns:
+        HTTPFetcher instance
+    """
+    global _fetcher_instance
+    with _fetcher_lock:
+        if _fetcher_instance is None:
+            if config is None:
+                from .config import Config
+                config = Config()
+            cache = None
+            if config.http_cache_enabled:
+                cache = SQLiteCache(config.http_cache_path, max_bytes=config.http_cache_max_bytes)
+            _fetcher_instance = HTTPFetcher(
+                pool_connections=config.http_pool_connections,
+                pool_maxsize=config.http_pool_maxsize,
+                idle_timeout=config.http_idle_timeout,
+                max_retries=config.http_max_retries,
+                cache=cache,
+                max_body_bytes=config.http_max_body_bytes
+            )
+        return _fetcher_instance
@@ -0,0 +1,190 @@
+"""Split HTML pages into removable content blocks."""
+
+import re
+import logging
+from html.parser import HTMLParser
+from typing import Optional, List, Union
+
+logger = logging.getLogger(__name__)
+
+# Elements that can form a content block on their own
+BLOCK_TAGS = frozenset([
+    'article', 'aside', 'section', 'div', 'main', 'header', 'footer', 'nav',
+    'p', 'ul', 'ol', 'li', 'dl', 'table', 'form', 'figure', 'blockquote',
+    'pre', 'details', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'
+])
+
+# Elements whose text is never shown to the reader
+SKIP_TEXT_TAGS = frozenset(['script', 'style', 'noscript', 'template'])
+
+
+class ContentBlock:
+    """A contiguous, well-formed element of a page that can be removed as a unit."""
+
+    def __init__(self, index: int, tag: str, start: int, end: int, text: str):
+        """Initialize content block.
+
+        Args:
+            index: Position of the block in document order
+            tag: Element tag name
+            start: Offset of the element's start tag in the source HTML
+            end: Offset just past the element's end tag
+            text: Normalized visible text of the element
+        """
+        self.index = index
+        self.tag = tag
+        self.start = start
+        self.end = end
+        self.text = text
+
+
+class _Node:
+    """Block-level element tracked while parsing."""
+
+    def __init__(self, tag: str, start: int):
+        self.tag = tag
+        self.start = start
+        self.end: Optional[int] = None
+        self.parts: List[Union[str, "_Node"]] = []
+        self._text: Optional[str] = None
+
+    def text(self) -> str:
+        if self._text is None:
+            pieces = [part if isinstance(part, str) else part.text() for part in self.parts]
+            self._text = ' '.join(piece for piece in pieces if piece)
+        return self._text
+
+    def children(self) -> List["_Node"]:
+        return [part for part in self.parts if isinstance(part, _Node)]
+
+
+class _BlockParser(HTMLParser):
+    """Builds a tree of block-level elements with their source offsets."""
+
+    def __init__(self, html: str):
+        super().__init__(convert_charrefs=True)
+        self.html = html
+        self.line_starts = [0] + [match.end() for match in re.finditer('\n', html)]
+        self.root = _Node('#document', 0)
+        self.stack: List[_Node] = [self.root]
+        self.skip_depth = 0
+
+    def _offset(self) -> int:
+        line, column = self.getpos()
+        return self.line_starts[line - 1] + column
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TEXT_TAGS:
+            self.skip_depth += 1
+        elif tag in BLOCK_TAGS:
+            node = _Node(tag, self._offset())
+            self.stack[-1].parts.append(node)
+            self.stack.append(node)
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TEXT_TAGS:
+            self.skip_depth = max(0, self.skip_depth - 1)
+            return
+        if tag not in BLOCK_TAGS:
+            return
+        # Close the innermost open element with this tag; elements left open
+        # inside it were never closed explicitly and stay unremovable
+        for depth in range(len(self.stack) - 1, 0, -1):
+            if self.stack[depth].tag == tag:
+                node = self.stack[depth]
+                start = self._offset()
+                close = self.html.find('>', start)
+                node.end = close + 1 if close != -1 else len(self.html)
+                del self.stack[depth:]
+                return
+
+    def handle_data(self, data):
+        if self.skip_depth:
+            return
+        text = ' '.join(data.split())
+        if text:
+            self.stack[-1].parts.append(text)
+
+
+def extract_blocks(html: str, max_chars: int = 1500, min_chars: int = 20) -> List[ContentBlock]:
+    """Split a page into non-overlapping content blocks.
+
+    The page is walked top-down: an element whose text fits in max_chars
+    becomes one block, larger elements are split into their block-level
+    children. Only explicitly closed elements become blocks, so removing a
+    block's source span always leaves well-formed HTML behind.
+
+    Args:
+        html: HTML content
+        max_chars: Maximum text length of a single block
+        min_chars: Minimum text length for an element to be worth classifying
+
+    Returns:
+        List of ContentBlock in document order
+    """
+    parser = _BlockParser(html)
+    try:
+        parser.feed(html)
+        parser.close()
+    except Exception as e:
+        logger.warning(f"HTML parsing stopped early while extracting blocks: {e}")
+
+    blocks: List[ContentBlock] = []
+
+    def visit(node: _Node):
+        text = node.text()
+        if len(text) < min_chars:
+            return
+        children = node.children()
+        if node.end is not None and (len(text) <= max_chars or not children):
+            blocks.append(ContentBlock(len(blocks), node.tag, node.start, node.end, text))
+            return
+        for child in children:
+            visit(child)
+
+    for child in parser.root.children():
+        visit(child)
+    return blocks
+
+
+def remove_blocks(html: str, blocks: List[ContentBlock]) -> str:
+    """Remove the source spans of the given blocks from a page.
+
+    Args:
+        html: HTML content the blocks were extracted from
+        blocks: Blocks to remove
+
+    Returns:
+        HTML with the blocks cut out
+    """
+    pieces = []
+    position = 0
+    for block in sorted(blocks, key=lambda b: b.start):
+        if block.start < position:
+            continue
+        pieces.append(html[position:block.start])
+        position = block.end
+    pieces.append(html[position:])
+    return ''.join(pieces)
+
+
+def annotate_blocks(html: str, blocks: List[ContentBlock], attribute: str = "data-epollo-block") -> str:
+    """Tag each block's start tag with its index so it can be found in the DOM.
+
+    Args:
+        html: HTML content the blocks were extracted from
+        blocks: Blocks to tag
+        attribute: Attribute name receiving the block index
+
+    Returns:
+        HTML with the attribute added to every block element
+    """
+    pieces = []
+    position = 0
+    for block in sorted(blocks, key=lambda b: b.start):
+        insert_at = block.start + 1 + len(block.tag)
+        pieces.append(html[position:insert_at])
+        pieces.append(f' {attribute}="{block.index}"')
+        position = insert_at
+    pieces.append(html[position:])
+    return ''.join(pieces)
@@ -0,0 +1,349 @@
+"""Single-pass HTML processing: media stripping, section splitting and text extraction."""
+
+import re
+import logging
+from html import unescape
+from typing import Optional, List, Dict
+
+logger = logging.getLogger(__name__)
+
+# Media elements removed together with everything inside them
+MEDIA_CONTAINER_TAGS = frozenset(['picture', 'video', 'iframe', 'object', 'canvas'])
+
+# Media elements without content
+MEDIA_VOID_TAGS = frozenset(['img', 'source', 'embed'])
+
+HEADING_TAGS = frozenset(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+
+# Elements whose content is raw text that is never shown to the reader
+RAW_TEXT_TAGS = frozenset(['script', 'style'])
+
+# Elements whose text is used when a page has no headings, in order of preference
+FALLBACK_CONTAINERS = ('article', 'main', 'body')
+
+# Sections are capped like the summary view expects
+MAX_SECTIONS = 10
+
+# One token per match: a comment, a start/end tag (quoted attribute values may
+# contain '>'), or other markup such as doctypes and processing instructions
+_TOKEN_RE = re.compile(
+    r'<!--.*?-->'
+    r'|<(/?)([a-zA-Z][a-zA-Z0-9:-]*)((?:[^>"\']|"[^"]*"|\'[^\']*\')*)>'
+    r'|<[!?][^>]*>',
+    re.DOTALL
+)
+_RAW_TEXT_END_RE = {tag: re.compile(rf'</{tag}\s*>', re.IGNORECASE) for tag in RAW_TEXT_TAGS}
+_STYLE_ATTR_RE = re.compile(r'''\sstyle\s*=\s*(?:"([^"]*)"|'([^']*)')''', re.IGNORECASE)
+_BACKGROUND_URL_RE = re.compile(r'background(?:-image)?\s*:\s*[^;]*url\([^)]*\)[^;]*;?', re.IGNORECASE)
+
+
+class PageContent:
+    """Everything extracted from a page in one traversal."""
+
+    def __init__(
+        self,
+        html: str,
+        text: str,
+        sections: List[Dict[str, str]],
+        head_offset: int,
+        body_end_offset: Optional[int]
+    ):
+        """Initialize page content.
+
+        Args:
+            html: Page HTML, with media removed if requested
+            text: Visible text of the whole page
+            sections: List of dictionaries with 'title' and 'content' keys
+            head_offset: Offset in html where head content can be injected
+            body_end_offset: Offset in html of the closing body tag, if any
+        """
+        self.html = html
+        self.text = text
+        self.sections = sections
+        self.head_offset = head_offset
+        self.body_end_offset = body_end_offset
+
+
+def _collapse(pieces: List[str]) -> str:
+    """Join raw text pieces, decode entities and normalize whitespace."""
+    return ' '.join(unescape(' '.join(pieces)).split())
+
+
+def _strip_background(style: str) -> str:
+    """Remove background declarations that load an image from a style value."""
+    style = _BACKGROUND_URL_RE.sub('', style)
+    return re.sub(r';+', ';', style).strip('; ')
+
+
+def _rewrite_style_attr(tag_text: str) -> str:
+    """Drop background images from the style attribute of a start tag."""
+    def replace(match):
+        quote = '"' if match.group(1) is not None else "'"
+        style = _strip_background(match.group(1) if match.group(1) is not None else match.group(2))
+        return f' style={quote}{style}{quote}' if style else ''
+    return _STYLE_ATTR_RE.sub(replace, tag_text)
+
+
+class _PagePass:
+    """State of one scan over a page.
+
+    Kept source is copied lazily from `cursor` up to each edit, so the output
+    is built from a handful of large slices rather than per-token strings.
+    """
+
+    def __init__(self, html: str, strip_media: bool):
+        self.html = html
+        self.strip_media = strip_media
+
+        # Output assembly
+        self.out: List[str] = []
+        self.out_len = 0
+        self.cursor = 0
+        self.drop_tag: Optional[str] = None
+        self.drop_depth = 0
+        self.drop_start_tag_end = 0
+        self.head_offset: Optional[int] = None
+        self.head_close_offset: Optional[int] = None
+        self.body_open_offset: Optional[int] = None
+        self.body_end_offset: Optional[int] = None
+
+        # Text buckets; only the first element of each fallback container is used
+        self.text: List[str] = []
+        self.heading_depth = 0
+        self.title: List[str] = []
+        self.sections: List[Dict[str, List[str]]] = []
+        self.containers: Dict[str, List[str]] = {}
+        self.container_depth: Dict[str, int] = {tag: 0 for tag in FALLBACK_CONTAINERS}
+        self.containers_done = set()
+
+    def run(self):
+        html = self.html
+        search = _TOKEN_RE.search
+        position = 0
+        while True:
+            match = search(html, position)
+            if match is None:
+                self.data(html[position:])
+                break
+            if match.start() > position:
+                self.data(html[position:match.start()])
+            position = match.end()
+
+            tag = match.group(2)
+            if tag is None:
+                continue
+            tag = tag.lower()
+            if match.group(1):
+                self.end_tag(tag, match.start(), position)
+                continue
+
+            self_closing = match.group(3).rstrip().endswith('/')
+            self.start_tag(tag, match, self_closing)
+            if tag in RAW_TEXT_TAGS and not self_closing:
+                # Skip straight to the end of a script or style body
+                close = _RAW_TEXT_END_RE[tag].search(html, position)
+                if close is None:
+                    break
+                self.end_tag(tag, close.start(), close.end())
+                position = close.end()
+
+    def emit(self, text: str):
+        if text:
+            self.out.append(text)
+            self.out_len += len(text)
+
+    def flush(self, upto: int, in_style: bool = False):
+        """Copy source up to an offset, unless inside a dropped element."""
+        if upto <= self.cursor:
+            return
+        if self.drop_tag is None:
+            chunk = self.html[self.cursor:upto]
+            if in_style:
+                chunk = _BACKGROUND_URL_RE.sub('', chunk)
+            self.emit(chunk)
+        self.cursor = upto
+
+    def cut(self, start: int, end: int, replacement: str = ''):
+        """Replace a source span in the output."""
+        self.flush(start)
+        self.emit(replacement)
+        self.cursor = end
+
+    def start_tag(self, tag: str, match, self_closing: bool):
+        start, end = match.span()
+        if self.strip_media:
+            if self.drop_tag is not None:
+                if tag == self.drop_tag and not self_closing:
+                    self.drop_depth += 1
+            elif tag in MEDIA_VOID_TAGS or (tag in MEDIA_CONTAINER_TAGS and self_closing):
+                self.cut(start, end)
+            elif tag in MEDIA_CONTAINER_TAGS:
+                self.flush(start)
+                self.drop_tag = tag
+                self.drop_depth = 1
+                self.drop_start_tag_end = end
+            else:
+                if 'url(' in match.group(3):
+                    self.cut(start, end, _rewrite_style_attr(match.group(0)))
+                if tag == 'head' and self.head_offset is None:
+                    self.flush(end)
+                    self.head_offset = self.out_len
+                elif tag == 'body' and self.body_open_offset is None:
+                    self.flush(start)
+                    self.body_open_offset = self.out_len
+
+        if self_closing:
+            return
+        if tag in HEADING_TAGS:
+            if self.heading_depth == 0:
+                self.title = []
+            self.heading_depth += 1
+        elif tag in self.container_depth and tag not in self.containers_done:
+            self.container_depth[tag] += 1
+            self.containers.setdefault(tag, [])
+
+    def end_tag(self, tag: str, start: int, end: int):
+        if self.strip_media:
+            if self.drop_tag is not None:
+                if tag == self.drop_tag:
+                    self.drop_depth -= 1
+                    if self.drop_depth == 0:
+                        self.drop_tag = None
+                        self.cursor = end
+            elif tag in MEDIA_VOID_TAGS:
+                self.cut(start, end)
+            elif tag == 'style':
+                self.flush(start, in_style=True)
+            elif tag == 'head' and self.head_close_offset is None:
+                self.flush(start)
+                self.head_close_offset = self.out_len
+            elif tag == 'body' and self.body_end_offset is None:
+                self.flush(start)
+                self.body_end_offset = self.out_len
+
+        if tag in HEADING_TAGS:
+            if self.heading_depth:
+                self.heading_depth -= 1
+                if self.heading_depth == 0:
+                    self.sections.append({'title': self.title, 'content': []})
+        elif self.container_depth.get(tag):
+            self.container_depth[tag] -= 1
+            if self.container_depth[tag] == 0:
+                self.containers_done.add(tag)
+
+    def data(self, text: str):
+        if not text:
+            return
+        self.text.append(text)
+        if self.heading_depth:
+            self.title.append(text)
+        elif self.sections:
+            self.sections[-1]['content'].append(text)
+        for tag, depth in self.container_depth.items():
+            if depth:
+                self.containers[tag].append(text)
+
+    def finish(self) -> str:
+        """Copy the remaining source and return the output HTML.
+
+        An unclosed media element only loses its start tag; past that point
+        the source is copied as is.
+        """
+        if self.drop_tag is not None:
+            self.drop_tag = None
+            self.cursor = self.drop_start_tag_end
+        self.flush(len(self.html))
+        return ''.join(self.out)
+
+
+def _build_sections(page_pass: _PagePass) -> List[Dict[str, str]]:
+    """Turn collected text buckets into summary sections."""
+    sections = []
+    for bucket in page_pass.sections:
+        title = ' '.join(unescape(''.join(bucket['title'])).split())
+        content = _collapse(bucket['content'])
+        if title and content:
+            sections.append({'title': title, 'content': content})
+            if len(sections) == MAX_SECTIONS:
+                break
+
+    # If no headings found, fall back to article, main or body text
+    if not sections:
+        for tag in FALLBACK_CONTAINERS:
+            if page_pass.containers.get(tag):
+                content = _collapse(page_pass.containers[tag])
+                if len(content) > 50:
+                    title = content[:100] + "..." if len(content) > 100 else content
+                    sections.append({'title': title, 'content': content})
+                break
+
+    return sections
+
+
+def process_page(html: str, strip_media: bool = False) -> PageContent:
+    """Process a page in a single linear pass.
+
+    Args:
+        html: HTML content
+        strip_media: Whether to remove images, videos, embeds and background images
+
+    Returns:
+        PageContent with the (optionally stripped) HTML, page text and sections
+    """
+    page_pass = _PagePass(html, strip_media)
+    try:
+        page_pass.run()
+    except Exception as e:
+        logger.warning(f"HTML processing stopped early: {e}")
+    output = page_pass.finish() if strip_media else html
+
+    # Head content goes after <head>, else before </head>, else before <body>
+    head_offset = 0
+    for offset in (page_pass.head_offset, page_pass.head_close_offset, page_pass.body_open_offset):
+        if offset is not None:
+            head_offset = offset
+            break
+
+    return PageContent(
+        html=output,
+        text=_collapse(page_pass.text),
+        sections=_build_sections(page_pass),
+        head_offset=head_offset,
+        body_end_offset=page_pass.body_end_offset
+    )
+
+
+def extract_text(html: str) -> str:
+    """Extract visible text from HTML.
+
+    Args:
+        html: HTML content
+
+    Returns:
+        Whitespace-normalized plain text
+    """
+    return process_page(html).text
+
+
+def extract_sections(html: str) -> List[Dict[str, str]]:
+    """Split a page into heading-titled sections.
+
+    Args:
+        html: HTML content
+
+    Returns:
+        List of dictionaries with 'title' and 'content' keys
+    """
+    return process_page(html).sections
+
+
+def strip_media(html: str) -> PageContent:
+    """Remove images, videos, embeds and background images from a page.
+
+    Args:
+        html: HTML content
+
+    Returns:
+        PageContent whose html has media removed
+    """
+    return process_page(html, strip_media=True)
@@ -0,0 +1,70 @@
+"""Single entry point for text generation requests to Ollama."""
+
+import time
+import logging
+from typing import Optional, Dict, Any
+from .navigation import CancelToken
+from .llm_scheduler import Priority, get_scheduler
+from .model_manager import get_model_manager
+from .ollama_client import OllamaClient, get_ollama_client
+
+logger = logging.getLogger(__name__)
+
+
+def generate(
+    model: str,
+    prompt: str,
+    client: Optional[OllamaClient] = None,
+    cancel_token: Optional[CancelToken] = None,
+    priority: Optional[Priority] = None,
+    source: str = "llm",
+    deadline: Optional[float] = None,
+    **kwargs
+) -> Dict[str, Any]:
+    """Generate a completion, abandoning it as soon as it is cancelled.
+
+    The request first waits for a slot from the process-wide LLMScheduler and
+    carries the model's keep-alive from the ModelManager. The answer is
+    streamed so cancellation is checked between chunks; closing the stream
+    drops the connection and Ollama stops generating for it. For interactive
+    requests a timeout covers the time spent queued as well as generating;
+    background and batch requests queue as long as their class's max_wait
+    allows and their timeout starts once they are sent.
+
+    Args:
+        model: Model name
+        prompt: Prompt text
+        client: Ollama client to use (shared client for config.yaml's server if None)
+        cancel_token: Token whose cancellation aborts the request
+        priority: Scheduling class (defaults to the token's, else interactive)
+        source: Caller name, for fair queuing and metrics
+        deadline: time.monotonic() value after which a still-queued request is dropped
+        **kwargs: Extra arguments for generate (options, format, system, ...);
+            timeout is a wall-clock limit in seconds on the whole request
+
+    Returns:
+        Dictionary with the full 'response' text, the final chunk's statistics
+        and request timing
+
+    Raises:
+        NavigationCancelled: If the token was cancelled before or during generation
+        DeadlineExceeded: If the request could not start before its deadline
+        TimeoutError: If the answer was not complete within the timeout
+    """
+    if cancel_token is not None:
+        cancel_token.raise_if_cancelled()
+    if priority is None:
+        priority = cancel_token.priority if cancel_token is not None else Priority.INTERACTIVE
+    kwargs.setdefault('keep_alive', get_model_manager().keep_alive_for(model))
+    timeout = kwargs.get('timeout')
+    queued_timeout = timeout is not None and priority == Priority.INTERACTIVE
+    if queued_timeout:
+        expires = time.monotonic() + timeout
+        deadline = expires if deadline is None else min(deadline, expires)
+
+    with get_scheduler().slot(priority, source, deadline, cancel_token):
+        if queued_timeout:
+            kwargs['timeout'] = max(0.0, expires - time.monotonic())
+        return (client or get_ollama_client()).generate(
+            model, prompt, stream=True, cancel_token=cancel_token, **kwargs
+        )
@@ -0,0 +1,282 @@
+"""Process-wide scheduler that every Ollama request goes through."""
+
+import time
+import logging
+import threading
+from enum import IntEnum
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Optional, Dict, Any
+from .navigation import CancelToken, NavigationCancelled
+
+logger = logging.getLogger(__name__)
+
+# How often a queued request re-checks its cancel token
+_CANCEL_POLL_INTERVAL = 0.1
+
+
+class Priority(IntEnum):
+    """Scheduling classes; lower values are served first."""
+
+    INTERACTIVE = 0  # Work the user is waiting for (filtering, summary view)
+    BACKGROUND = 1   # Speculative work for the user (prefetching)
+    BATCH = 2        # Unattended jobs (digests, OCR/VLM scripts)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a request could not start before its deadline."""
+
+
+def _normalize_max_wait(max_wait: Optional[Dict[Any, Optional[float]]]) -> Dict[Priority, Optional[float]]:
+    """Key queue wait limits by Priority, accepting class names as in config.yaml."""
+    normalized = {}
+    for key, seconds in (max_wait or {}).items():
+        priority = Priority[key.upper()] if isinstance(key, str) else Priority(key)
+        normalized[priority] = seconds
+    return normalized
+
+
+class _Ticket:
+    """A request waiting for a slot."""
+
+    __slots__ = ('priority', 'source', 'deadline', 'enqueued', 'granted', 'dropped')
+
+    def __init__(self, priority: Priority, source: str, deadline: Optional[float]):
+        self.priority = priority
+        self.source = source
+        self.deadline = deadline
+        self.enqueued = time.monotonic()
+        self.granted = False
+        self.dropped = False
+
+
+class LLMScheduler:
+    """Bounds concurrent Ollama requests and decides which waiting one runs next.
+
+    Higher priority classes always go first, and some slots are kept for
+    interactive requests so background and batch work can never occupy all of
+    them. Within a class, sources (filter, summary, ocr, ...) are served round
+    robin so one busy caller cannot starve the others. A request still queued
+    at its deadline is dropped instead of being sent late.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 2,
+        reserved_interactive: int = 1,
+        max_wait: Optional[Dict[Any, Optional[float]]] = None
+    ):
+        """Initialize scheduler.
+
+        Args:
+            max_concurrent: Requests allowed in flight at once
+            reserved_interactive: Slots only interactive requests may use
+            max_wait: Default seconds a request of each class may wait in the
+                queue, keyed by Priority or class name (None or missing means no limit)
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.reserved_interactive = min(max(0, reserved_interactive), self.max_concurrent - 1)
+        self.max_wait = _normalize_max_wait(max_wait)
+        self._queues: Dict[Priority, "OrderedDict[str, deque]"] = {p: OrderedDict() for p in Priority}
+        self._running = 0
+        self._condition = threading.Condition()
+        self._counters = {
+            name: {p.name.lower(): 0 for p in Priority}
+            for name in ('granted', 'dropped', 'cancelled', 'max_queued')
+        }
+        self._wait_total = {p.name.lower(): 0.0 for p in Priority}
+
+    def configure(
+        self,
+        max_concurrent: Optional[int] = None,
+        reserved_interactive: Optional[int] = None,
+        max_wait: Optional[Dict[Any, Optional[float]]] = None
+    ):
+        """Change limits at runtime; requests already running are unaffected.
+
+        Args:
+            max_concurrent: Requests allowed in flight at once
+            reserved_interactive: Slots only interactive requests may use
+            max_wait: Default queue wait limits per class
+        """
+        with self._condition:
+            if max_concurrent is not None:
+                self.max_concurrent = max(1, max_concurrent)
+            if reserved_interactive is not None:
+                self.reserved_interactive = max(0, reserved_interactive)
+            self.reserved_interactive = min(self.reserved_interactive, self.max_concurrent - 1)
+            if max_wait is not None:
+                self.max_wait = _normalize_max_wait(max_wait)
+            self._dispatch()
+
+    def _limit(self, priority: Priority) -> int:
+        """Slots a request of the given class may occupy."""
+        if priority == Priority.INTERACTIVE:
+            return self.max_concurrent
+        return self.max_concurrent - self.reserved_interactive
+
+    def _depth(self, priority: Priority) -> int:
+        return sum(len(waiting) for waiting in self._queues[priority].values())
+
+    def _dispatch(self):
+        """Grant free slots to queued tickets. Caller holds the condition."""
+        now = time.monotonic()
+        granted = False
+        for priority in Priority:
+            queue = self._queues[priority]
+            while queue and self._running < self._limit(priority):
+                # Round robin: take the head of the first source, then move it to the back
+                source, waiting = next(iter(queue.items()))
+                ticket = waiting.popleft()
+                if waiting:
+                    queue.move_to_end(source)
+                else:
+                    del queue[source]
+                if ticket.deadline is not None and now > ticket.deadline:
+                    ticket.dropped = True
+                    granted = True
+                    continue
+                ticket.granted = True
+                self._running += 1
+                granted = True
+            if queue:
+                # Lower classes never overtake a higher one that is still waiting
+                break
+        if granted:
+            self._condition.notify_all()
+
+    def _remove(self, ticket: _Ticket):
+        """Take a ticket out of its queue. Caller holds the condition."""
+        queue = self._queues[ticket.priority]
+        waiting = queue.get(ticket.source)
+        if waiting is not None:
+            try:
+                waiting.remove(ticket)
+            except ValueError:
+                pass
+            if not waiting:
+                del queue[ticket.source]
+
+    def acquire(
+        self,
+        priority: Priority = Priority.INTERACTIVE,
+        source: str = "llm",
+        deadline: Optional[float] = None,
+        cancel_token: Optional[CancelToken] = None
+    ):
+        """Block until a slot is free for this request.
+
+        Args:
+            priority: Scheduling class
+            source: Caller name; requests are shared fairly between sources
+            deadline: time.monotonic() value after which the request is dropped
+                (defaults to the class's max_wait)
+            cancel_token: Token whose cancellation withdraws the request
+
+        Raises:
+            DeadlineExceeded: If no slot became free before the deadline
+            NavigationCancelled: If the token was cancelled while waiting
+        """
+        priority = Priority(priority)
+        name = priority.name.lower()
+        if deadline is None and self.max_wait.get(priority) is not None:
+            deadline = time.monotonic() + self.max_wait[priority]
+
+        with self._condition:
+            ticket = _Ticket(priority, source, deadline)
+            self._queues[priority].setdefault(source, deque()).append(ticket)
+            self._counters['max_queued'][name] = max(self._counters['max_queued'][name], self._depth(priority))
+            self._dispatch()
+            while not ticket.granted:
+                if ticket.dropped or (deadline is not None and time.monotonic() > deadline):
+                    self._remove(ticket)
+                    self._counters['dropped'][name] += 1
+                    logger.warning(f"Dropped {name} {source} request after {time.monotonic() - ticket.enqueued:.1f}s in queue")
+                    raise DeadlineExceeded(f"{source} request waited past its deadline")
+                if cancel_token is not None and cancel_token.cancelled:
+                    self._remove(ticket)
+                    self._counters['cancelled'][name] += 1
+                    raise NavigationCancelled()
+                timeout = _CANCEL_POLL_INTERVAL if cancel_token is not None else None
+                if deadline is not None:
+                    remaining = max(0.0, deadline - time.monotonic())
+                    timeout = remaining if timeout is None else min(timeout, remaining)
+                self._condition.wait(timeout)
+
+            waited = time.monotonic() - ticket.enqueued
+            self._counters['granted'][name] += 1
+            self._wait_total[name] += waited
+        if waited > 1:
+            logger.debug(f"{name} {source} request waited {waited:.1f}s for a slot")
+
+    def release(self):
+        """Free the slot taken by acquire()."""
+        with self._condition:
+            self._running -= 1
+            self._dispatch()
+
+    @contextmanager
+    def slot(
+        self,
+        priority: Priority = Priority.INTERACTIVE,
+        source: str = "llm",
+        deadline: Optional[float] = None,
+        cancel_token: Optional[CancelToken] = None
+    ):
+        """Hold a slot for the duration of a with block.
+
+        Args:
+            priority: Scheduling class
+            source: Caller name
+            deadline: time.monotonic() value after which the request is dropped
+            cancel_token: Token whose cancellation withdraws the request
+        """
+        self.acquire(priority, source, deadline, cancel_token)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get queue depths and counters.
+
+        Returns:
+            Dictionary with running/queued requests and per-class counters
+        """
+        with self._condition:
+            queued = {p.name.lower(): self._depth(p) for p in Priority}
+            avg_wait = {
+                name: (self._wait_total[name] / count if count else 0.0)
+                for name, count in self._counters['granted'].items()
+            }
+            return {
+                'running': self._running,
+                'max_concurrent': self.max_concurrent,
+                'queued': queued,
+                'avg_wait': avg_wait,
+                **{name: dict(values) for name, values in self._counters.items()}
+            }
+
+
+# Global instance shared by every Ollama caller in the process
+_scheduler: Optional[LLMScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> LLMScheduler:
+    """Get or create the process-wide scheduler.
+
+    Returns:
+        LLMScheduler instance
+    """
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            from .config import Config
+            config = Config()
+            _scheduler = LLMScheduler(
+                max_concurrent=config.llm_max_concurrent,
+                reserved_interactive=config.llm_reserved_interactive,
+                max_wait=config.llm_max_wait
+            )
+        return _scheduler
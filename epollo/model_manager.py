@@ -0,0 +1,239 @@
+"""Ollama model residency: preloading, keep-alive per model and staged pipelines."""
+
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, List, Tuple, Callable, Union, Iterable
+from .llm_scheduler import Priority
+from .ollama_client import get_ollama_client
+
+logger = logging.getLogger(__name__)
+
+KeepAlive = Union[str, float, int]
+
+
+class ModelManager:
+    """Keeps the models a stage needs loaded in Ollama and records load timings.
+
+    Ollama unloads a model after its keep-alive expires, or earlier when
+    another model needs the memory. The manager gives each model its own
+    keep-alive, loads models ahead of their first request, and runs pipeline
+    work grouped per model so weights are loaded once per stage instead of
+    once per request.
+    """
+
+    def __init__(
+        self,
+        api_url: str = "http://localhost:11434",
+        default_keep_alive: KeepAlive = "5m",
+        keep_alive: Optional[Dict[str, KeepAlive]] = None
+    ):
+        """Initialize model manager.
+
+        Args:
+            api_url: Ollama API base URL
+            default_keep_alive: Keep-alive for models without their own setting
+                (Ollama duration string like "10m", seconds, or -1 to keep loaded)
+            keep_alive: Per-model keep-alive overrides
+        """
+        self.api_url = api_url
+        self.default_keep_alive = default_keep_alive
+        self.keep_alive = dict(keep_alive or {})
+        self._client = get_ollama_client(api_url)
+        self._lock = threading.Lock()
+        self._timings: Dict[str, Dict[str, float]] = {}
+
+    def configure(self, default_keep_alive: Optional[KeepAlive] = None,
+                  keep_alive: Optional[Dict[str, KeepAlive]] = None):
+        """Change keep-alive settings; applies to requests sent afterwards.
+
+        Args:
+            default_keep_alive: Keep-alive for models without their own setting
+            keep_alive: Per-model keep-alive overrides
+        """
+        if default_keep_alive is not None:
+            self.default_keep_alive = default_keep_alive
+        if keep_alive is not None:
+            self.keep_alive = dict(keep_alive)
+
+    def keep_alive_for(self, model: str) -> KeepAlive:
+        """Get the keep-alive to send with requests for a model.
+
+        Args:
+            model: Model name
+
+        Returns:
+            Keep-alive value understood by Ollama
+        """
+        return self.keep_alive.get(model, self.default_keep_alive)
+
+    def _record(self, model: str, action: str, seconds: float):
+        with self._lock:
+            timing = self._timings.setdefault(model, {
+                'loads': 0, 'load_seconds': 0.0, 'last_load_seconds': 0.0,
+                'unloads': 0, 'unload_seconds': 0.0
+            })
+            timing[f'{action}s'] += 1
+            timing[f'{action}_seconds'] += seconds
+            if action == 'load':
+                timing['last_load_seconds'] = seconds
+
+    def load(self, model: str, keep_alive: Optional[KeepAlive] = None,
+             priority: Priority = Priority.BACKGROUND) -> float:
+        """Load a model into memory without generating anything.
+
+        Args:
+            model: Model name
+            keep_alive: Keep-alive override (defaults to the model's setting)
+            priority: Scheduling class of the load request
+
+        Returns:
+            Seconds Ollama spent loading (0 if it was already resident)
+        """
+        if keep_alive is None:
+            keep_alive = self.keep_alive_for(model)
+        # llm imports this module for keep-alive settings
+        from . import llm
+        start = time.monotonic()
+        response = llm.generate(model, "", client=self._client, priority=priority,
+                                source="model_manager", keep_alive=keep_alive)
+        load_duration = response.get('load_duration')
+        seconds = load_duration / 1e9 if load_duration is not None else time.monotonic() - start
+        self._record(model, 'load', seconds)
+        logger.info(f"Model {model} ready in {seconds:.2f}s (keep_alive={keep_alive})")
+        return seconds
+
+    def unload(self, model: str, priority: Priority = Priority.BACKGROUND) -> float:
+        """Ask Ollama to free a model's memory now.
+
+        The request queues in the scheduler like any other, so it counts
+        against the concurrency limit.
+
+        Args:
+            model: Model name
+            priority: Scheduling class of the unload request
+
+        Returns:
+            Seconds the unload request took
+        """
+        from . import llm
+        start = time.monotonic()
+        llm.generate(model, "", client=self._client, priority=priority,
+                     source="model_manager", keep_alive=0)
+        seconds = time.monotonic() - start
+        self._record(model, 'unload', seconds)
+        logger.info(f"Model {model} unloaded in {seconds:.2f}s")
+        return seconds
+
+    def preload(self, models: Iterable[str], background: bool = True):
+        """Load models one after another, by default on a daemon thread.
+
+        Failures are logged, not raised: a model that could not be preloaded
+        is simply loaded by its first request.
+
+        Args:
+            models: Model names, loaded in order
+            background: Return immediately instead of waiting for the loads
+        """
+        models = list(dict.fromkeys(m for m in models if m))
+
+        def run():
+            for model in models:
+                try:
+                    self.load(model)
+                except Exception as e:
+                    logger.warning(f"Could not preload model {model}: {e}")
+
+        if background:
+            threading.Thread(target=run, name="epollo-model-preload", daemon=True).start()
+        else:
+            run()
+
+    @contextmanager
+    def stage(self, model: str, unload_after: bool = False):
+        """Run a block of work for one model with the model loaded first.
+
+        Args:
+            model: Model the block sends its requests to
+            unload_after: Free the model when the block ends, so the next
+                stage's model does not have to evict it
+        """
+        start = time.monotonic()
+        try:
+            self.load(model, priority=Priority.BATCH)
+        except Exception as e:
+            logger.warning(f"Could not load model {model} before its stage: {e}")
+        try:
+            yield
+        finally:
+            logger.info(f"Stage for {model} took {time.monotonic() - start:.2f}s")
+            if unload_after:
+                try:
+                    self.unload(model)
+                except Exception as e:
+                    logger.warning(f"Could not unload model {model}: {e}")
+
+    def run_stages(self, tasks: List[Tuple[str, Callable[[], Any]]], unload_between: bool = True) -> List[Any]:
+        """Run tasks grouped by model, one stage per model.
+
+        Tasks for the same model run back to back while it is loaded; models
+        are staged in the order they first appear. A task that raises has its
+        exception in its result slot.
+
+        Args:
+            tasks: List of (model, function) pairs
+            unload_between: Unload each model before the next stage starts
+
+        Returns:
+            Task results (or exceptions) in the original task order
+        """
+        groups: Dict[str, List[int]] = {}
+        for index, (model, _) in enumerate(tasks):
+            groups.setdefault(model, []).append(index)
+
+        results: List[Any] = [None] * len(tasks)
+        models = list(groups)
+        for position, model in enumerate(models):
+            last_stage = position == len(models) - 1
+            with self.stage(model, unload_after=unload_between and not last_stage):
+                for index in groups[model]:
+                    try:
+                        results[index] = tasks[index][1]()
+                    except Exception as e:
+                        logger.error(f"Task {index} for {model} failed: {e}")
+                        results[index] = e
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        """Get load/unload timings per model.
+
+        Returns:
+            Dictionary keyed by model name
+        """
+        with self._lock:
+            return {model: dict(timing) for model, timing in self._timings.items()}
+
+
+# Global instance shared by every Ollama caller in the process
+_model_manager: Optional[ModelManager] = None
+_model_manager_lock = threading.Lock()
+
+
+def get_model_manager() -> ModelManager:
+    """Get or create the process-wide model manager.
+
+    Returns:
+        ModelManager instance
+    """
+    global _model_manager
+    with _model_manager_lock:
+        if _model_manager is None:
+            from .config import Config
+            config = Config()
+            _model_manager = ModelManager(
+                api_url=config.ollama_api_url,
+                default_keep_alive=config.models_keep_alive,
+                keep_alive=config.models_keep_alive_per_model
+            )
+        return _model_manager
@@ -1,9 +1,4 @@
-from ollama import chat
+from epollo import llm
 
-response = chat(model='qwen2.5:1.5b', messages=[
-    {
-        'role': 'user',
-        'content': 'Why is the sky blue?',
-    },
-])
-print(response.message.content)
\ No newline at end of file
+response = llm.generate(model='qwen2.5:1.5b', prompt='Why is the sky blue?')
+print(response['response'])
@@ -0,0 +1,168 @@
+"""Navigation generations, cancellation of superseded page loads, and history."""
+
+import logging
+import threading
+from typing import Optional, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class NavigationCancelled(Exception):
+    """Raised inside a page load once a newer navigation has superseded it."""
+
+
+class CancelToken:
+    """Thread-safe flag checked by long-running work between steps."""
+
+    def __init__(self, priority: int = 0):
+        """Initialize token.
+
+        Args:
+            priority: Scheduling class of the Ollama requests made for this
+                work (an llm_scheduler.Priority; 0 is interactive)
+        """
+        self.priority = priority
+        self._event = threading.Event()
+
+    def cancel(self):
+        """Request cancellation."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Check if cancellation was requested."""
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        """Raise NavigationCancelled if cancellation was requested."""
+        if self._event.is_set():
+            raise NavigationCancelled()
+
+
+class Navigation:
+    """One page load: its generation number, target URL and cancel token."""
+
+    def __init__(self, generation: int, url: str):
+        """Initialize navigation.
+
+        Args:
+            generation: Monotonically increasing navigation number
+            url: Requested URL
+        """
+        self.generation = generation
+        self.url = url
+        self.token = CancelToken()
+
+
+class NavigationController:
+    """Hands out navigation generations; starting one cancels the previous one."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._current: Optional[Navigation] = None
+
+    def begin(self, url: str) -> Navigation:
+        """Start a navigation, cancelling the one in progress.
+
+        Args:
+            url: Requested URL
+
+        Returns:
+            The new current Navigation
+        """
+        with self._lock:
+            previous = self._current
+            self._generation += 1
+            self._current = Navigation(self._generation, url)
+            current = self._current
+        if previous is not None and not previous.token.cancelled:
+            logger.info(f"Navigation {previous.generation} ({previous.url}) superseded by {current.generation}")
+            previous.token.cancel()
+        return current
+
+    def is_current(self, navigation: Navigation) -> bool:
+        """Check whether a navigation is still the latest one.
+
+        Args:
+            navigation: Navigation to check
+
+        Returns:
+            True if no newer navigation has started and it was not cancelled
+        """
+        with self._lock:
+            return navigation is self._current and not navigation.token.cancelled
+
+    def cancel(self):
+        """Cancel the navigation in progress, if any."""
+        with self._lock:
+            current = self._current
+        if current is not None:
+            current.token.cancel()
+
+
+class NavigationHistory:
+    """Back/forward list of visited URLs and the filter setting used for each."""
+
+    def __init__(self, max_entries: int = 100):
+        """Initialize history.
+
+        Args:
+            max_entries: Number of entries kept; the oldest are dropped first
+        """
+        self.max_entries = max_entries
+        self._entries: List[Tuple[str, bool]] = []
+        self._index = -1
+        self._lock = threading.Lock()
+
+    def push(self, url: str, use_filter: bool):
+        """Record a new visit, discarding the forward entries.
+
+        Args:
+            url: Visited URL
+            use_filter: Whether filtering was on for the visit
+        """
+        with self._lock:
+            if 0 <= self._index < len(self._entries) and self._entries[self._index] == (url, use_filter):
+                return
+            del self._entries[self._index + 1:]
+            self._entries.append((url, use_filter))
+            if len(self._entries) > self.max_entries:
+                del self._entries[0]
+            self._index = len(self._entries) - 1
+
+    def back(self) -> Optional[Tuple[str, bool]]:
+        """Step back.
+
+        Returns:
+            The (url, use_filter) entry now current, or None at the start
+        """
+        with self._lock:
+            if self._index <= 0:
+                return None
+            self._index -= 1
+            return self._entries[self._index]
+
+    def forward(self) -> Optional[Tuple[str, bool]]:
+        """Step forward.
+
+        Returns:
+            The (url, use_filter) entry now current, or None at the end
+        """
+        with self._lock:
+            if self._index >= len(self._entries) - 1:
+                return None
+            self._index += 1
+            return self._entries[self._index]
+
+    @property
+    def can_go_back(self) -> bool:
+        """Check if there is an entry before the current one."""
+        with self._lock:
+            return self._index > 0
+
+    @property
+    def can_go_forward(self) -> bool:
+        """Check if there is an entry after the current one."""
+        with self._lock:
+            return self._index < len(self._entries) - 1
@@ -5,10 +5,14 @@ import base64
 import logging
 from typing import Optional, Dict, Any, Union, List, Tuple
 from pathlib import Path
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
 import io
 import tempfile
+from . import llm
+from .llm_scheduler import Priority
+from .vision_cache import get_vision_cache
+from .ollama_client import get_ollama_client
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +24,10 @@ class DeepSeekOCR:
         self,
         api_url: str = "http://localhost:11434",
         model: str = "deepseek-ocr",
-        timeout: int = 60
+        timeout: int = 60,
+        priority: Priority = Priority.BATCH,
+        max_workers: int = 4,
+        use_cache: bool = True
     ):
         """Initialize DeepSeek OCR client.
         
@@ -28,12 +35,20 @@ class DeepSeekOCR:
             api_url: Ollama API base URL
             model: Model name for DeepSeek OCR
             timeout: Request timeout in seconds
+            priority: Scheduling class of OCR requests in the LLM scheduler
+            max_workers: Crops of a tall image sent to Ollama at once
+            use_cache: Reuse answers for pixel-identical images from the
+                shared VLM/OCR result cache
         """
         self.api_url = api_url.rstrip('/')
         self.model = model
         self.timeout = timeout
-        self.ocr_url = f"{self.api_url}/api/generate"
+        self.priority = priority
+        self.max_workers = max(1, max_workers)
         self.max_aspect_ratio = 2.0
+        self.result_cache = get_vision_cache() if use_cache else None
+        # Pooled keep-alive connections shared by crop workers and all other Ollama callers
+        self.client = get_ollama_client(self.api_url)
     
     def _encode_image(self, image_path: Union[str, Path, bytes, Image.Image]) -> str:
         """Encode image to base64 string.
@@ -114,6 +129,51 @@ class DeepSeekOCR:
         
         return cropped_images
     
+    def _request_ocr(
+        self,
+        image: Union[str, Path, bytes, Image.Image],
+        prompt: str,
+        max_tokens: int,
+        temperature: float
+    ) -> str:
+        """Send one image to the OCR model.
+        
+        Args:
+            image: Image file path, bytes, or PIL Image object
+            prompt: OCR prompt
+            max_tokens: Maximum tokens in response
+            temperature: Sampling temperature
+            
+        Returns:
+            Raw model response text
+        """
+        image_b64 = self._encode_image(image)
+        options = {
+            "temperature": temperature,
+            "num_predict": max_tokens
+        }
+        if self.result_cache is not None:
+            cached = self.result_cache.get(image_b64, self.model, prompt, options)
+            if cached is not None:
+                logger.info("Reused cached OCR result")
+                return cached
+        
+        response = llm.generate(
+            self.model,
+            prompt,
+            client=self.client,
+            priority=self.priority,
+            source="ocr",
+            images=[image_b64],
+            options=options,
+            timeout=self.timeout
+        )
+        text = response.get('response', '')
+        
+        if self.result_cache is not None and text:
+            self.result_cache.put(image_b64, self.model, prompt, options, text)
+        return text
+    
     def _extract_text_from_crops(
         self,
         crops: List[Image.Image],
@@ -123,6 +183,10 @@ class DeepSeekOCR:
     ) -> str:
         """Extract text from multiple cropped images and combine results.
         
+        Crops are sent concurrently (up to max_workers at once) and the
+        results are joined in crop order. A crop that fails is kept as a
+        marked section so gaps in the text are visible.
+        
         Args:
             crops: List of cropped PIL Image objects
             prompt: OCR prompt
@@ -132,48 +196,28 @@ class DeepSeekOCR:
         Returns:
             Combined extracted text
         """
-        all_text = []
-        
-        for i, crop in enumerate(crops):
+        def ocr_crop(i: int, crop: Image.Image) -> str:
             logger.info(f"Processing crop {i+1}/{len(crops)}")
+            return self._request_ocr(crop, prompt, max_tokens, temperature).strip()
+        
+        workers = min(self.max_workers, len(crops))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="epollo-ocr") as executor:
+            futures = [executor.submit(ocr_crop, i, crop) for i, crop in enumerate(crops)]
             
-            try:
-                # Encode crop to base64
-                crop_b64 = self._encode_image(crop)
-                
-                # Prepare request payload
-                payload = {
-                    "model": self.model,
-                    "prompt": prompt,
-                    "images": [crop_b64],
-                    "stream": False,
-                    "options": {
-                        "temperature": temperature,
-                        "num_predict": max_tokens
-                    }
-                }
-                
-                # Make request to Ollama API
-                response = requests.post(
-                    self.ocr_url,
-                    json=payload,
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
-                
-                # Extract text from this crop
-                result = response.json()
-                crop_text = result.get('response', '').strip()
+            all_text = []
+            for i, future in enumerate(futures):
+                try:
+                    crop_text = future.result()
+                except Exception as e:
+                    logger.error(f"Error processing crop {i+1}: {e}")
+                    all_text.append(f"--- Section {i+1} ---\n[OCR failed: {e}]")
+                    continue
                 
                 if crop_text:
                     all_text.append(f"--- Section {i+1} ---\n{crop_text}")
                     logger.info(f"Extracted {len(crop_text)} characters from crop {i+1}")
                 else:
                     logger.warning(f"No text extracted from crop {i+1}")
-                
-            except Exception as e:
-                logger.error(f"Error processing crop {i+1}: {e}")
-                continue
         
         return "\n\n".join(all_text)
     
@@ -207,31 +251,7 @@ class DeepSeekOCR:
                     return self._extract_text_from_crops(crops, prompt, max_tokens, temperature)
             
             # Single image processing (original logic)
-            image_b64 = self._encode_image(image)
-            
-            # Prepare request payload
-            payload = {
-                "model": self.model,
-                "prompt": prompt,
-                "images": [image_b64],
-                "stream": False,
-                "options": {
-                    "temperature": temperature,
-                    "num_predict": max_tokens
-                }
-            }
-            
-            # Make request to Ollama API
-            response = requests.post(
-                self.ocr_url,
-                json=payload,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            
-            # Extract and return text
-            result = response.json()
-            extracted_text = result.get('response', '')
+            extracted_text = self._request_ocr(image, prompt, max_tokens, temperature)
             
             if not extracted_text:
                 logger.warning("No text extracted from image")
@@ -240,9 +260,9 @@ class DeepSeekOCR:
             logger.info(f"Successfully extracted {len(extracted_text)} characters")
             return extracted_text.strip()
             
-        except requests.exceptions.RequestException as e:
+        except ConnectionError as e:
             logger.error(f"Failed to connect to Ollama API: {e}")
-            raise ConnectionError(f"Cannot connect to Ollama at {self.api_url}: {e}")
+            raise
         except Exception as e:
             logger.error(f"Error extracting text: {e}")
             raise
@@ -292,11 +312,7 @@ class DeepSeekOCR:
             True if connection successful, False otherwise
         """
         try:
-            response = requests.get(f"{self.api_url}/api/tags", timeout=10)
-            response.raise_for_status()
-            
-            models = response.json().get('models', [])
-            model_names = [model.get('name', '') for model in models]
+            model_names = self.client.list_models()
             
             # Check if DeepSeek OCR model is available
             available = any(self.model.lower() in name.lower() for name in model_names)
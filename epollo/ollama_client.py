@@ -0,0 +1,302 @@
+"""Asyncio Ollama client with a pooled keep-alive transport, plus blocking facades."""
+
+import json
+import time
+import asyncio
+import logging
+import threading
+from typing import Optional, Dict, Any, List, Callable
+import httpx
+from .aio import BackgroundLoop
+from .navigation import CancelToken, NavigationCancelled
+
+logger = logging.getLogger(__name__)
+
+# Fields of the final response copied into the result
+_STAT_KEYS = (
+    'model', 'done', 'done_reason', 'total_duration', 'load_duration',
+    'prompt_eval_count', 'prompt_eval_duration', 'eval_count', 'eval_duration'
+)
+
+# Statuses worth retrying: rate limiting, server busy or restarting
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class OllamaResponseError(RuntimeError):
+    """Raised when Ollama answers with an error status or an error message."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"Ollama error {status}: {message}")
+        self.status = status
+
+
+class AsyncOllamaClient:
+    """Ollama API client for asyncio code.
+
+    One httpx connection pool (HTTP/1.1 keep-alive) serves every request.
+    Connection failures and busy-server statuses are retried with
+    exponential backoff, but never once a streamed answer has started
+    arriving. The pool is created on first use and stays bound to that
+    event loop.
+    """
+
+    def __init__(
+        self,
+        api_url: str = "http://localhost:11434",
+        timeout: float = 120,
+        max_connections: int = 8,
+        retries: int = 2,
+        backoff: float = 0.5
+    ):
+        """Initialize client.
+
+        Args:
+            api_url: Ollama API base URL
+            timeout: Read timeout in seconds for requests without a time limit
+                of their own
+            max_connections: Connections kept open to the server
+            retries: Extra attempts after a connection failure or busy status
+            backoff: Delay before the first retry, doubled on each further one
+        """
+        self.api_url = api_url.rstrip('/')
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.retries = retries
+        self.backoff = backoff
+        self._http: Optional[httpx.AsyncClient] = None
+        self.counters = {'requests': 0, 'retries': 0, 'failures': 0, 'seconds': 0.0}
+
+    def _client(self) -> httpx.AsyncClient:
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                base_url=self.api_url,
+                timeout=httpx.Timeout(self.timeout, connect=10),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                )
+            )
+        return self._http
+
+    async def _retrying(self, attempt_fn: Callable, description: str) -> Dict[str, Any]:
+        """Run one request, retrying transport failures and busy statuses."""
+        started = {'streaming': False}
+        attempt = 0
+        start = time.monotonic()
+        self.counters['requests'] += 1
+        while True:
+            try:
+                result = await attempt_fn(started)
+                break
+            except (httpx.TransportError, OllamaResponseError) as e:
+                retryable = not isinstance(e, OllamaResponseError) or e.status in _RETRY_STATUSES
+                if not retryable or started['streaming'] or attempt >= self.retries:
+                    self.counters['failures'] += 1
+                    if isinstance(e, httpx.TransportError):
+                        raise ConnectionError(f"Cannot reach Ollama at {self.api_url}: {e}") from e
+                    raise
+                delay = self.backoff * (2 ** attempt)
+                attempt += 1
+                self.counters['retries'] += 1
+                logger.warning(f"{description} failed ({e}), retry {attempt}/{self.retries} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+        elapsed = time.monotonic() - start
+        self.counters['seconds'] += elapsed
+        result['timing'] = dict(result.get('timing', {}), attempts=attempt + 1, seconds=elapsed)
+        return result
+
+    @staticmethod
+    def _check(data: Dict[str, Any], status: int = 200):
+        if 'error' in data:
+            raise OllamaResponseError(status, data['error'])
+
+    async def generate(
+        self,
+        model: str,
+        prompt: str,
+        images: Optional[List[str]] = None,
+        options: Optional[Dict[str, Any]] = None,
+        format: Optional[str] = None,
+        keep_alive: Optional[Any] = None,
+        system: Optional[str] = None,
+        stream: bool = False,
+        cancel_token: Optional[CancelToken] = None,
+        on_chunk: Optional[Callable[[str], None]] = None,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Generate a completion.
+
+        Args:
+            model: Model name
+            prompt: Prompt text
+            images: Base64-encoded images for vision models
+            options: Model options (temperature, num_predict, num_ctx, ...)
+            format: Response format ('json' or a JSON schema)
+            keep_alive: How long the model stays loaded afterwards
+            system: System prompt
+            stream: Stream the answer; required for cancellation and on_chunk
+            cancel_token: Token whose cancellation abandons a streamed answer
+            on_chunk: Called with each piece of a streamed answer
+            timeout: Wall-clock limit in seconds for the whole request, retries
+                and streaming included
+
+        Returns:
+            Dictionary with the full 'response' text, Ollama's statistics and
+            a 'timing' entry (attempts, seconds, first_chunk_seconds)
+
+        Raises:
+            ConnectionError: If Ollama cannot be reached after retries
+            OllamaResponseError: If Ollama rejects the request
+            NavigationCancelled: If the token was cancelled during generation
+            TimeoutError: If the answer was not complete within the timeout
+        """
+        payload: Dict[str, Any] = {'model': model, 'prompt': prompt, 'stream': stream}
+        for key, value in (('images', images), ('options', options), ('format', format),
+                           ('keep_alive', keep_alive), ('system', system)):
+            if value is not None:
+                payload[key] = value
+        request_timeout = httpx.Timeout(timeout, connect=10) if timeout is not None else httpx.USE_CLIENT_DEFAULT
+
+        async def attempt(started):
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            if not stream:
+                response = await self._client().post('/api/generate', json=payload, timeout=request_timeout)
+                if response.status_code >= 400:
+                    raise OllamaResponseError(response.status_code, response.text)
+                data = response.json()
+                self._check(data)
+                return data
+
+            sent = time.monotonic()
+            pieces = []
+            last: Dict[str, Any] = {}
+            first_chunk = None
+            async with self._client().stream('POST', '/api/generate', json=payload,
+                                             timeout=request_timeout) as response:
+                if response.status_code >= 400:
+                    body = (await response.aread()).decode('utf-8', 'replace')
+                    raise OllamaResponseError(response.status_code, body)
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    if cancel_token is not None and cancel_token.cancelled:
+                        logger.debug(f"Cancelled generation with {model} after {len(pieces)} chunks")
+                        raise NavigationCancelled()
+                    chunk = json.loads(line)
+                    self._check(chunk, response.status_code)
+                    piece = chunk.get('response') or ''
+                    if first_chunk is None:
+                        first_chunk = time.monotonic() - sent
+                        started['streaming'] = True
+                    pieces.append(piece)
+                    if on_chunk is not None and piece:
+                        on_chunk(piece)
+                    last = chunk
+            result = {key: last[key] for key in _STAT_KEYS if last.get(key) is not None}
+            result['response'] = ''.join(pieces)
+            result['timing'] = {'first_chunk_seconds': first_chunk}
+            return result
+
+        if timeout is None:
+            return await self._retrying(attempt, f"Generation with {model}")
+        # The read timeout restarts with every chunk; this bounds the whole answer
+        try:
+            return await asyncio.wait_for(self._retrying(attempt, f"Generation with {model}"), timeout)
+        except asyncio.TimeoutError:
+            self.counters['failures'] += 1
+            raise TimeoutError(f"Generation with {model} did not finish within {timeout:.1f}s") from None
+
+    async def list_models(self) -> List[str]:
+        """Get names of the models installed on the server."""
+        async def attempt(started):
+            response = await self._client().get('/api/tags', timeout=10)
+            if response.status_code >= 400:
+                raise OllamaResponseError(response.status_code, response.text)
+            return response.json()
+
+        data = await self._retrying(attempt, "Listing models")
+        return [model.get('name', '') for model in data.get('models', [])]
+
+    async def aclose(self):
+        """Close pooled connections."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+
+class OllamaClient:
+    """Blocking facade that runs an AsyncOllamaClient on the shared Ollama loop.
+
+    Any thread may call it; all of them share one connection pool.
+    """
+
+    def __init__(self, api_url: str = "http://localhost:11434", **kwargs):
+        """Initialize client.
+
+        Args:
+            api_url: Ollama API base URL
+            **kwargs: AsyncOllamaClient options (timeout, max_connections, retries, backoff)
+        """
+        self.aio = AsyncOllamaClient(api_url, **kwargs)
+
+    @property
+    def api_url(self) -> str:
+        """Get the Ollama API base URL."""
+        return self.aio.api_url
+
+    def generate(self, model: str, prompt: str, **kwargs) -> Dict[str, Any]:
+        """Generate a completion; see AsyncOllamaClient.generate for arguments."""
+        return _get_loop().run(self.aio.generate(model, prompt, **kwargs))
+
+    def list_models(self) -> List[str]:
+        """Get names of the models installed on the server."""
+        return _get_loop().run(self.aio.list_models())
+
+    def stats(self) -> Dict[str, Any]:
+        """Get request, retry and failure counters and total seconds."""
+        return dict(self.aio.counters)
+
+
+# Loop owning every pooled Ollama connection, and one client per server
+_loop: Optional[BackgroundLoop] = None
+_clients: Dict[Optional[str], OllamaClient] = {}
+_clients_lock = threading.Lock()
+
+
+def _get_loop() -> BackgroundLoop:
+    global _loop
+    with _clients_lock:
+        if _loop is None:
+            _loop = BackgroundLoop(name="epollo-ollama")
+        return _loop
+
+
+def get_ollama_client(api_url: Optional[str] = None) -> OllamaClient:
+    """Get the shared client for an Ollama server.
+
+    Args:
+        api_url: Ollama API base URL (defaults to ollama.api_url in config.yaml)
+
+    Returns:
+        OllamaClient instance shared by every caller using that server
+    """
+    key = api_url.rstrip('/') if api_url else None
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            from .config import Config
+            config = Config()
+            url = key or config.ollama_api_url.rstrip('/')
+            client = _clients.get(url)
+            if client is None:
+                client = OllamaClient(
+                    url,
+                    timeout=config.ollama_timeout,
+                    max_connections=config.ollama_max_connections,
+                    retries=config.ollama_retries
+                )
+                _clients[url] = client
+            _clients[key] = client
+        return client
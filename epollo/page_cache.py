@@ -0,0 +1,104 @@
+"""In-memory cache of processed pages for back/forward navigation and prefetching."""
+
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class PageCache:
+    """Byte-bounded LRU cache of final page documents.
+
+    Keys combine the URL with the processing mode (original, filtered,
+    summary), since each mode produces a different document.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, max_age: Optional[float] = None):
+        """Initialize page cache.
+
+        Args:
+            max_bytes: Maximum total UTF-8 size of cached documents
+            max_age: Optional lifetime of a cached document in seconds
+        """
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[str, str, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, url: str, mode: str) -> Optional[Tuple[str, str]]:
+        """Look up a processed page and mark it as recently used.
+
+        Args:
+            url: Page URL
+            mode: Processing mode the document was built with
+
+        Returns:
+            Tuple of (html, final_url), or None on miss
+        """
+        with self._lock:
+            entry = self._entries.get((url, mode))
+            if entry is not None and self.max_age is not None and time.time() - entry[3] > self.max_age:
+                del self._entries[(url, mode)]
+                self._bytes -= entry[2]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((url, mode))
+            self.hits += 1
+            return entry[0], entry[1]
+
+    def put(self, url: str, mode: str, html: str, final_url: str):
+        """Store a processed page, evicting least recently used pages if over budget.
+
+        Args:
+            url: Page URL
+            mode: Processing mode the document was built with
+            html: Final document
+            final_url: URL after redirects
+        """
+        size = len(html.encode('utf-8'))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop((url, mode), None)
+            if previous is not None:
+                self._bytes -= previous[2]
+            self._entries[(url, mode)] = (html, final_url, size, time.time())
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, _, evicted, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self.evictions += 1
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def clear(self):
+        """Remove all pages."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counters, page count and stored bytes
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'pages': len(self._entries),
+                'bytes': self._bytes
+            }
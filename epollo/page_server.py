@@ -0,0 +1,135 @@
+"""Loopback HTTP server that serves processed pages to the browser frame."""
+
+import re
+import html
+import secrets
+import logging
+import threading
+from collections import OrderedDict
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_HEAD_RE = re.compile(r'<head(?:\s[^>]*)?>', re.IGNORECASE)
+_BASE_RE = re.compile(r'<base[\s>]', re.IGNORECASE)
+
+# Bytes written per chunk when streaming a document
+_CHUNK_SIZE = 64 * 1024
+
+
+class _PageRequestHandler(BaseHTTPRequestHandler):
+    """Serves documents published on the owning PageServer."""
+
+    server_version = "epollo"
+
+    def do_GET(self):
+        body = self.server.page_server.lookup(self.path.split('?', 1)[0])
+        if body is None:
+            self.send_error(404)
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        view = memoryview(body)
+        try:
+            for offset in range(0, len(body), _CHUNK_SIZE):
+                self.wfile.write(view[offset:offset + _CHUNK_SIZE])
+        except (BrokenPipeError, ConnectionResetError):
+            # The frame navigated away before the page was fully sent
+            pass
+
+    def log_message(self, format, *args):
+        logger.debug(f"Page server: {format % args}")
+
+
+class PageServer:
+    """Serves each processed document under its own unguessable loopback URL."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, max_documents: int = 20):
+        """Initialize page server.
+
+        Args:
+            host: Interface to bind; loopback keeps documents local to this machine
+            port: Port to bind (0 picks a free port)
+            max_documents: Number of published documents kept before the oldest is dropped
+        """
+        self.host = host
+        self.port = port
+        self.max_documents = max_documents
+        self._documents: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """Get the server root URL (starts the server if needed)."""
+        self.start()
+        return f"http://{self.host}:{self.port}"
+
+    def start(self):
+        """Start serving on a daemon thread if not already running."""
+        with self._lock:
+            if self._server is not None:
+                return
+            self._server = ThreadingHTTPServer((self.host, self.port), _PageRequestHandler)
+            self._server.daemon_threads = True
+            self._server.page_server = self
+            self.port = self._server.server_address[1]
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, name="epollo-page-server", daemon=True
+            )
+            self._thread.start()
+        logger.info(f"Page server listening on http://{self.host}:{self.port}")
+
+    def publish(self, document: str, base_href: Optional[str] = None) -> str:
+        """Publish a document and return the URL it is served at.
+
+        Args:
+            document: HTML document
+            base_href: Original page URL, added as <base href> so relative links
+                and resources resolve against the source site
+
+        Returns:
+            Loopback URL of the document
+        """
+        if base_href and not _BASE_RE.search(document):
+            base_tag = f'<base href="{html.escape(base_href, quote=True)}">'
+            head = _HEAD_RE.search(document)
+            if head:
+                document = document[:head.end()] + base_tag + document[head.end():]
+            else:
+                document = base_tag + document
+
+        path = f"/page/{secrets.token_urlsafe(16)}"
+        body = document.encode('utf-8')
+        with self._lock:
+            self._documents[path] = body
+            while len(self._documents) > self.max_documents:
+                self._documents.popitem(last=False)
+        return self.base_url + path
+
+    def lookup(self, path: str) -> Optional[bytes]:
+        """Get the body of a published document.
+
+        Args:
+            path: Request path
+
+        Returns:
+            Document bytes, or None if unknown or already dropped
+        """
+        with self._lock:
+            return self._documents.get(path)
+
+    def stop(self):
+        """Stop serving and forget all documents."""
+        with self._lock:
+            server, self._server = self._server, None
+            self._documents.clear()
+        if server is not None:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,193 @@
+"""Background prefetching of links on the current page."""
+
+import re
+import logging
+import threading
+from collections import deque
+from typing import Callable, Optional, List, Tuple
+from urllib.parse import urljoin, urldefrag, urlparse
+from .navigation import CancelToken, NavigationCancelled
+from .llm_scheduler import Priority
+from .page_cache import PageCache
+
+logger = logging.getLogger(__name__)
+
+_LINK_RE = re.compile(
+    r'''<a\s[^>]*?href\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))''',
+    re.IGNORECASE
+)
+
+# Links to these are downloads or media, not pages worth preparing
+_SKIP_EXTENSIONS = (
+    '.pdf', '.zip', '.gz', '.tar', '.exe', '.dmg', '.jpg', '.jpeg', '.png',
+    '.gif', '.webp', '.svg', '.mp3', '.mp4', '.webm', '.mov', '.avi', '.css', '.js'
+)
+
+# Mode under which unprocessed documents are kept
+RAW_MODE = "raw"
+
+# How far a prefetched document got, as returned by Prefetcher.take
+STAGE_RAW = "raw"              # As fetched
+STAGE_PARTIAL = "partial"      # Processed except for the LLM steps of its mode
+STAGE_PROCESSED = "processed"  # Final document for its mode
+
+
+def _partial_mode(mode: str) -> str:
+    """Cache mode of partially processed documents for a mode."""
+    return f"{mode}+partial"
+
+
+def extract_links(html: str, base_url: str, limit: int) -> List[str]:
+    """Find the first same-origin page links of a document.
+
+    Args:
+        html: HTML content
+        base_url: URL the document was loaded from
+        limit: Maximum number of links to return
+
+    Returns:
+        Absolute URLs without fragments, in document order
+    """
+    base = urlparse(base_url)
+    current = urldefrag(base_url)[0]
+    links: List[str] = []
+    seen = {current}
+    for match in _LINK_RE.finditer(html):
+        href = (match.group(1) or match.group(2) or match.group(3) or '').strip()
+        if not href or href.startswith(('#', 'javascript:', 'mailto:', 'tel:', 'data:')):
+            continue
+        url = urldefrag(urljoin(base_url, href))[0]
+        parsed = urlparse(url)
+        if parsed.scheme != base.scheme or parsed.netloc != base.netloc:
+            continue
+        if parsed.path.lower().endswith(_SKIP_EXTENSIONS) or url in seen:
+            continue
+        seen.add(url)
+        links.append(url)
+        if len(links) >= limit:
+            break
+    return links
+
+
+class Prefetcher:
+    """Fetches and optionally pre-processes likely next pages on one background thread.
+
+    Work is strictly low priority: a single worker handles one link at a
+    time, each new page replaces the queue, cancel() is called whenever a
+    foreground navigation starts, and any Ollama requests are scheduled in
+    the background class so prefetching never competes with the user.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Tuple[str, str]],
+        process: Optional[Callable[[str, str, str, CancelToken], Optional[Tuple[str, bool]]]] = None,
+        max_links: int = 5,
+        max_age: float = 300,
+        max_bytes: int = 32 * 1024 * 1024
+    ):
+        """Initialize prefetcher.
+
+        Args:
+            fetch: Function returning (html, final_url) for a URL
+            process: Optional function taking (html, final_url, mode, token) and
+                returning (document, complete), where complete is False for a
+                document that still needs the mode's LLM steps, or None if
+                nothing can be prepared
+            max_links: Links prefetched per page
+            max_age: Seconds a prefetched document stays usable
+            max_bytes: Memory budget for prefetched documents
+        """
+        self.fetch = fetch
+        self.process = process
+        self.max_links = max_links
+        self.cache = PageCache(max_bytes=max_bytes, max_age=max_age)
+        self._queue: "deque[str]" = deque()
+        self._mode = RAW_MODE
+        self._token = CancelToken(priority=Priority.BACKGROUND)
+        self._wakeup = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self.counters = {'fetched': 0, 'processed': 0, 'partial': 0, 'failed': 0, 'used': 0}
+
+    def schedule(self, html: str, base_url: str, mode: str):
+        """Replace the queue with the links of a freshly loaded page.
+
+        Args:
+            html: Page HTML the links are taken from
+            base_url: URL of the page
+            mode: Processing mode of the current navigation
+        """
+        links = extract_links(html, base_url, self.max_links)
+        with self._wakeup:
+            self._token.cancel()
+            self._token = CancelToken(priority=Priority.BACKGROUND)
+            self._mode = mode
+            self._queue = deque(url for url in links if (url, mode) not in self.cache)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="epollo-prefetch", daemon=True)
+                self._thread.start()
+            self._wakeup.notify()
+        logger.debug(f"Prefetch scheduled {len(self._queue)} links from {base_url}")
+
+    def cancel(self):
+        """Drop queued links and abandon the one in progress."""
+        with self._wakeup:
+            self._token.cancel()
+            self._queue.clear()
+
+    def take(self, url: str, mode: str) -> Optional[Tuple[str, str, str]]:
+        """Get a prefetched document for a navigation.
+
+        Args:
+            url: Requested URL
+            mode: Processing mode of the navigation
+
+        Returns:
+            Tuple of (html, final_url, stage), preferring the most processed
+            document available, or None if the link was not prefetched
+        """
+        for cache_mode, stage in ((mode, STAGE_PROCESSED), (_partial_mode(mode), STAGE_PARTIAL),
+                                  (RAW_MODE, STAGE_RAW)):
+            entry = self.cache.get(url, cache_mode)
+            if entry is not None:
+                self.counters['used'] += 1
+                return entry[0], entry[1], stage
+        return None
+
+    def _run(self):
+        while True:
+            with self._wakeup:
+                while not self._queue:
+                    self._wakeup.wait()
+                url = self._queue.popleft()
+                token = self._token
+                mode = self._mode
+            self._prefetch(url, mode, token)
+
+    def _prefetch(self, url: str, mode: str, token: CancelToken):
+        try:
+            entry = self.cache.get(url, RAW_MODE)
+            if entry is None:
+                html, final_url = self.fetch(url)
+                token.raise_if_cancelled()
+                self.cache.put(url, RAW_MODE, html, final_url)
+                self.counters['fetched'] += 1
+            else:
+                html, final_url = entry
+
+            if self.process is not None:
+                processed = self.process(html, final_url, mode, token)
+                token.raise_if_cancelled()
+                if processed is not None:
+                    document, complete = processed
+                    self.cache.put(url, mode if complete else _partial_mode(mode), document, final_url)
+                    self.counters['processed' if complete else 'partial'] += 1
+        except NavigationCancelled:
+            logger.debug(f"Prefetch of {url} abandoned")
+        except Exception as e:
+            self.counters['failed'] += 1
+            logger.debug(f"Prefetch of {url} failed: {e}")
+
+    def stats(self):
+        """Get prefetch counters and cache statistics."""
+        return dict(self.counters, cache=self.cache.stats())
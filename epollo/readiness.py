@@ -0,0 +1,176 @@
+"""Signal-driven page readiness detection for screenshot rendering."""
+
+import asyncio
+import logging
+from typing import Optional, Dict, Any
+from urllib.parse import urlparse
+from playwright.async_api import Page
+
+logger = logging.getLogger(__name__)
+
+
+# Runs inside the page. Each stage waits on a concrete signal and all stages
+# share one deadline, so a page that never settles still returns on time.
+_READINESS_SCRIPT = """
+async (opts) => {
+    const start = performance.now();
+    const deadline = start + opts.maxWaitMs;
+    const timings = {};
+    const timedOut = [];
+
+    const remaining = () => Math.max(0, deadline - performance.now());
+    const withDeadline = (promise) => Promise.race([
+        promise.then(() => false),
+        new Promise(resolve => setTimeout(() => resolve(true), remaining()))
+    ]);
+    // Resolve once `subscribe` has reported no activity for quietMs
+    const quietFor = (subscribe, quietMs) => new Promise(resolve => {
+        let timer = null;
+        let unsubscribe = () => {};
+        const kick = () => {
+            clearTimeout(timer);
+            timer = setTimeout(() => { unsubscribe(); resolve(); }, quietMs);
+        };
+        unsubscribe = subscribe(kick);
+        kick();
+    });
+    const stage = async (name, promise) => {
+        const stageStart = performance.now();
+        if (await withDeadline(promise)) {
+            timedOut.push(name);
+        }
+        timings[name] = Math.round(performance.now() - stageStart);
+    };
+
+    if (opts.domQuietMs > 0) {
+        await stage('dom_stable', quietFor(kick => {
+            const observer = new MutationObserver(kick);
+            observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+            return () => observer.disconnect();
+        }, opts.domQuietMs));
+    }
+
+    if (opts.waitFonts && document.fonts) {
+        await stage('fonts', document.fonts.ready);
+    }
+
+    if (opts.layoutQuietMs > 0 && (PerformanceObserver.supportedEntryTypes || []).includes('layout-shift')) {
+        await stage('layout_stable', quietFor(kick => {
+            const observer = new PerformanceObserver(kick);
+            observer.observe({type: 'layout-shift'});
+            return () => observer.disconnect();
+        }, opts.layoutQuietMs));
+    }
+
+    if (opts.waitImages) {
+        const inViewport = Array.from(document.images).filter(img => {
+            const rect = img.getBoundingClientRect();
+            return rect.bottom > 0 && rect.right > 0 && rect.top < window.innerHeight && rect.left < window.innerWidth;
+        });
+        await stage('images', Promise.all(inViewport.map(img => img.decode().catch(() => null))));
+    }
+
+    timings.total = Math.round(performance.now() - start);
+    timings.timed_out = timedOut;
+    return timings;
+}
+"""
+
+
+class ReadinessProfile:
+    """Thresholds deciding when a page is ready to be captured."""
+
+    def __init__(
+        self,
+        dom_quiet_ms: int = 300,
+        layout_quiet_ms: int = 300,
+        wait_fonts: bool = True,
+        wait_images: bool = True,
+        max_wait_ms: int = 5000
+    ):
+        """Initialize readiness profile.
+
+        Args:
+            dom_quiet_ms: Time without DOM mutations before the DOM counts as stable
+            layout_quiet_ms: Time without layout shifts before layout counts as stable
+            wait_fonts: Whether to wait for web fonts to load
+            wait_images: Whether to wait for images in the viewport to decode
+            max_wait_ms: Hard upper bound on the whole readiness wait
+        """
+        self.dom_quiet_ms = dom_quiet_ms
+        self.layout_quiet_ms = layout_quiet_ms
+        self.wait_fonts = wait_fonts
+        self.wait_images = wait_images
+        self.max_wait_ms = max_wait_ms
+
+    @classmethod
+    def from_dict(cls, values: Dict[str, Any], base: Optional["ReadinessProfile"] = None) -> "ReadinessProfile":
+        """Build a profile from config values, filling gaps from a base profile.
+
+        Args:
+            values: Mapping of profile field names to values
+            base: Profile supplying defaults for missing fields
+
+        Returns:
+            ReadinessProfile instance
+        """
+        base = base or cls()
+        return cls(
+            dom_quiet_ms=values.get('dom_quiet_ms', base.dom_quiet_ms),
+            layout_quiet_ms=values.get('layout_quiet_ms', base.layout_quiet_ms),
+            wait_fonts=values.get('wait_fonts', base.wait_fonts),
+            wait_images=values.get('wait_images', base.wait_images),
+            max_wait_ms=values.get('max_wait_ms', base.max_wait_ms)
+        )
+
+
+def profile_for_url(url: Optional[str], readiness_config: Optional[Dict[str, Any]] = None) -> ReadinessProfile:
+    """Pick the readiness profile for a URL.
+
+    Site profiles are matched on the hostname or any parent domain, so an
+    entry for "nytimes.com" also applies to "www.nytimes.com".
+
+    Args:
+        url: Page URL, or None for inline HTML
+        readiness_config: Dict with optional 'default' and 'sites' sections
+
+    Returns:
+        ReadinessProfile for the page
+    """
+    readiness_config = readiness_config or {}
+    profile = ReadinessProfile.from_dict(readiness_config.get('default', {}))
+
+    host = (urlparse(url).hostname or '').lower() if url else ''
+    sites = readiness_config.get('sites', {}) or {}
+    while host:
+        if host in sites:
+            return ReadinessProfile.from_dict(sites[host], base=profile)
+        host = host.partition('.')[2]
+    return profile
+
+
+async def wait_until_ready(page: Page, profile: ReadinessProfile) -> Dict[str, Any]:
+    """Wait until a page is ready to capture.
+
+    Args:
+        page: Playwright page that has started loading
+        profile: Readiness thresholds to apply
+
+    Returns:
+        Dictionary of per-stage durations in milliseconds, the total, and
+        the list of stages that hit the deadline
+    """
+    options = {
+        'domQuietMs': profile.dom_quiet_ms,
+        'layoutQuietMs': profile.layout_quiet_ms,
+        'waitFonts': profile.wait_fonts,
+        'waitImages': profile.wait_images,
+        'maxWaitMs': profile.max_wait_ms
+    }
+    # The script enforces the deadline itself; the outer bound covers a hung page
+    hard_limit = profile.max_wait_ms / 1000 + 2
+    try:
+        return await asyncio.wait_for(page.evaluate(_READINESS_SCRIPT, options), timeout=hard_limit)
+    except Exception as e:
+        logger.warning(f"Readiness detection failed, capturing anyway: {e}")
+        return {'total': None, 'timed_out': ['script'], 'error': str(e)}
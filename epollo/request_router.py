@@ -0,0 +1,237 @@
+"""Request interception for screenshot rendering: blocking and static asset caching."""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, Tuple
+from urllib.parse import urlparse
+from playwright.async_api import BrowserContext, Route, Request
+
+logger = logging.getLogger(__name__)
+
+
+# Ad, analytics and tracking hosts blocked by default. Matched on the
+# request hostname and all of its parent domains.
+BLOCKED_DOMAINS = frozenset([
+    # Ad serving
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "adservice.google.com",
+    "amazon-adsystem.com",
+    "adnxs.com",
+    "adsrvr.org",
+    "advertising.com",
+    "criteo.com",
+    "criteo.net",
+    "pubmatic.com",
+    "rubiconproject.com",
+    "openx.net",
+    "casalemedia.com",
+    "moatads.com",
+    "taboola.com",
+    "outbrain.com",
+    "sharethrough.com",
+    "media.net",
+    "teads.tv",
+    "smartadserver.com",
+    "3lift.com",
+    "indexww.com",
+    "bidswitch.net",
+    "yieldmo.com",
+    # Analytics and tracking
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googletagservices.com",
+    "scorecardresearch.com",
+    "quantserve.com",
+    "chartbeat.com",
+    "chartbeat.net",
+    "hotjar.com",
+    "segment.io",
+    "segment.com",
+    "mixpanel.com",
+    "newrelic.com",
+    "nr-data.net",
+    "optimizely.com",
+    "krxd.net",
+    "bluekai.com",
+    "demdex.net",
+    "omtrdc.net",
+    "everesttech.net",
+    "facebook.net",
+    "analytics.twitter.com",
+    "ads-twitter.com",
+    "bat.bing.com",
+    "clarity.ms",
+    "permutive.com",
+    "parsely.com",
+    # Consent and paywall overlays
+    "cookielaw.org",
+    "onetrust.com",
+    "tinypass.com",
+    "piano.io",
+])
+
+# Resource types whose responses are worth reusing across captures
+_CACHEABLE_TYPES = frozenset(["script", "stylesheet", "font", "image"])
+
+
+class RequestRouter:
+    """Routes every request of a browser context through block and cache rules."""
+
+    def __init__(
+        self,
+        block_trackers: bool = True,
+        blocked_resource_types: Iterable[str] = ("media",),
+        extra_blocked_domains: Iterable[str] = (),
+        cache_static_assets: bool = False,
+        static_cache_max_bytes: int = 50 * 1024 * 1024
+    ):
+        """Initialize request router.
+
+        Args:
+            block_trackers: Whether to abort requests to the bundled ad/tracker blocklist
+            blocked_resource_types: Playwright resource types to abort ('media', 'font', 'image', ...)
+            extra_blocked_domains: Additional hostnames to block
+            cache_static_assets: Whether to serve repeated scripts, styles, fonts and images from memory
+            static_cache_max_bytes: Memory budget for cached static assets
+        """
+        self.blocked_domains = set(extra_blocked_domains)
+        if block_trackers:
+            self.blocked_domains |= BLOCKED_DOMAINS
+        self.blocked_resource_types = frozenset(blocked_resource_types)
+        self.cache_static_assets = cache_static_assets
+        self.static_cache_max_bytes = static_cache_max_bytes
+        self._assets: "OrderedDict[str, Tuple[int, Dict[str, str], bytes]]" = OrderedDict()
+        self._assets_bytes = 0
+        self._lock = threading.Lock()
+        self.counters = {
+            'allowed': 0,
+            'blocked_domain': 0,
+            'blocked_type': 0,
+            'cache_hits': 0,
+            'cache_stores': 0,
+            'errors': 0
+        }
+
+    @classmethod
+    def from_config(cls, config) -> "RequestRouter":
+        """Build a router from configuration.
+
+        Images are dropped as well when display.remove_images is on.
+
+        Args:
+            config: Config instance
+
+        Returns:
+            RequestRouter instance
+        """
+        resource_types = list(config.screenshot_blocked_resource_types)
+        if config.remove_images:
+            resource_types.append("image")
+        return cls(
+            block_trackers=config.screenshot_block_trackers,
+            blocked_resource_types=resource_types,
+            extra_blocked_domains=config.screenshot_blocked_domains,
+            cache_static_assets=config.screenshot_cache_static_assets
+        )
+
+    async def attach(self, context: BrowserContext):
+        """Install the router on a browser context.
+
+        Args:
+            context: Playwright browser context
+        """
+        await context.route("**/*", self.handle)
+
+    def _is_blocked_host(self, host: str) -> bool:
+        """Check a hostname and its parent domains against the blocklist."""
+        while host:
+            if host in self.blocked_domains:
+                return True
+            host = host.partition('.')[2]
+        return False
+
+    async def handle(self, route: Route, request: Request):
+        """Decide the fate of a single request.
+
+        A request whose routing fails is passed through to the network, or
+        aborted if the route was already handled, so the page never hangs.
+
+        Args:
+            route: Playwright route to abort, fulfill or continue
+            request: The intercepted request
+        """
+        try:
+            await self._route(route, request)
+        except Exception as e:
+            self.counters['errors'] += 1
+            logger.warning(f"Routing {request.url} failed, passing it through: {e}")
+            try:
+                await route.continue_()
+            except Exception:
+                try:
+                    await route.abort()
+                except Exception as abort_error:
+                    logger.debug(f"Could not release route for {request.url}: {abort_error}")
+
+    async def _route(self, route: Route, request: Request):
+        """Block, serve from cache or continue a request."""
+        if request.resource_type in self.blocked_resource_types:
+            self.counters['blocked_type'] += 1
+            await route.abort("blockedbyclient")
+            return
+
+        host = (urlparse(request.url).hostname or '').lower()
+        if self._is_blocked_host(host):
+            self.counters['blocked_domain'] += 1
+            await route.abort("blockedbyclient")
+            return
+
+        if not (self.cache_static_assets and request.method == "GET" and request.resource_type in _CACHEABLE_TYPES):
+            self.counters['allowed'] += 1
+            await route.continue_()
+            return
+
+        with self._lock:
+            cached = self._assets.get(request.url)
+            if cached is not None:
+                self._assets.move_to_end(request.url)
+        if cached is not None:
+            status, headers, body = cached
+            self.counters['cache_hits'] += 1
+            await route.fulfill(status=status, headers=headers, body=body)
+            return
+
+        self.counters['allowed'] += 1
+        response = await route.fetch()
+        body = await response.body()
+        cache_control = response.headers.get('cache-control', '').lower()
+        if response.ok and 'no-store' not in cache_control:
+            self._store(request.url, response.status, response.headers, body)
+        await route.fulfill(response=response, body=body)
+
+    def _store(self, url: str, status: int, headers: Dict[str, str], body: bytes):
+        """Add an asset to the in-memory cache, evicting least recently used ones."""
+        if len(body) > self.static_cache_max_bytes:
+            return
+        with self._lock:
+            previous = self._assets.pop(url, None)
+            if previous is not None:
+                self._assets_bytes -= len(previous[2])
+            self._assets[url] = (status, dict(headers), body)
+            self._assets_bytes += len(body)
+            while self._assets_bytes > self.static_cache_max_bytes:
+                _, (_, _, evicted) = self._assets.popitem(last=False)
+                self._assets_bytes -= len(evicted)
+        self.counters['cache_stores'] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Get routing statistics.
+
+        Returns:
+            Dictionary of request counters and static cache size
+        """
+        with self._lock:
+            return dict(self.counters, cached_assets=len(self._assets), cached_bytes=self._assets_bytes)
@@ -1,29 +1,115 @@
 """HTML rendering and screenshot functionality using Playwright."""
 
 import os
+import time
+import atexit
 import asyncio
-from typing import Optional, Dict, Any, List
+import threading
+from typing import Optional, Dict, Any, List, Tuple, Union, Iterable, Iterator, AsyncIterator, Callable
 from pathlib import Path
+import io
 import logging
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 import base64
 from PIL import Image
+from .aio import BackgroundLoop
+from .config import Config
+from .readiness import profile_for_url, wait_until_ready
+from .request_router import RequestRouter
+from .tile_screening import TileScreener
 
 logger = logging.getLogger(__name__)
 
 
+class ScreenshotJob:
+    """A single URL or HTML document to capture in a batch."""
+    
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        html: Optional[str] = None,
+        output_path: Optional[str] = None,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        full_page: bool = True,
+        quality: int = 90,
+        format: str = 'png'
+    ):
+        """Initialize screenshot job.
+        
+        Args:
+            url: URL to render (mutually exclusive with html)
+            html: HTML content to render (mutually exclusive with url)
+            output_path: Optional path to save screenshot
+            width: Optional width override
+            height: Optional height override
+            full_page: Whether to capture full page
+            quality: Image quality (1-100) for JPEG
+            format: Image format ('png', 'jpeg', 'webp')
+        """
+        if (url is None) == (html is None):
+            raise ValueError("ScreenshotJob needs exactly one of url or html")
+        self.url = url
+        self.html = html
+        self.output_path = output_path
+        self.width = width
+        self.height = height
+        self.full_page = full_page
+        self.quality = quality
+        self.format = format
+
+
+class ScreenshotResult:
+    """Outcome of one job in a batch capture."""
+    
+    def __init__(
+        self,
+        job: ScreenshotJob,
+        data: Optional[bytes] = None,
+        error: Optional[Exception] = None,
+        elapsed: float = 0.0
+    ):
+        """Initialize screenshot result.
+        
+        Args:
+            job: The job this result belongs to
+            data: Screenshot bytes, None on failure
+            error: Exception raised while rendering, if any
+            elapsed: Seconds spent rendering the job
+        """
+        self.job = job
+        self.data = data
+        self.error = error
+        self.elapsed = elapsed
+    
+    @property
+    def ok(self) -> bool:
+        """Whether the capture succeeded."""
+        return self.error is None
+
+
 class ScreenshotRenderer:
     """HTML to screenshot renderer using Playwright."""
     
-    def __init__(self, headless: bool = True, viewport: Optional[Dict[str, int]] = None):
+    def __init__(
+        self,
+        headless: bool = True,
+        viewport: Optional[Dict[str, int]] = None,
+        readiness: Optional[Dict[str, Any]] = None,
+        router: Optional[RequestRouter] = None
+    ):
         """Initialize screenshot renderer.
         
         Args:
             headless: Whether to run browser in headless mode
             viewport: Viewport dimensions {'width': 1200, 'height': 800}
+            readiness: Readiness settings with optional 'default' and per-host 'sites' profiles
+            router: Optional request router blocking ads/trackers and caching static assets
         """
         self.headless = headless
         self.viewport = viewport or {'width': 1200, 'height': 800}
+        self.readiness = readiness or {}
+        self.router = router
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.playwright = None
@@ -42,25 +128,42 @@ class ScreenshotRenderer:
         try:
             self.playwright = await async_playwright().start()
             self.browser = await self.playwright.chromium.launch(headless=self.headless)
-            self.context = await self.browser.new_context(
-                viewport={'width': self.viewport['width'], 'height': self.viewport['height']},
-                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                locale='en-US',
-                timezone_id='America/New_York',
-                extra_http_headers={
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'DNT': '1',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1'
-                }
-            )
+            self.context = await self._new_context()
             logger.info("Screenshot renderer started successfully")
         except Exception as e:
             logger.error(f"Failed to start screenshot renderer: {e}")
             raise
     
+    async def _new_context(self) -> BrowserContext:
+        """Create a browser context with the renderer's viewport, headers and request routing."""
+        context = await self.browser.new_context(
+            viewport={'width': self.viewport['width'], 'height': self.viewport['height']},
+            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            locale='en-US',
+            timezone_id='America/New_York',
+            extra_http_headers={
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.9',
+                'Accept-Encoding': 'gzip, deflate, br',
+                'DNT': '1',
+                'Connection': 'keep-alive',
+                'Upgrade-Insecure-Requests': '1'
+            }
+        )
+        if self.router:
+            await self.router.attach(context)
+        return context
+    
+    async def _open_page(self) -> Page:
+        """Open a page for a single render."""
+        if not self.context:
+            raise RuntimeError("Renderer not started. Call start() or use async context manager.")
+        return await self.context.new_page()
+    
+    async def _close_page(self, page: Page):
+        """Close a page opened by _open_page."""
+        await page.close()
+    
     async def stop(self):
         """Stop the browser instance."""
         try:
@@ -98,10 +201,7 @@ class ScreenshotRenderer:
         Returns:
             Screenshot as bytes
         """
-        if not self.context:
-            raise RuntimeError("Renderer not started. Call start() or use async context manager.")
-        
-        page: Page = await self.context.new_page()
+        page: Page = await self._open_page()
         
         try:
             # Set viewport if custom dimensions provided
@@ -110,11 +210,10 @@ class ScreenshotRenderer:
                 viewport_height = height or self.viewport['height']
                 await page.set_viewport_size({'width': viewport_width, 'height': viewport_height})
             
-            # Load HTML content
-            await page.set_content(html, wait_until='networkidle')
-            
-            # Wait a bit for any dynamic content to load
-            await page.wait_for_timeout(1000)
+            # Load HTML content, then wait for it to settle
+            await page.set_content(html, wait_until='domcontentloaded')
+            timings = await wait_until_ready(page, profile_for_url(None, self.readiness))
+            logger.info(f"HTML document ready: {timings}")
             
             # Take screenshot
             screenshot_options = {
@@ -141,7 +240,7 @@ class ScreenshotRenderer:
             logger.error(f"Error rendering HTML to screenshot: {e}")
             raise
         finally:
-            await page.close()
+            await self._close_page(page)
     
     async def render_url_to_screenshot(
         self,
@@ -152,7 +251,7 @@ class ScreenshotRenderer:
         full_page: bool = True,
         quality: int = 90,
         format: str = 'png',
-        wait_until: str = 'networkidle',
+        wait_until: str = 'domcontentloaded',
         timeout: int = 30000
     ) -> bytes:
         """Render URL to screenshot.
@@ -171,10 +270,7 @@ class ScreenshotRenderer:
         Returns:
             Screenshot as bytes
         """
-        if not self.context:
-            raise RuntimeError("Renderer not started. Call start() or use async context manager.")
-        
-        page: Page = await self.context.new_page()
+        page: Page = await self._open_page()
         
         try:
             # Set viewport if custom dimensions provided
@@ -183,29 +279,21 @@ class ScreenshotRenderer:
                 viewport_height = height or self.viewport['height']
                 await page.set_viewport_size({'width': viewport_width, 'height': viewport_height})
             
-            # Navigate to URL - try different wait conditions for problematic sites
+            # Navigate to URL; if the wait condition never fires (e.g. endless
+            # network traffic) but the page has committed, capture what loaded
             try:
-                await page.goto(url, wait_until="networkidle", timeout=timeout)
+                await page.goto(url, wait_until=wait_until, timeout=timeout)
             except Exception as e:
-                # If networkidle fails, try with domcontentloaded
-                logger.warning(f"networkidle failed, trying domcontentloaded: {e}")
-                try:
-                    await page.goto(url, wait_until="domcontentloaded", timeout=timeout)
-                except Exception as e2:
-                    # If that also fails, try with minimal waiting
-                    logger.warning(f"domcontentloaded failed, trying with minimal wait: {e2}")
-                    try:
-                        await page.goto(url, wait_until="load", timeout=timeout)
-                    except Exception as e3:
-                        # Final attempt - navigate without waiting
-                        logger.warning(f"load failed, trying without wait: {e3}")
-                        await page.goto(url, timeout=timeout)
+                if page.url in ('', 'about:blank'):
+                    raise
+                logger.warning(f"{wait_until} did not fire for {url}, continuing with committed page: {e}")
+            
+            # Wait for concrete readiness signals instead of fixed sleeps
+            timings = await wait_until_ready(page, profile_for_url(url, self.readiness))
+            logger.info(f"Page ready for {url}: {timings}")
             
             # Handle paywalls and subscription popups
             try:
-                # Wait a bit for content to load
-                await page.wait_for_timeout(2000)
-                
                 # Try to remove common paywall/subscription overlays
                 await page.evaluate("""
                     () => {
@@ -256,9 +344,6 @@ class ScreenshotRenderer:
                     }
                 """)
                 
-                # Wait a bit for any dynamic removals
-                await page.wait_for_timeout(1000)
-                
             except Exception as e:
                 logger.warning(f"Could not handle paywall elements: {e}")
                 # Continue without paywall handling
@@ -289,7 +374,310 @@ class ScreenshotRenderer:
             logger.error(f"Error rendering URL to screenshot: {e}")
             raise
         finally:
+            await self._close_page(page)
+    
+    async def render_batch(
+        self,
+        jobs: Iterable[ScreenshotJob],
+        concurrency: int = 4
+    ) -> AsyncIterator[ScreenshotResult]:
+        """Render many URLs or HTML documents as parallel pages.
+        
+        Jobs run concurrently in this renderer's browser, at most
+        `concurrency` at a time. A failing job is reported in its result and
+        does not abort the rest of the batch.
+        
+        Args:
+            jobs: Jobs to render
+            concurrency: Maximum number of pages rendered at once
+            
+        Yields:
+            ScreenshotResult for each job, in completion order
+        """
+        limit = asyncio.Semaphore(concurrency)
+        
+        async def run_job(job: ScreenshotJob) -> ScreenshotResult:
+            async with limit:
+                start = time.monotonic()
+                try:
+                    options = {
+                        'output_path': job.output_path,
+                        'width': job.width,
+                        'height': job.height,
+                        'full_page': job.full_page,
+                        'quality': job.quality,
+                        'format': job.format
+                    }
+                    if job.url is not None:
+                        data = await self.render_url_to_screenshot(url=job.url, **options)
+                    else:
+                        data = await self.render_html_to_screenshot(html=job.html, **options)
+                    return ScreenshotResult(job, data=data, elapsed=time.monotonic() - start)
+                except Exception as e:
+                    logger.warning(f"Batch screenshot of {job.url or 'HTML document'} failed: {e}")
+                    return ScreenshotResult(job, error=e, elapsed=time.monotonic() - start)
+        
+        tasks = [asyncio.ensure_future(run_job(job)) for job in jobs]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+class _ContextSlot:
+    """A pooled browser context and its usage counters."""
+    
+    def __init__(self, context: BrowserContext):
+        self.context = context
+        self.pages_served = 0
+        self.active_pages = 0
+        self.retired = False
+
+
+class ScreenshotRendererPool(ScreenshotRenderer):
+    """Long-lived renderer that keeps Chromium and warmed contexts across renders.
+    
+    Pages are spread round-robin over a fixed set of browser contexts. A
+    context is replaced after serving max_pages_per_context pages so cookies,
+    caches and leaked memory do not accumulate, and Chromium is relaunched
+    if it disconnects. At most max_concurrent_pages pages are open at once.
+    """
+    
+    def __init__(
+        self,
+        headless: bool = True,
+        viewport: Optional[Dict[str, int]] = None,
+        num_contexts: int = 2,
+        max_pages_per_context: int = 50,
+        max_concurrent_pages: int = 4,
+        readiness: Optional[Dict[str, Any]] = None,
+        router: Optional[RequestRouter] = None
+    ):
+        """Initialize renderer pool.
+        
+        Args:
+            headless: Whether to run browser in headless mode
+            viewport: Default viewport dimensions {'width': 1200, 'height': 800}
+            num_contexts: Number of browser contexts kept warm
+            max_pages_per_context: Pages served by a context before it is recycled
+            max_concurrent_pages: Maximum number of pages open at once
+            readiness: Readiness settings with optional 'default' and per-host 'sites' profiles
+            router: Optional request router shared by all pooled contexts
+        """
+        super().__init__(headless=headless, viewport=viewport, readiness=readiness, router=router)
+        self.num_contexts = max(1, num_contexts)
+        self.max_pages_per_context = max_pages_per_context
+        self.max_concurrent_pages = max_concurrent_pages
+        self.launches = 0
+        self.contexts_recycled = 0
+        self._slots: List[_ContextSlot] = []
+        self._page_slots: Dict[Page, _ContextSlot] = {}
+        self._next_slot = 0
+        self._page_limit: Optional[asyncio.Semaphore] = None
+        self._lock: Optional[asyncio.Lock] = None
+    
+    async def start(self):
+        """Launch Chromium and warm up the context pool."""
+        self._page_limit = asyncio.Semaphore(self.max_concurrent_pages)
+        self._lock = asyncio.Lock()
+        try:
+            await self._launch()
+        except Exception as e:
+            logger.error(f"Failed to start screenshot renderer pool: {e}")
+            raise
+    
+    async def _launch(self):
+        """(Re)launch Chromium and create a fresh set of contexts."""
+        if self.playwright is None:
+            self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(headless=self.headless)
+        self._slots = [_ContextSlot(await self._new_context()) for _ in range(self.num_contexts)]
+        self._page_slots.clear()
+        self.context = self._slots[0].context
+        self.launches += 1
+        logger.info(f"Screenshot renderer pool started with {self.num_contexts} contexts")
+    
+    async def _ensure_healthy(self):
+        """Relaunch Chromium if the browser process has gone away."""
+        if self.browser is None or not self.browser.is_connected():
+            logger.warning("Pooled Chromium is disconnected, relaunching")
+            await self._launch()
+    
+    async def _recycle(self, slot: _ContextSlot) -> _ContextSlot:
+        """Replace a worn-out context, closing it once its pages are done."""
+        fresh = _ContextSlot(await self._new_context())
+        self._slots[self._slots.index(slot)] = fresh
+        slot.retired = True
+        if slot.active_pages == 0:
+            await self._close_context(slot)
+        self.contexts_recycled += 1
+        logger.debug(f"Recycled browser context after {slot.pages_served} pages")
+        return fresh
+    
+    async def _close_context(self, slot: _ContextSlot):
+        """Close a pooled context, ignoring errors from a dead browser."""
+        try:
+            await slot.context.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled context: {e}")
+    
+    async def _open_page(self) -> Page:
+        """Open a page on the next pooled context, waiting for a free page slot."""
+        if self._page_limit is None:
+            raise RuntimeError("Renderer pool not started. Call start() first.")
+        
+        await self._page_limit.acquire()
+        slot = None
+        try:
+            async with self._lock:
+                await self._ensure_healthy()
+                slot = self._slots[self._next_slot % len(self._slots)]
+                self._next_slot += 1
+                if slot.pages_served >= self.max_pages_per_context:
+                    slot = await self._recycle(slot)
+                slot.pages_served += 1
+                slot.active_pages += 1
+            page = await slot.context.new_page()
+        except Exception:
+            if slot is not None:
+                slot.active_pages -= 1
+            self._page_limit.release()
+            raise
+        
+        self._page_slots[page] = slot
+        return page
+    
+    async def _close_page(self, page: Page):
+        """Close a page and return its slot to the pool."""
+        slot = self._page_slots.pop(page, None)
+        try:
             await page.close()
+        except Exception as e:
+            logger.debug(f"Error closing pooled page: {e}")
+        finally:
+            if slot is not None:
+                slot.active_pages -= 1
+                if slot.retired and slot.active_pages == 0:
+                    await self._close_context(slot)
+            self._page_limit.release()
+    
+    async def stop(self):
+        """Close all pooled contexts and the browser."""
+        for slot in self._slots:
+            await self._close_context(slot)
+        self._slots = []
+        self.context = None
+        await super().stop()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get pool statistics.
+        
+        Returns:
+            Dictionary with launch, recycling and per-context page counters
+        """
+        return {
+            'launches': self.launches,
+            'contexts_recycled': self.contexts_recycled,
+            'open_pages': len(self._page_slots),
+            'pages_served': [slot.pages_served for slot in self._slots],
+            'requests': self.router.stats() if self.router else {}
+        }
+
+
+# Shared renderer pools, one per headless setting, living on a background loop
+_pool_loop: Optional[BackgroundLoop] = None
+_pools: Dict[bool, ScreenshotRendererPool] = {}
+_pool_lock = threading.Lock()
+
+
+def get_renderer_pool(headless: bool = True, config: Optional[Config] = None) -> ScreenshotRendererPool:
+    """Get or start the shared renderer pool.
+    
+    Args:
+        headless: Whether the pooled browser runs headless
+        config: Optional configuration instance with pool settings
+        
+    Returns:
+        Started ScreenshotRendererPool
+    """
+    global _pool_loop
+    with _pool_lock:
+        pool = _pools.get(headless)
+        if pool is None:
+            config = config or Config()
+            if _pool_loop is None:
+                _pool_loop = BackgroundLoop(name="epollo-renderer")
+                atexit.register(shutdown_renderer_pools)
+            pool = ScreenshotRendererPool(
+                headless=headless,
+                num_contexts=config.screenshot_pool_contexts,
+                max_pages_per_context=config.screenshot_max_pages_per_context,
+                max_concurrent_pages=config.screenshot_max_concurrent_pages,
+                readiness=config.screenshot_readiness,
+                router=RequestRouter.from_config(config)
+            )
+            _pool_loop.run(pool.start())
+            _pools[headless] = pool
+        return pool
+
+
+def run_on_renderer_pool(coro) -> Any:
+    """Run a coroutine that uses a shared renderer pool on the pool's loop.
+    
+    Args:
+        coro: Coroutine to run
+        
+    Returns:
+        The coroutine's result
+    """
+    return _pool_loop.run(coro)
+
+
+def shutdown_renderer_pools():
+    """Stop all shared renderer pools and their event loop."""
+    global _pool_loop
+    with _pool_lock:
+        for pool in _pools.values():
+            try:
+                _pool_loop.run(pool.stop(), timeout=30)
+            except Exception as e:
+                logger.error(f"Error stopping renderer pool: {e}")
+        _pools.clear()
+        if _pool_loop is not None:
+            _pool_loop.stop()
+            _pool_loop = None
+
+
+def _run_render(render, width: int, height: int, headless: bool):
+    """Run a render coroutine function on the shared pool or a one-off renderer.
+    
+    Args:
+        render: Async function taking a renderer and returning its result
+        width: Viewport width for a one-off renderer
+        height: Viewport height for a one-off renderer
+        headless: Whether to run browser in headless mode
+        
+    Returns:
+        The render function's result
+    """
+    config = Config()
+    if config.screenshot_persistent_pool:
+        pool = get_renderer_pool(headless=headless, config=config)
+        return run_on_renderer_pool(render(pool))
+    
+    async def _render_once():
+        viewport = {'width': width, 'height': height}
+        async with ScreenshotRenderer(
+            headless=headless,
+            viewport=viewport,
+            readiness=config.screenshot_readiness,
+            router=RequestRouter.from_config(config)
+        ) as renderer:
+            return await render(renderer)
+    
+    return asyncio.run(_render_once())
 
 
 def render_html_to_screenshot_sync(
@@ -317,20 +705,18 @@ def render_html_to_screenshot_sync(
     Returns:
         Screenshot as bytes
     """
-    async def _render():
-        viewport = {'width': width, 'height': height}
-        async with ScreenshotRenderer(headless=headless, viewport=viewport) as renderer:
-            return await renderer.render_html_to_screenshot(
-                html=html,
-                output_path=output_path,
-                width=width,
-                height=height,
-                full_page=full_page,
-                quality=quality,
-                format=format
-            )
+    async def _render(renderer):
+        return await renderer.render_html_to_screenshot(
+            html=html,
+            output_path=output_path,
+            width=width,
+            height=height,
+            full_page=full_page,
+            quality=quality,
+            format=format
+        )
     
-    return asyncio.run(_render())
+    return _run_render(_render, width, height, headless)
 
 
 def render_url_to_screenshot_sync(
@@ -342,7 +728,7 @@ def render_url_to_screenshot_sync(
     quality: int = 90,
     format: str = 'png',
     headless: bool = True,
-    wait_until: str = 'networkidle',
+    wait_until: str = 'domcontentloaded',
     timeout: int = 30000
 ) -> bytes:
     """Synchronous wrapper for URL to screenshot rendering.
@@ -362,27 +748,179 @@ def render_url_to_screenshot_sync(
     Returns:
         Screenshot as bytes
     """
-    async def _render():
-        viewport = {'width': width, 'height': height}
-        async with ScreenshotRenderer(headless=headless, viewport=viewport) as renderer:
-            return await renderer.render_url_to_screenshot(
-                url=url,
-                output_path=output_path,
-                width=width,
-                height=height,
-                full_page=full_page,
-                quality=quality,
-                format=format,
-                wait_until=wait_until,
-                timeout=timeout
-            )
+    async def _render(renderer):
+        return await renderer.render_url_to_screenshot(
+            url=url,
+            output_path=output_path,
+            width=width,
+            height=height,
+            full_page=full_page,
+            quality=quality,
+            format=format,
+            wait_until=wait_until,
+            timeout=timeout
+        )
+    
+    return _run_render(_render, width, height, headless)
+
+
+def render_batch_sync(
+    jobs: Iterable[ScreenshotJob],
+    concurrency: Optional[int] = None,
+    headless: bool = True,
+    on_result: Optional[Callable[[ScreenshotResult], None]] = None
+) -> List[ScreenshotResult]:
+    """Synchronous wrapper for batch screenshot rendering.
+    
+    Args:
+        jobs: Jobs to render
+        concurrency: Maximum pages rendered at once (defaults to config)
+        headless: Whether to run browser in headless mode
+        on_result: Optional callback invoked as each job completes
+        
+    Returns:
+        List of ScreenshotResult in completion order
+    """
+    jobs = list(jobs)
+    if concurrency is None:
+        concurrency = Config().screenshot_batch_concurrency
+    
+    async def _render(renderer):
+        results = []
+        async for result in renderer.render_batch(jobs, concurrency=concurrency):
+            if on_result:
+                on_result(result)
+            results.append(result)
+        return results
+    
+    return _run_render(_render, 1200, 800, headless)
+
+
+class ImageTile:
+    """One square tile of a tall image, encoded and ready to send to a model."""
     
-    return asyncio.run(_render())
+    def __init__(self, index: int, top: int, data: bytes, format: str):
+        """Initialize tile.
+        
+        Args:
+            index: Position of the tile, starting at 0 from the top
+            top: Y offset of the tile in the source image
+            data: Encoded image bytes
+            format: Image format of data ('png', 'jpeg', 'webp')
+        """
+        self.index = index
+        self.top = top
+        self.data = data
+        self.format = format
+
+
+def _square_tile_boxes(width: int, height: int, overlap: float) -> List[Tuple[int, int, int, int]]:
+    """Compute crop boxes of overlapping square tiles covering a tall image.
+    
+    Args:
+        width: Image width, which is also the tile size
+        height: Image height (must be greater than width)
+        overlap: Overlap ratio between tiles (0.0 to 1.0)
+        
+    Returns:
+        List of (left, top, right, bottom) boxes from top to bottom
+    """
+    if height <= width:
+        raise ValueError("Image must be vertically rectangular (height > width)")
+    
+    tile_size = width
+    stride = int(tile_size * (1 - overlap))
+    num_tiles = (height - tile_size) // stride + 1 if stride > 0 else height // tile_size
+    
+    boxes = []
+    for i in range(num_tiles):
+        top = i * stride
+        boxes.append((0, top, width, min(top + tile_size, height)))
+    
+    # Cover the bottom edge with a tile aligned to it
+    if boxes and (num_tiles - 1) * stride + tile_size < height:
+        boxes.append((0, height - tile_size, width, height))
+    
+    return boxes
+
+
+def iter_square_tiles(
+    image: Union[str, Path, bytes, Image.Image],
+    overlap: float = 0.5,
+    format: str = 'png',
+    quality: int = 85,
+    debug_dir: Optional[str] = None,
+    screener: Optional[TileScreener] = None
+) -> Iterator[ImageTile]:
+    """Split a tall image into overlapping square tiles entirely in memory.
+    
+    The image is decoded once and each tile is encoded straight to bytes,
+    which the VLM and OCR clients accept as-is, so no tile touches the disk.
+    
+    Args:
+        image: Screenshot bytes, PIL Image, or path to the image (height > width)
+        overlap: Overlap ratio between tiles (0.0 to 1.0)
+        format: Tile encoding ('png', 'jpeg', 'webp'); JPEG and WebP are much
+            smaller and faster to encode than PNG
+        quality: Quality (1-100) for JPEG and WebP
+        debug_dir: Optional directory to also write each tile to, for inspection
+        screener: Optional TileScreener; blank and duplicate tiles are skipped
+            before they are encoded
+        
+    Yields:
+        ImageTile objects from top to bottom
+    """
+    if isinstance(image, bytes):
+        img = Image.open(io.BytesIO(image))
+    elif isinstance(image, (str, Path)):
+        img = Image.open(image)
+    elif isinstance(image, Image.Image):
+        img = image
+    else:
+        raise ValueError("image must be file path, bytes, or PIL Image")
+    
+    format = format.lower()
+    if format == 'jpg':
+        format = 'jpeg'
+    if format == 'jpeg' and img.mode not in ('RGB', 'L'):
+        img = img.convert('RGB')
+    
+    save_options: Dict[str, Any] = {'quality': quality} if format in ('jpeg', 'webp') else {'compress_level': 1}
+    
+    if debug_dir is not None:
+        os.makedirs(debug_dir, exist_ok=True)
+    
+    width, height = img.size
+    boxes = _square_tile_boxes(width, height, overlap)
+    if screener is not None:
+        screener.reset()
+    
+    for index, box in enumerate(boxes):
+        tile = img.crop(box)
+        if screener is not None and not screener.accept(tile, box[1]):
+            continue
+        
+        buffer = io.BytesIO()
+        tile.save(buffer, format=format.upper(), **save_options)
+        data = buffer.getvalue()
+        
+        if debug_dir is not None:
+            with open(os.path.join(debug_dir, f"tile_{index + 1}.{format}"), 'wb') as f:
+                f.write(data)
+        
+        yield ImageTile(index=index, top=box[1], data=data, format=format)
+    
+    if screener is not None:
+        stats = screener.stats()
+        logger.info(f"Tile screening kept {stats['kept']} of {len(boxes)} tiles ({stats['saved_calls']} model calls saved)")
 
 
 def crop_to_square_tiles(image_path: str, output_dir: Optional[str] = None, overlap: float = 0.5) -> List[str]:
     """Crop a vertically rectangular image into overlapping square tiles that cover the entire image.
     
+    Writes every tile to disk; use iter_square_tiles to pass tiles to a
+    model without the PNG files.
+    
     Args:
         image_path: Path to the input image (height > width)
         output_dir: Directory to save tile images. Defaults to same directory as input.
@@ -393,13 +931,8 @@ def crop_to_square_tiles(image_path: str, output_dir: Optional[str] = None, over
     """
     img = Image.open(image_path)
     width, height = img.size
-    
-    if height <= width:
-        raise ValueError("Image must be vertically rectangular (height > width)")
-    
+    boxes = _square_tile_boxes(width, height, overlap)
     tile_size = width
-    stride = int(tile_size * (1 - overlap))
-    num_tiles = (height - tile_size) // stride + 1 if stride > 0 else height // tile_size
     
     if output_dir is None:
         output_dir = str(Path(image_path).parent)
@@ -409,11 +942,8 @@ def crop_to_square_tiles(image_path: str, output_dir: Optional[str] = None, over
     base_name = Path(image_path).stem
     tile_paths = []
     
-    for i in range(num_tiles):
-        top = i * stride
-        bottom = min(top + tile_size, height)
-        
-        tile = img.crop((0, top, width, bottom))
+    for i, box in enumerate(boxes):
+        tile = img.crop(box)
         
         if tile.height < tile_size:
             padded = Image.new('RGB', (tile_size, tile_size), (255, 255, 255))
@@ -424,13 +954,4 @@ def crop_to_square_tiles(image_path: str, output_dir: Optional[str] = None, over
         tile.save(tile_path)
         tile_paths.append(tile_path)
     
-    if tile_paths:
-        last_top = (num_tiles - 1) * stride
-        if last_top + tile_size < height:
-            top = height - tile_size
-            tile = img.crop((0, top, width, height))
-            tile_path = os.path.join(output_dir, f"{base_name}_tile_{num_tiles + 1}.png")
-            tile.save(tile_path)
-            tile_paths.append(tile_path)
-    
-    return tile_paths
\ No newline at end of file
+    return tile_paths
@@ -16,7 +16,8 @@ def summarize(markdown: str) -> str:
         Cleaned news list as string
     """
     from epollo.config import Config
-    import ollama
+    from epollo import llm
+    from epollo.llm_scheduler import Priority
     
     config = Config()
     
@@ -42,9 +43,11 @@ Text:
 Output:"""
 
     try:
-        response = ollama.generate(
+        response = llm.generate(
             model=config.ollama_model,
             prompt=prompt,
+            priority=Priority.BATCH,
+            source="digest",
             options={"temperature": 0.3, "top_p": 0.9}
         )
         
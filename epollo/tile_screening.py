@@ -0,0 +1,129 @@
+"""Skip screenshot tiles that would add nothing to a VLM/OCR pass."""
+
+import io
+import logging
+from typing import Optional, Dict, Any, Iterable, Iterator
+import numpy as np
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+# Width tiles are downscaled to before measuring content; enough to see text lines
+_ANALYSIS_WIDTH = 128
+
+
+class TileScreener:
+    """Decides per tile whether it carries content not already sent to the model.
+
+    Tiles must be offered in top-to-bottom order. A tile is skipped when it is
+    blank (almost no pixel differs from the background), when the rows it adds
+    beyond the previous kept tile are blank (overlap-aware), or when it is
+    pixel-for-pixel the same as the previous kept tile. Tiles are only ever
+    compared with their kept neighbour: similar-looking content further up
+    the page (a repeated column layout) is still new text for the model.
+    """
+
+    def __init__(
+        self,
+        blank_std: float = 3.0,
+        min_content_fraction: float = 0.002,
+        max_duplicate_diff: float = 0.5
+    ):
+        """Initialize screener.
+
+        Args:
+            blank_std: Grayscale standard deviation below which a region is blank
+            min_content_fraction: Fraction of pixels that must differ from the
+                background color for a region to count as content
+            max_duplicate_diff: Mean absolute grayscale difference (0-255) to the
+                previous kept tile at or below which a tile is a duplicate
+        """
+        self.blank_std = blank_std
+        self.min_content_fraction = min_content_fraction
+        self.max_duplicate_diff = max_duplicate_diff
+        self.reset()
+
+    def reset(self):
+        """Forget kept tiles and counters, before screening another image."""
+        self._previous: Optional[np.ndarray] = None
+        self._covered_until: Optional[int] = None
+        self.counters = {'seen': 0, 'blank': 0, 'no_new_content': 0, 'duplicate': 0, 'kept': 0}
+
+    def _grayscale(self, image: Image.Image) -> np.ndarray:
+        """Downscaled grayscale pixels used for all measurements."""
+        width, height = image.size
+        if width > _ANALYSIS_WIDTH:
+            image = image.resize((_ANALYSIS_WIDTH, max(1, height * _ANALYSIS_WIDTH // width)), Image.BILINEAR)
+        return np.asarray(image.convert('L'), dtype=np.float32)
+
+    def _is_blank(self, pixels: np.ndarray) -> bool:
+        """Check if a region has no visible content."""
+        if pixels.size == 0 or pixels.std() < self.blank_std:
+            return True
+        background = np.median(pixels)
+        content = np.abs(pixels - background) > 3 * self.blank_std
+        return content.mean() < self.min_content_fraction
+
+    def _is_duplicate(self, pixels: np.ndarray) -> bool:
+        """Check if a tile matches the previous kept tile pixel for pixel."""
+        previous = self._previous
+        if previous is None or previous.shape != pixels.shape:
+            return False
+        difference = np.abs(pixels - previous)
+        changed = difference > 3 * self.blank_std
+        return difference.mean() <= self.max_duplicate_diff and changed.mean() < self.min_content_fraction
+
+    def accept(self, image: Image.Image, top: int = 0) -> bool:
+        """Decide whether a tile should be sent to the model.
+
+        Args:
+            image: Tile image
+            top: Y offset of the tile in the source image
+
+        Returns:
+            True if the tile carries new content and should be kept
+        """
+        self.counters['seen'] += 1
+        pixels = self._grayscale(image)
+
+        if self._is_blank(pixels):
+            self.counters['blank'] += 1
+            return False
+
+        # Only the rows below the last kept tile are new to the model
+        if self._covered_until is not None and self._covered_until > top:
+            new_from = (self._covered_until - top) * pixels.shape[0] // image.size[1]
+            if self._is_blank(pixels[new_from:]):
+                self.counters['no_new_content'] += 1
+                return False
+
+        if self._is_duplicate(pixels):
+            self.counters['duplicate'] += 1
+            return False
+
+        self._previous = pixels
+        self._covered_until = top + image.size[1]
+        self.counters['kept'] += 1
+        return True
+
+    def filter(self, tiles: Iterable[Any]) -> Iterator[Any]:
+        """Screen already encoded tiles (objects with data and top, like ImageTile).
+
+        Args:
+            tiles: Tiles in top-to-bottom order
+
+        Yields:
+            Tiles worth sending to the model
+        """
+        for tile in tiles:
+            if self.accept(Image.open(io.BytesIO(tile.data)), tile.top):
+                yield tile
+
+    def stats(self) -> Dict[str, Any]:
+        """Get screening counters.
+
+        Returns:
+            Dictionary with tiles seen, kept, skipped per reason and the
+            number of model calls saved
+        """
+        return dict(self.counters, saved_calls=self.counters['seen'] - self.counters['kept'])
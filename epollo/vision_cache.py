@@ -0,0 +1,91 @@
+"""Persistent cache of VLM/OCR answers keyed by image content."""
+
+import json
+import hashlib
+import logging
+import threading
+from typing import Optional, Dict, Any
+from .cache import SQLiteCache
+
+logger = logging.getLogger(__name__)
+
+
+class VisionResultCache:
+    """Content-addressed store of model answers for images.
+
+    Keys hash the encoded image together with the model, prompt and
+    generation options, so an answer is only reused for a pixel-identical
+    image asked the same question of the same model.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 64 * 1024 * 1024, ttl: Optional[float] = None):
+        """Initialize result cache.
+
+        Args:
+            path: Path to the SQLite database file
+            max_bytes: Maximum total size of stored answers before LRU eviction
+            ttl: Optional time-to-live in seconds for each answer
+        """
+        self._store = SQLiteCache(path, max_bytes=max_bytes, ttl=ttl)
+
+    def _key(self, image_b64: str, model: str, prompt: str, options: Optional[Dict[str, Any]]) -> str:
+        """Build the content-addressed key for an image query."""
+        digest = hashlib.sha256(image_b64.encode('ascii')).hexdigest()
+        material = "\x00".join([digest, model, prompt, json.dumps(options or {}, sort_keys=True)])
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def get(self, image_b64: str, model: str, prompt: str, options: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """Look up a cached answer.
+
+        Args:
+            image_b64: Base64-encoded image as sent to Ollama
+            model: Model name
+            prompt: Prompt text
+            options: Generation options
+
+        Returns:
+            Cached response text, or None on miss
+        """
+        entry = self._store.get(self._key(image_b64, model, prompt, options))
+        if entry is None:
+            return None
+        return entry[0].decode('utf-8')
+
+    def put(self, image_b64: str, model: str, prompt: str, options: Optional[Dict[str, Any]], response: str):
+        """Store an answer."""
+        self._store.put(self._key(image_b64, model, prompt, options), response.encode('utf-8'))
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics (hits, misses, hit rate, entries)."""
+        return self._store.stats()
+
+
+# Global instance shared by the OCR and VLM clients
+_vision_cache: Optional[VisionResultCache] = None
+_vision_cache_loaded = False
+_vision_cache_lock = threading.Lock()
+
+
+def get_vision_cache() -> Optional[VisionResultCache]:
+    """Get the process-wide result cache configured in config.yaml.
+
+    Returns:
+        VisionResultCache instance, or None if caching is disabled or the
+        database cannot be opened
+    """
+    global _vision_cache, _vision_cache_loaded
+    with _vision_cache_lock:
+        if not _vision_cache_loaded:
+            _vision_cache_loaded = True
+            from .config import Config
+            config = Config()
+            if config.vision_cache_enabled:
+                try:
+                    _vision_cache = VisionResultCache(
+                        config.vision_cache_path,
+                        max_bytes=config.vision_cache_max_bytes,
+                        ttl=config.vision_cache_ttl
+                    )
+                except Exception as e:
+                    logger.warning(f"Could not open VLM/OCR result cache: {e}")
+        return _vision_cache
@@ -4,7 +4,10 @@ import base64
 import logging
 from typing import Optional, Union
 from pathlib import Path
-import requests
+from . import llm
+from .llm_scheduler import Priority
+from .vision_cache import get_vision_cache
+from .ollama_client import get_ollama_client
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +32,9 @@ class Qwen3VL:
         self,
         api_url: str = "http://localhost:11434",
         model: str = "qwen3-vl:2b",
-        timeout: int = 120
+        timeout: int = 120,
+        priority: Priority = Priority.BATCH,
+        use_cache: bool = True
     ):
         """Initialize Qwen3-VL client.
         
@@ -37,11 +42,16 @@ class Qwen3VL:
             api_url: Ollama API base URL
             model: Model name for Qwen3-VL
             timeout: Request timeout in seconds
+            priority: Scheduling class of VLM requests in the LLM scheduler
+            use_cache: Reuse answers for pixel-identical images from the
+                shared VLM/OCR result cache
         """
         self.api_url = api_url.rstrip('/')
         self.model = model
         self.timeout = timeout
-        self.vlm_url = f"{self.api_url}/api/generate"
+        self.priority = priority
+        self.result_cache = get_vision_cache() if use_cache else None
+        self.client = get_ollama_client(self.api_url)
     
     def _encode_image(self, image: Union[str, Path, bytes]) -> str:
         """Encode image to base64 string.
@@ -81,23 +91,31 @@ class Qwen3VL:
             The model's response text
         """
         image_b64 = self._encode_image(image)
-        
-        payload = {
-            "model": self.model,
-            "prompt": prompt,
-            "images": [image_b64],
-            "stream": False,
-            "options": {
-                "temperature": temperature,
-                "num_predict": max_tokens
-            }
+        options = {
+            "temperature": temperature,
+            "num_predict": max_tokens
         }
-        
-        response = requests.post(self.vlm_url, json=payload, timeout=self.timeout)
-        response.raise_for_status()
-        
-        result = response.json()
-        return result.get("response", "")
+        if self.result_cache is not None:
+            cached = self.result_cache.get(image_b64, self.model, prompt, options)
+            if cached is not None:
+                logger.info("Reused cached VLM result")
+                return cached
+        
+        result = llm.generate(
+            self.model,
+            prompt,
+            client=self.client,
+            priority=self.priority,
+            source="vlm",
+            images=[image_b64],
+            options=options,
+            timeout=self.timeout
+        )
+        
+        text = result.get("response", "")
+        if self.result_cache is not None and text:
+            self.result_cache.put(image_b64, self.model, prompt, options, text)
+        return text
     
     def extract_headlines(self, image: Union[str, Path, bytes]) -> str:
         """Extract news headlines from an image.
@@ -118,11 +136,7 @@ class Qwen3VL:
             True if connection successful, False otherwise
         """
         try:
-            response = requests.get(f"{self.api_url}/api/tags", timeout=10)
-            response.raise_for_status()
-            
-            models = response.json().get('models', [])
-            model_names = [model.get('name', '') for model in models]
+            model_names = self.client.list_models()
             
             available = any(self.model.lower() in name.lower() for name in model_names)
             
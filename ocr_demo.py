@@ -25,7 +25,8 @@ def demo_ocr_from_file(image_path: str, output_format: str = "plain", auto_crop:
         ocr = DeepSeekOCR(
             api_url=config.ocr_api_url,
             model=config.ocr_model,
-            timeout=config.ocr_timeout
+            timeout=config.ocr_timeout,
+            max_workers=config.ocr_max_parallel
         )
         
         if not ocr.check_connection():
@@ -78,7 +79,8 @@ def demo_ocr_from_bytes(image_bytes: bytes, output_format: str = "plain", auto_c
         ocr = DeepSeekOCR(
             api_url=config.ocr_api_url,
             model=config.ocr_model,
-            timeout=config.ocr_timeout
+            timeout=config.ocr_timeout,
+            max_workers=config.ocr_max_parallel
         )
         
         if not ocr.check_connection():
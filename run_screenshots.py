@@ -6,6 +6,7 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent))
 
 from epollo.browser import take_url_screenshot
+from epollo.screenshot import ScreenshotJob, render_batch_sync
 
 URLS = [
     "https://example.com",
@@ -17,7 +18,21 @@ OUTPUT_DIR.mkdir(exist_ok=True)
 
 date_prefix = datetime.now().strftime("%Y%m%d")
 
+jobs = []
 for i, url in enumerate(URLS):
     output_path = OUTPUT_DIR / f"{date_prefix}_screenshot_{i}_{url.replace('https://', '').replace('/', '_')}.png"
-    take_url_screenshot(url, output_path=str(output_path))
-    print(f"Saved: {output_path}")
+    jobs.append(ScreenshotJob(url=url, output_path=str(output_path)))
+
+
+def report(result):
+    if result.ok:
+        print(f"Saved: {result.job.output_path}")
+
+
+results = render_batch_sync(jobs, on_result=report)
+
+# Retry failures one by one with the fetch-and-render fallback
+for result in results:
+    if not result.ok:
+        take_url_screenshot(result.job.url, output_path=result.job.output_path)
+        print(f"Saved: {result.job.output_path}")